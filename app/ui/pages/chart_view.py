@@ -0,0 +1,89 @@
+from PyQt5 import QtWidgets, QtCore, QtGui
+from app.utils.chart_renderer import ChartRenderer
+
+class ChartView(QtWidgets.QWidget):
+    """Widget showing a chart rendered in the background by ChartRenderer
+
+    The last image stays on screen, scaled to fit, until a render for new data
+    or a new size replaces it.
+    """
+
+    # Wait for resizing to settle before rendering at the new size
+    RESIZE_DELAY_MS = 150
+
+    def __init__(self, chart, parent=None):
+        super(ChartView, self).__init__(parent)
+        self.chart = chart
+        self.data = None
+        self.version = None
+        self.image = None
+        self.render_task = None
+
+        self.setMinimumSize(200, 150)
+        self.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+
+        self.resize_timer = QtCore.QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(self.RESIZE_DELAY_MS)
+        self.resize_timer.timeout.connect(self.request_render)
+
+    def set_data(self, data, version):
+        """Show new chart data
+
+        Args:
+            data: Rows the chart draws
+            version: Hashable version of the data; equal versions are drawn once per size
+        """
+        self.data = data
+        self.version = version
+        self.request_render()
+
+    def request_render(self):
+        """Show the cached image for the current data and size, or render it in the background"""
+        if self.data is None or not self.isVisible():
+            return
+
+        key = ChartRenderer.key(self.chart, self.version, self.width(), self.height(), self.devicePixelRatioF())
+
+        # Drop a render still in flight so a stale image never lands last
+        if self.render_task:
+            self.render_task.cancel()
+            self.render_task = None
+
+        image = ChartRenderer.cached(key)
+        if image is not None:
+            self.show_image(image)
+            return
+
+        self.render_task = ChartRenderer.submit(
+            self.chart, self.data, key,
+            on_result=self.show_image,
+            on_error=self.show_render_error
+        )
+
+    def show_image(self, image):
+        """Display a rendered chart image"""
+        self.render_task = None
+        self.image = image
+        self.update()
+
+    def show_render_error(self, message):
+        """Report a failed render; the last image stays on screen"""
+        self.render_task = None
+        print(f"Error rendering chart: {message}")
+
+    def showEvent(self, event):
+        super(ChartView, self).showEvent(event)
+        self.request_render()
+
+    def resizeEvent(self, event):
+        super(ChartView, self).resizeEvent(event)
+        self.resize_timer.start()
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), QtGui.QColor(self.chart.FACE_COLOR))
+        if self.image is not None:
+            painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+            painter.drawImage(QtCore.QRectF(self.rect()), self.image)
+        painter.end()
@@ -1 +1,3 @@
-from .transaction_filter_dialog import TransactionFilterDialog
\ No newline at end of file
+from .transaction_filter_dialog import TransactionFilterDialog
+from .customer_history_dialog import CustomerHistoryDialog
+from .receipt_export_dialog import ReceiptExportDialog
\ No newline at end of file
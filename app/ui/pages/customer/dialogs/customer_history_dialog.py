@@ -0,0 +1,60 @@
+from PyQt5 import QtWidgets, QtCore
+from app.ui.pages.inventory.dialogs.base_dialog import BaseDialog
+
+class CustomerHistoryDialog(BaseDialog):
+    """Dialog showing a returning customer's lifetime profile and recent visits"""
+
+    def __init__(self, parent=None, customer=None, recent_visits=None):
+        super(CustomerHistoryDialog, self).__init__(parent, None, "Customer History")
+        self.customer = customer
+        self.recent_visits = recent_visits or []
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        self.setup_base_ui(560)
+
+        customer = self.customer
+        self.header_label.setText(f"Customer History - {customer.customer_name}")
+
+        self.add_row("Phone:", customer.customer_phone)
+        self.add_row("Gender:", customer.customer_gender or "-")
+        self.add_row("City:", customer.customer_city or "-")
+        self.add_row("Visits:", str(customer.visit_count))
+        self.add_row("Lifetime Spend:", f"₱{customer.lifetime_spend:,.2f}")
+        self.add_row("First Visit:", customer.first_visit.strftime('%Y-%m-%d %H:%M'))
+        self.add_row("Last Visit:", customer.last_visit.strftime('%Y-%m-%d %H:%M'))
+        self.add_row("Favorite Service:", customer.favorite_service or "-")
+
+        # Most recent visits under this phone number
+        visits_table = QtWidgets.QTableWidget(len(self.recent_visits), 3)
+        visits_table.setHorizontalHeaderLabels(["Date", "Service", "Amount"])
+        visits_table.verticalHeader().setVisible(False)
+        visits_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        visits_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        visits_table.setMinimumHeight(180)
+
+        for row, visit in enumerate(self.recent_visits):
+            date = visit.transaction_date
+            visits_table.setItem(row, 0, QtWidgets.QTableWidgetItem(date.strftime('%Y-%m-%d %H:%M') if date else ""))
+            visits_table.setItem(row, 1, QtWidgets.QTableWidgetItem(visit.service_name or ""))
+            amount_item = QtWidgets.QTableWidgetItem(f"₱{visit.total_amount:,.2f}")
+            amount_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+            visits_table.setItem(row, 2, amount_item)
+
+        recent_label = QtWidgets.QLabel("Recent Visits:")
+        self.form_layout.addRow(recent_label)
+        self.form_layout.addRow(visits_table)
+
+        # Read-only view; the save button is not needed
+        self.save_button.setVisible(False)
+        cancel_button = self.findChild(QtWidgets.QPushButton, "cancelBtn")
+        if cancel_button:
+            cancel_button.setText("Close")
+
+    def add_row(self, label, value):
+        """Add a label and read-only value to the form"""
+        value_label = QtWidgets.QLabel(value)
+        value_label.setStyleSheet("color: white;")
+        value_label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        self.form_layout.addRow(QtWidgets.QLabel(label), value_label)
@@ -0,0 +1,88 @@
+from PyQt5 import QtWidgets, QtCore
+from app.ui.pages.inventory.dialogs.base_dialog import BaseDialog
+
+class ReceiptExportDialog(BaseDialog):
+    """Dialog for choosing which receipts to export to PDF and how"""
+
+    OUTPUT_OPTIONS = ["One PDF per receipt", "Single combined PDF"]
+
+    def __init__(self, parent=None, selected_count=0):
+        super(ReceiptExportDialog, self).__init__(parent, None, "Export Receipts")
+        self.selected_count = selected_count
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        self.setup_base_ui(420)
+
+        self.header_label.setText("Export Receipts")
+
+        # Which receipts
+        self.selection_radio = QtWidgets.QRadioButton(f"Selected transactions ({self.selected_count})")
+        self.selection_radio.setEnabled(self.selected_count > 0)
+        self.date_range_radio = QtWidgets.QRadioButton("Date range")
+
+        if self.selected_count:
+            self.selection_radio.setChecked(True)
+        else:
+            self.date_range_radio.setChecked(True)
+
+        scope_container = QtWidgets.QWidget()
+        scope_layout = QtWidgets.QVBoxLayout(scope_container)
+        scope_layout.setContentsMargins(0, 0, 0, 0)
+        scope_layout.addWidget(self.selection_radio)
+        scope_layout.addWidget(self.date_range_radio)
+
+        self.form_layout.addRow(QtWidgets.QLabel("Receipts:"), scope_container)
+
+        # Defaults to the month so far
+        today = QtCore.QDate.currentDate()
+        self.start_date = QtWidgets.QDateEdit(QtCore.QDate(today.year(), today.month(), 1))
+        self.end_date = QtWidgets.QDateEdit(today)
+        for date_edit in (self.start_date, self.end_date):
+            date_edit.setCalendarPopup(True)
+            date_edit.setDisplayFormat("yyyy-MM-dd")
+
+        self.form_layout.addRow(QtWidgets.QLabel("From:"), self.start_date)
+        self.form_layout.addRow(QtWidgets.QLabel("To:"), self.end_date)
+
+        self.date_range_radio.toggled.connect(self.update_date_inputs)
+        self.update_date_inputs()
+
+        # How they are written
+        self.output_combo = QtWidgets.QComboBox()
+        self.output_combo.addItems(self.OUTPUT_OPTIONS)
+        self.form_layout.addRow(QtWidgets.QLabel("Output:"), self.output_combo)
+
+        helper_text = QtWidgets.QLabel(
+            "Receipts are written in the background; you can keep working while they export."
+        )
+        helper_text.setStyleSheet("color: #4FC3F7; font-style: italic; font-size: 12px;")
+        helper_text.setWordWrap(True)
+        self.form_layout.addRow(helper_text)
+
+        self.save_button.setText("Export")
+        self.save_button.clicked.connect(self.accept_options)
+
+    def update_date_inputs(self):
+        """Enable the date inputs only when exporting a date range"""
+        use_dates = self.date_range_radio.isChecked()
+        self.start_date.setEnabled(use_dates)
+        self.end_date.setEnabled(use_dates)
+
+    def accept_options(self):
+        """Validate the date range and close the dialog"""
+        if self.date_range_radio.isChecked() and self.start_date.date() > self.end_date.date():
+            QtWidgets.QMessageBox.warning(self, "Invalid Date Range", "The start date must not be after the end date.")
+            return
+
+        self.accept()
+
+    def get_options(self):
+        """Return the chosen export options after the dialog is closed"""
+        return {
+            "use_selection": self.selection_radio.isChecked(),
+            "start_date": self.start_date.date().toPyDate(),
+            "end_date": self.end_date.date().toPyDate(),
+            "combined": self.output_combo.currentIndex() == 1,
+        }
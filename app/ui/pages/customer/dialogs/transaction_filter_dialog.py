@@ -1,6 +1,6 @@
 from PyQt5 import QtWidgets, QtCore
 import mysql.connector
-from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 from app.ui.pages.inventory.dialogs.base_dialog import BaseDialog
 
 class TransactionFilterDialog(BaseDialog):
@@ -39,13 +39,7 @@ class TransactionFilterDialog(BaseDialog):
         self.payment_combo.addItem("All Methods")
         
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT DISTINCT payment_method FROM transactions WHERE payment_method IS NOT NULL AND payment_method != ''")
-            methods = cursor.fetchall()
-            for method in methods:
-                self.payment_combo.addItem(method['payment_method'])
-            cursor.close()
+            self.payment_combo.addItems(ReferenceCache.get("payment_methods"))
         except mysql.connector.Error:
             self.payment_combo.addItem("Cash")
         
@@ -60,14 +54,9 @@ class TransactionFilterDialog(BaseDialog):
         self.gender_combo.addItem("All")
         
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT DISTINCT customer_gender FROM transactions WHERE customer_gender IS NOT NULL AND customer_gender != ''")
-            genders = cursor.fetchall()
-            for gender in genders:
-                if gender['customer_gender'] not in ["All"]:  # Avoid duplicates
-                    self.gender_combo.addItem(gender['customer_gender'])
-            cursor.close()
+            for gender in ReferenceCache.get("customer_genders"):
+                if gender not in ["All"]:  # Avoid duplicates
+                    self.gender_combo.addItem(gender)
         except mysql.connector.Error:
             self.gender_combo.addItems(["Male", "Female", "Other"])
         
@@ -45,4 +45,41 @@ class TableFactory:
         # Set column widths based on percentages
         for idx, (_, width_pct) in enumerate(column_data):
             width = int(table_width * width_pct)
-            table.setColumnWidth(idx, width)
\ No newline at end of file
+            table.setColumnWidth(idx, width)
+    
+    @staticmethod
+    def create_table_view(model):
+        """Create a table view over a model, styled like create_table()
+        
+        Args:
+            model: QAbstractTableModel the view displays
+        """
+        view = QtWidgets.QTableView()
+        view.setModel(model)
+        view.setStyleSheet(StyleFactory.get_table_style())
+        view.setSelectionBehavior(QtWidgets.QTableView.SelectRows)
+        view.setEditTriggers(QtWidgets.QTableView.NoEditTriggers)
+        view.setAlternatingRowColors(False)
+        view.verticalHeader().setVisible(False)
+        view.setShowGrid(True)
+        
+        # Make columns and rows not resizable
+        view.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        view.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        view.horizontalHeader().setStretchLastSection(True)
+        
+        return view
+    
+    @staticmethod
+    def configure_view_columns(view, column_widths, screen_width):
+        """Set column widths on a table view; headers come from its model
+        
+        Args:
+            view: QTableView to configure
+            column_widths: List of width percentages, one per column
+            screen_width: Total screen width to calculate from
+        """
+        table_width = screen_width - 80  # Adjust for better fit
+        
+        for idx, width_pct in enumerate(column_widths):
+            view.setColumnWidth(idx, int(table_width * width_pct))
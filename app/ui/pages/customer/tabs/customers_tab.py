@@ -1,18 +1,42 @@
 from PyQt5 import QtWidgets, QtCore, QtGui, QtPrintSupport
 import mysql.connector
-from app.utils.db_manager import DBManager
-from datetime import datetime
+import os
 from ..table_factory import TableFactory
+from ..transaction_table_model import TransactionTableModel
 from ..style_factory import StyleFactory
 from ..control_panel_factory import ControlPanelFactory
-from ..dialogs import TransactionFilterDialog
+from ..dialogs import TransactionFilterDialog, CustomerHistoryDialog, ReceiptExportDialog
+from app.utils.customer_updater import CustomerUpdater
+from app.utils.query_runner import QueryRunner
+from app.utils.receipt_export import ReceiptExport
+from app.utils.transaction_detail_cache import TransactionDetailCache
+from app.utils.repositories import CustomerRepository, ReceiptRepository, TransactionRepository
+from app.utils.event_bus import EventBus, TransactionCreated
 
 class CustomersTab(QtWidgets.QWidget):
     """Tab for displaying customer transaction history"""
     
+    # Milliseconds of typing pause before the search query runs
+    SEARCH_DELAY_MS = 300
+    
+    # Visits listed in the customer history dialog
+    RECENT_VISITS = 10
+    
+    # Rows above and below the current one whose details are prefetched
+    PREFETCH_ROWS = 3
+    
     def __init__(self, parent=None):
         super(CustomersTab, self).__init__()
         self.parent = parent
+        self.load_task = None
+        
+        # Bulk receipt export in progress: the loading query, then the export itself
+        self.export_task = None
+        self.receipt_export = None
+        self.export_progress = None
+        
+        # Set when applying filters, so an empty result can be reported once it arrives
+        self.report_no_results = False
         self.filter_state = {
             "is_active": False,
             "date_range": "All Time",
@@ -21,6 +45,9 @@ class CustomersTab(QtWidgets.QWidget):
         }
         self.setup_ui()
         self.load_transactions()
+        
+        # Pick up sales saved from the invoice page
+        EventBus.subscribe(TransactionCreated, lambda event: CustomerUpdater.refresh_customers_table(self, event.transaction_ids), widget=self)
     
     def setup_ui(self):
         """Set up the UI components for the customers tab"""
@@ -30,6 +57,12 @@ class CustomersTab(QtWidgets.QWidget):
         
         self.search_input = QtWidgets.QLineEdit()
         
+        # Search runs in the database once typing pauses, not on every keystroke
+        self.search_timer = QtCore.QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.run_search)
+        
         self.control_layout = ControlPanelFactory.create_search_control(
             self.search_input,
             self.filter_transactions,
@@ -40,31 +73,45 @@ class CustomersTab(QtWidgets.QWidget):
         self.filter_button = self.control_layout.filter_button
         self.filter_indicator = self.control_layout.filter_indicator
         
+        # Bulk PDF export of the selected or date range receipts
+        self.export_button = QtWidgets.QPushButton("Export Receipts")
+        self.export_button.setCursor(QtCore.Qt.PointingHandCursor)
+        self.export_button.setMinimumHeight(36)
+        self.export_button.setStyleSheet(StyleFactory.get_button_style(secondary=True))
+        self.export_button.clicked.connect(self.show_receipt_export_dialog)
+        self.control_layout.addWidget(self.export_button)
+        
         self.layout.addLayout(self.control_layout)
         
-        self.customers_table = TableFactory.create_table()
-        
-        customer_columns = [
-            ("Transaction ID", 0.10), 
-            ("OR Number", 0.08),
-            ("Customer Name", 0.08),
-            ("Phone", 0.07),
-            ("Gender", 0.05),
-            ("City", 0.08),
-            ("Service", 0.10),
-            ("Amount", 0.05),
-            ("Payment Method", 0.08),
-            ("Discount", 0.05),
-            ("Date", 0.09),
-            ("Staff", 0.05)
-        ]
+        # Transactions are paged in from the database as the table scrolls
+        self.transactions_model = TransactionTableModel(self)
+        self.transactions_model.pageLoaded.connect(self.on_page_loaded)
+        self.transactions_model.loadFailed.connect(self.show_load_error)
+        self.transactions_model.totalsLoaded.connect(self.show_totals)
+        
+        self.customers_table = TableFactory.create_table_view(self.transactions_model)
+        
+        # Width percentages, in the model's column order
+        column_widths = [0.10, 0.08, 0.08, 0.07, 0.05, 0.08, 0.10, 0.05, 0.08, 0.05, 0.09, 0.05]
         
         screen_width = QtWidgets.QApplication.desktop().screenGeometry().width()
-        TableFactory.configure_table_columns(self.customers_table, customer_columns, screen_width)
+        TableFactory.configure_view_columns(self.customers_table, column_widths, screen_width)
+        
+        # Newest first, matching the model's initial order; header clicks re-sort in SQL
+        self.customers_table.horizontalHeader().setSortIndicator(
+            self.transactions_model.fields.index("transaction_date"), QtCore.Qt.DescendingOrder
+        )
+        self.customers_table.setSortingEnabled(True)
+        
+        # Columns the database cannot sort keep the indicator where it was
+        self.customers_table.horizontalHeader().sortIndicatorChanged.connect(self.keep_sort_indicator)
         
         self.customers_table.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.customers_table.customContextMenuRequested.connect(self.show_context_menu)
         
+        # Have the details of the rows around the current one ready before they are opened
+        self.customers_table.selectionModel().currentRowChanged.connect(self.prefetch_details)
+        
         self.layout.addWidget(self.customers_table)
         
         self.filter_indicator = QtWidgets.QLabel()
@@ -78,128 +125,73 @@ class CustomersTab(QtWidgets.QWidget):
         """)
         
         self.layout.addWidget(self.filter_indicator)
+        
+        # Count and total of every transaction matching the search and filters
+        self.totals_label = QtWidgets.QLabel()
+        self.totals_label.setVisible(False)
+        self.totals_label.setStyleSheet("color: #cccccc; padding-top: 5px;")
+        self.layout.addWidget(self.totals_label)
     
     def load_transactions(self):
-        """Load customer transactions from the database and populate the table"""
-        try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            
-            # Clear existing items
-            self.customers_table.clearContents()
-            self.customers_table.setRowCount(0)
-            
-            # Reset search filter
-            self.search_input.blockSignals(True)
-            self.search_input.clear()
-            self.search_input.blockSignals(False)
-            
-            # Join with users table to get staff name
-            cursor.execute("""
-                SELECT t.*, u.username as staff_name, s.service_name 
-                FROM transactions t
-                LEFT JOIN users u ON t.created_by = u.user_id
-                LEFT JOIN services s ON t.service_id = s.service_id
-                ORDER BY t.transaction_date DESC
-            """)
-            transactions = cursor.fetchall()
-            
-            # Populate the table
-            self.customers_table.setRowCount(len(transactions))
-            
-            for row, transaction in enumerate(transactions):
-                # Transaction ID
-                id_item = QtWidgets.QTableWidgetItem(str(transaction.get('transaction_id', '')))
-                id_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                self.customers_table.setItem(row, 0, id_item)
-                
-                # OR Number
-                or_item = QtWidgets.QTableWidgetItem(str(transaction.get('or_number', '')))
-                or_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                self.customers_table.setItem(row, 1, or_item)
-                
-                # Customer name
-                self.customers_table.setItem(row, 2, QtWidgets.QTableWidgetItem(transaction.get('customer_name', '')))
-                
-                # Phone
-                phone_item = QtWidgets.QTableWidgetItem(transaction.get('customer_phone', ''))
-                phone_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                self.customers_table.setItem(row, 3, phone_item)
-                
-                # Gender
-                gender_item = QtWidgets.QTableWidgetItem(transaction.get('customer_gender', ''))
-                gender_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                self.customers_table.setItem(row, 4, gender_item)
-                
-                # City
-                self.customers_table.setItem(row, 5, QtWidgets.QTableWidgetItem(transaction.get('customer_city', '')))
-                
-                # Service
-                self.customers_table.setItem(row, 6, QtWidgets.QTableWidgetItem(transaction.get('service_name', '')))
-                
-                # Amount with proper formatting
-                total = float(transaction.get('total_amount', 0))
-                amount_item = QtWidgets.QTableWidgetItem(f"₱{total:.2f}")
-                amount_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-                
-                # Color code based on amount
-                if total > 1000:
-                    amount_item.setForeground(QtGui.QColor("#4CAF50"))  # Green for high value
-                
-                self.customers_table.setItem(row, 7, amount_item)
-                
-                # Payment Method
-                payment_item = QtWidgets.QTableWidgetItem(transaction.get('payment_method', ''))
-                payment_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                self.customers_table.setItem(row, 8, payment_item)
-                
-                # Discount
-                discount = float(transaction.get('discount_percentage', 0))
-                discount_item = QtWidgets.QTableWidgetItem(f"{discount:.0f}%")
-                discount_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                
-                if discount > 0:
-                    discount_item.setForeground(QtGui.QColor("#FF9800"))  # Orange for discount
-                
-                self.customers_table.setItem(row, 9, discount_item)
-                
-                # Date
-                date = transaction.get('transaction_date')
-                date_str = date.strftime('%Y-%m-%d %H:%M') if date else ""
-                date_item = QtWidgets.QTableWidgetItem(date_str)
-                date_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                self.customers_table.setItem(row, 10, date_item)
-                
-                # Staff
-                self.customers_table.setItem(row, 11, QtWidgets.QTableWidgetItem(transaction.get('staff_name', '')))
-            
-            cursor.close()
-            
-            # Re-apply any active filters after loading data
-            if self.filter_state["is_active"]:
-                self.apply_stored_filters()
-                
-        except mysql.connector.Error as err:
-            if self.parent:
-                self.parent.show_error_message(f"Database error: {err}")
-            else:
-                QtWidgets.QMessageBox.critical(self, "Error", f"Database error: {err}")
+        """Load the first page of customer transactions in the background"""
+        # Reset search filter
+        self.search_timer.stop()
+        self.search_input.blockSignals(True)
+        self.search_input.clear()
+        self.search_input.blockSignals(False)
+        
+        self.load_task = self.transactions_model.set_search("")
+    
+    def reload_transactions(self):
+        """Reload the table from the first page, keeping the search and filters"""
+        self.load_task = self.transactions_model.reload()
+    
+    def load_new_transactions(self, transaction_ids=None):
+        """Insert transactions saved since the table was loaded at the top"""
+        task = self.transactions_model.fetch_newer(transaction_ids)
+        if task:
+            self.load_task = task
+    
+    def on_page_loaded(self, count):
+        """Finish a background load"""
+        self.load_task = None
+        
+        # Show a message if no results are found
+        if self.report_no_results:
+            self.report_no_results = False
+            if self.transactions_model.rowCount() == 0:
+                QtWidgets.QMessageBox.information(self, "No Results", 
+                    "No transactions match the current filters. Try adjusting your filter criteria.")
+    
+    def show_totals(self, totals):
+        """Show the count and amount of the matching transactions"""
+        if totals is None:
+            self.totals_label.setVisible(False)
+            return
+        
+        count, total_amount = totals
+        self.totals_label.setText(f"{count:,} matching transactions · ₱{total_amount:,.2f} total")
+        self.totals_label.setVisible(True)
+    
+    def show_load_error(self, message):
+        """Report a failed background load"""
+        self.load_task = None
+        if self.parent:
+            self.parent.show_error_message(f"Database error: {message}")
+        else:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Database error: {message}")
     
     def filter_transactions(self):
-        """Filter transactions based on search input"""
-        search_text = self.search_input.text().lower()
+        """Restart the search delay after the search input changes"""
+        self.search_timer.start()
+    
+    def run_search(self):
+        """Reload the table with the transactions matching the search input
         
-        for row in range(self.customers_table.rowCount()):
-            visible = False
-            
-            # Search across all columns
-            for col in range(self.customers_table.columnCount()):
-                item = self.customers_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    visible = True
-                    break
-                    
-            self.customers_table.setRowHidden(row, not visible)
+        Customer name, phone, OR number and transaction ID are matched by
+        prefix in the database; the current rows stay until the results arrive.
+        """
+        self.load_task = self.transactions_model.set_search(self.search_input.text())
     
     def show_transaction_filter_dialog(self):
         """Show advanced filter dialog for transactions"""
@@ -252,8 +244,7 @@ class CustomersTab(QtWidgets.QWidget):
         }
         
         # Show all rows
-        for row in range(self.customers_table.rowCount()):
-            self.customers_table.setRowHidden(row, False)
+        self.load_task = self.transactions_model.set_filters(self.filter_state)
         
         # Hide filter indicator
         self.filter_indicator.setVisible(False)
@@ -265,104 +256,188 @@ class CustomersTab(QtWidgets.QWidget):
             dialog.accept()
     
     def apply_stored_filters(self):
-        """Apply the filters stored in filter_state"""
+        """Reload the table with only the transactions matching filter_state
+        
+        The filters are compiled to SQL, so only matching rows are fetched.
+        """
         if not self.filter_state["is_active"]:
             return
-            
-        # Get current date for date range comparisons
-        current_date = datetime.now()
-        
-        # Track if any row is visible
-        rows_visible = False
         
-        for row in range(self.customers_table.rowCount()):
-            visible = True
-            
-            # Apply date range filter
-            if self.filter_state["date_range"] != "All Time":
-                date_item = self.customers_table.item(row, 10)
-                if date_item and date_item.text():
-                    try:
-                        transaction_date = datetime.strptime(date_item.text().split()[0], '%Y-%m-%d')
-                        
-                        if self.filter_state["date_range"] == "Today":
-                            if transaction_date.date() != current_date.date():
-                                visible = False
-                        elif self.filter_state["date_range"] == "This Week":
-                            # Calculate days since the start of the week
-                            days_since = (current_date.date() - transaction_date.date()).days
-                            if days_since < 0 or days_since >= 7:
-                                visible = False
-                        elif self.filter_state["date_range"] == "This Month":
-                            if (transaction_date.year != current_date.year or 
-                                transaction_date.month != current_date.month):
-                                visible = False
-                        elif self.filter_state["date_range"] == "This Year":
-                            if transaction_date.year != current_date.year:
-                                visible = False
-                    except ValueError:
-                        # If date parsing fails, keep the row visible
-                        pass
-            
-            # Apply payment method filter
-            if visible and self.filter_state["payment_method"] != "All Methods":
-                payment_item = self.customers_table.item(row, 8)
-                if payment_item and payment_item.text() != self.filter_state["payment_method"]:
-                    visible = False
-            
-            # Apply gender filter
-            if visible and self.filter_state["gender"] != "All":
-                gender_item = self.customers_table.item(row, 4)
-                if gender_item and gender_item.text() != self.filter_state["gender"]:
-                    visible = False
-            
-            # Set row visibility
-            self.customers_table.setRowHidden(row, not visible)
-            
-            # Track if at least one row is visible
-            if visible:
-                rows_visible = True
-        
-        # Show a message if no results are found
-        if not rows_visible and self.customers_table.rowCount() > 0:
-            QtWidgets.QMessageBox.information(self, "No Results", 
-                "No transactions match the current filters. Try adjusting your filter criteria.")
+        self.report_no_results = True
+        self.load_task = self.transactions_model.set_filters(self.filter_state)
     
     def show_context_menu(self, position):
         """Show context menu for the table"""
-        item = self.customers_table.itemAt(position)
-        if item is None:
+        index = self.customers_table.indexAt(position)
+        if not index.isValid():
             return
         
-        row = item.row()
-        transaction_id = self.customers_table.item(row, 0).text()
+        row = index.row()
         
         menu = QtWidgets.QMenu(self)
         
         view_action = menu.addAction("View Transaction Details")
         view_action.triggered.connect(lambda: self.view_transaction_details(row))
         
+        history_action = menu.addAction("View Customer History")
+        history_action.triggered.connect(lambda: self.view_customer_history(row))
+        
+        export_action = menu.addAction("Export Selected Receipts")
+        export_action.triggered.connect(self.show_receipt_export_dialog)
+        
         menu.exec_(self.customers_table.mapToGlobal(position))
     
+    def keep_sort_indicator(self, column, order):
+        """Put the sort indicator back on the model's sort column after a click on an unsortable one"""
+        model = self.transactions_model
+        if model.is_sortable(column):
+            return
+        
+        self.customers_table.horizontalHeader().setSortIndicator(
+            model.fields.index(model.sort_field),
+            QtCore.Qt.DescendingOrder if model.descending else QtCore.Qt.AscendingOrder
+        )
+    
+    def prefetch_details(self, current, previous=None):
+        """Prefetch the details of the rows adjacent to the current row"""
+        if not current.isValid():
+            return
+        
+        model = self.transactions_model
+        first_row = max(0, current.row() - self.PREFETCH_ROWS)
+        last_row = min(model.rowCount() - 1, current.row() + self.PREFETCH_ROWS)
+        TransactionDetailCache.prefetch(
+            model.value(row, "transaction_id") for row in range(first_row, last_row + 1)
+        )
+    
+    def view_customer_history(self, row):
+        """Show the lifetime profile of the customer in a row"""
+        phone = self.transactions_model.value(row, "customer_phone")
+        
+        # One primary key read for the profile, one indexed read for the latest
+        # visits; both go by phone key, so every way the number was typed counts
+        def work(conn):
+            customer = CustomerRepository.by_phone(conn, phone)
+            if customer is None:
+                return None, []
+            recent_visits = TransactionRepository.fetch(
+                conn, "t.phone_key = %s", (customer.phone_key,),
+                order_by="t.transaction_date DESC", limit=self.RECENT_VISITS, omit=("notes",)
+            )
+            return customer, recent_visits
+        
+        QueryRunner.submit(
+            work,
+            on_result=lambda result: self.show_customer_history(*result),
+            on_error=self.show_load_error
+        )
+    
+    def show_customer_history(self, customer, recent_visits):
+        """Open the customer history dialog with a loaded profile"""
+        if customer is None:
+            QtWidgets.QMessageBox.information(self, "Customer History", 
+                "No customer profile was found for this phone number.")
+            return
+        
+        CustomerHistoryDialog(self, customer, recent_visits).exec_()
+    
+    def selected_transaction_ids(self):
+        """Get the transaction IDs of the selected rows"""
+        rows = sorted(index.row() for index in self.customers_table.selectionModel().selectedRows())
+        return [self.transactions_model.value(row, "transaction_id") for row in rows]
+    
+    def show_receipt_export_dialog(self):
+        """Ask which receipts to export and where, then export them in the background"""
+        if self.export_task or self.receipt_export:
+            QtWidgets.QMessageBox.information(self, "Export Receipts", "An export is already running.")
+            return
+        
+        transaction_ids = self.selected_transaction_ids()
+        dialog = ReceiptExportDialog(self, len(transaction_ids))
+        if dialog.exec_() != QtWidgets.QDialog.Accepted:
+            return
+        
+        options = dialog.get_options()
+        if options["combined"]:
+            output_path, _ = QtWidgets.QFileDialog.getSaveFileName(
+                self, "Save Receipts as PDF", "Receipts.pdf", "PDF Files (*.pdf)"
+            )
+        else:
+            output_path = QtWidgets.QFileDialog.getExistingDirectory(self, "Choose Folder for Receipts")
+        
+        if not output_path:
+            return
+        
+        if options["use_selection"]:
+            work = lambda conn: ReceiptRepository.by_ids(conn, transaction_ids)
+        else:
+            work = lambda conn: ReceiptRepository.between(conn, options["start_date"], options["end_date"])
+        
+        self.export_progress = QtWidgets.QProgressDialog("Loading receipts...", "Cancel", 0, 0, self)
+        self.export_progress.setWindowTitle("Export Receipts")
+        self.export_progress.setMinimumDuration(0)
+        self.export_progress.canceled.connect(self.cancel_receipt_export)
+        self.export_progress.show()
+        
+        self.export_task = QueryRunner.submit(
+            work,
+            on_result=lambda receipts: self.start_receipt_export(receipts, output_path, options["combined"]),
+            on_error=self.fail_receipt_export
+        )
+    
+    def start_receipt_export(self, receipts, output_path, combined):
+        """Render the loaded receipts on the export workers"""
+        self.export_task = None
+        
+        if not receipts:
+            self.export_progress.reset()
+            QtWidgets.QMessageBox.information(self, "Export Receipts", "No receipts match the chosen transactions.")
+            return
+        
+        self.export_progress.setLabelText(f"Exporting {len(receipts)} receipts...")
+        self.export_progress.setMaximum(len(receipts))
+        self.export_progress.setValue(0)
+        
+        self.receipt_export = ReceiptExport(receipts, output_path, combined, self)
+        self.receipt_export.progress.connect(lambda done, total: self.export_progress.setValue(done))
+        self.receipt_export.finished.connect(self.finish_receipt_export)
+        self.receipt_export.failed.connect(self.fail_receipt_export)
+        self.receipt_export.start()
+    
+    def cancel_receipt_export(self):
+        """Stop the export; receipts already written are kept"""
+        if self.export_task:
+            self.export_task.cancel()
+            self.export_task = None
+        if self.receipt_export:
+            self.receipt_export.cancel()
+            self.receipt_export = None
+    
+    def finish_receipt_export(self, paths):
+        """Report a completed export"""
+        receipt_count = len(self.receipt_export.receipts)
+        self.receipt_export = None
+        self.export_progress.reset()
+        
+        location = paths[0] if len(paths) == 1 else os.path.dirname(paths[0])
+        QtWidgets.QMessageBox.information(self, "Export Receipts", 
+            f"Exported {receipt_count} receipts to {location}")
+    
+    def fail_receipt_export(self, message):
+        """Report a failed export"""
+        self.export_task = None
+        self.receipt_export = None
+        self.export_progress.reset()
+        QtWidgets.QMessageBox.warning(self, "Export Receipts", f"Failed to export receipts: {message}")
+    
     def view_transaction_details(self, row):
         """View detailed information for a transaction"""
-        transaction_id = self.customers_table.item(row, 0).text()
-        customer_name = self.customers_table.item(row, 2).text()
+        transaction_id = self.transactions_model.value(row, "transaction_id")
+        customer_name = self.transactions_model.value(row, "customer_name")
         
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            
-            # Query for transaction details (updated to include notes)
-            cursor.execute("""
-                SELECT t.*, s.service_name, u.username as staff_name
-                FROM transactions t
-                LEFT JOIN services s ON t.service_id = s.service_id
-                LEFT JOIN users u ON t.created_by = u.user_id
-                WHERE t.transaction_id = %s
-            """, (transaction_id,))
-            
-            transaction = cursor.fetchone()
+            # Usually already prefetched when the row became current
+            transaction = TransactionDetailCache.get(transaction_id)
             
             if transaction:
                 # Create transaction details dialog
@@ -707,8 +782,6 @@ class CustomersTab(QtWidgets.QWidget):
                 
                 detail_dialog.exec_()
             
-            cursor.close()
-            
         except mysql.connector.Error as err:
             if self.parent:
                 self.parent.show_error_message(f"Database error: {err}")
@@ -756,142 +829,5 @@ class CustomersTab(QtWidgets.QWidget):
             QtWidgets.QMessageBox.information(self, "Save PDF", "Receipt saved as PDF successfully!")
     
     def rebuild_table(self):
-        """Completely rebuild the table with fresh data"""
-        # Store current filter state
-        was_filtered = self.filter_state["is_active"]
-        filter_state_copy = self.filter_state.copy()
-        
-        # Reset filter state temporarily
-        self.filter_state = {
-            "is_active": False,
-            "date_range": "All Time",
-            "payment_method": "All Methods",
-            "gender": "All"
-        }
-        
-        try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            
-            # Query for all transactions with joined data
-            cursor.execute("""
-                SELECT t.*, u.username as staff_name, s.service_name 
-                FROM transactions t
-                LEFT JOIN users u ON t.created_by = u.user_id
-                LEFT JOIN services s ON t.service_id = s.service_id
-                ORDER BY t.transaction_date DESC
-            """)
-            transactions = cursor.fetchall()
-            
-            # Create and configure a new table from scratch
-            new_table = TableFactory.create_table()
-            customer_columns = [
-                ("Transaction ID", 0.10), 
-                ("OR Number", 0.08),
-                ("Customer Name", 0.08),
-                ("Phone", 0.07),
-                ("Gender", 0.05),
-                ("City", 0.08),
-                ("Service", 0.10),
-                ("Amount", 0.05),
-                ("Payment Method", 0.08),
-                ("Discount", 0.05),
-                ("Date", 0.09),
-                ("Staff", 0.05)
-            ]
-            
-            screen_width = QtWidgets.QApplication.desktop().screenGeometry().width()
-            TableFactory.configure_table_columns(new_table, customer_columns, screen_width)
-            
-            # Set up context menu for the new table
-            new_table.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
-            new_table.customContextMenuRequested.connect(self.show_context_menu)
-            
-            # Populate the new table
-            new_table.setRowCount(len(transactions))
-            
-            for row, transaction in enumerate(transactions):
-                # Transaction ID
-                id_item = QtWidgets.QTableWidgetItem(str(transaction.get('transaction_id', '')))
-                id_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                new_table.setItem(row, 0, id_item)
-                
-                # OR Number
-                or_item = QtWidgets.QTableWidgetItem(str(transaction.get('or_number', '')))
-                or_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                new_table.setItem(row, 1, or_item)
-                
-                # Customer name
-                new_table.setItem(row, 2, QtWidgets.QTableWidgetItem(transaction.get('customer_name', '')))
-                
-                # Phone
-                phone_item = QtWidgets.QTableWidgetItem(transaction.get('customer_phone', ''))
-                phone_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                new_table.setItem(row, 3, phone_item)
-                
-                # Gender
-                gender_item = QtWidgets.QTableWidgetItem(transaction.get('customer_gender', ''))
-                gender_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                new_table.setItem(row, 4, gender_item)
-                
-                # City
-                new_table.setItem(row, 5, QtWidgets.QTableWidgetItem(transaction.get('customer_city', '')))
-                
-                # Service
-                new_table.setItem(row, 6, QtWidgets.QTableWidgetItem(transaction.get('service_name', '')))
-                
-                # Amount with proper formatting
-                total = float(transaction.get('total_amount', 0))
-                amount_item = QtWidgets.QTableWidgetItem(f"₱{total:.2f}")
-                amount_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-                
-                # Color code based on amount
-                if total > 1000:
-                    amount_item.setForeground(QtGui.QColor("#4CAF50"))  # Green for high value
-                
-                new_table.setItem(row, 7, amount_item)
-                
-                # Payment Method
-                payment_item = QtWidgets.QTableWidgetItem(transaction.get('payment_method', ''))
-                payment_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                new_table.setItem(row, 8, payment_item)
-                
-                # Discount
-                discount = float(transaction.get('discount_percentage', 0))
-                discount_item = QtWidgets.QTableWidgetItem(f"{discount:.0f}%")
-                discount_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                
-                if discount > 0:
-                    discount_item.setForeground(QtGui.QColor("#FF9800"))  # Orange for discount
-                
-                new_table.setItem(row, 9, discount_item)
-                
-                # Date
-                date = transaction.get('transaction_date')
-                date_str = date.strftime('%Y-%m-%d %H:%M') if date else ""
-                date_item = QtWidgets.QTableWidgetItem(date_str)
-                date_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                new_table.setItem(row, 10, date_item)
-                
-                # Staff
-                new_table.setItem(row, 11, QtWidgets.QTableWidgetItem(transaction.get('staff_name', '')))
-            
-            # Replace the old table with the new one
-            old_table = self.customers_table
-            self.layout.replaceWidget(old_table, new_table)
-            self.customers_table = new_table
-            old_table.deleteLater()
-            
-            cursor.close()
-            
-            # Restore filter state if necessary
-            if was_filtered:
-                self.filter_state = filter_state_copy
-                # Add a short delay before applying filters to ensure table is fully rendered
-                QtCore.QTimer.singleShot(50, self.apply_stored_filters)
-            
-        except mysql.connector.Error as err:
-            if self.parent:
-                self.parent.show_error_message(f"Database error: {err}")
-            else:
-                QtWidgets.QMessageBox.critical(self, "Error", f"Database error: {err}")
\ No newline at end of file
+        """Reload the table with fresh data and the current filters"""
+        self.load_task = self.transactions_model.set_filters(self.filter_state)
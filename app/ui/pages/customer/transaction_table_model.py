@@ -0,0 +1,363 @@
+from PyQt5 import QtCore, QtGui
+from array import array
+from app.utils.query_runner import QueryRunner
+from app.utils.repositories import TransactionRepository
+
+
+class TransactionTableModel(QtCore.QAbstractTableModel):
+    """Table model that pages customer transactions in from the database as the view scrolls
+
+    Rows are kept as one array per column rather than one object per cell, and
+    cell text is only formatted when the view paints it. Sorting reloads from
+    the database in the new order, so opening the table costs one page of
+    rows however long the history is. Reloads keep the current rows on screen
+    until the replacement page arrives, and new sales are inserted at the top
+    without reloading what is already loaded.
+    """
+
+    # Emitted with the number of rows a page added, including an empty last page
+    pageLoaded = QtCore.pyqtSignal(int)
+
+    # Emitted with the error message when a page fails to load
+    loadFailed = QtCore.pyqtSignal(str)
+
+    # Emitted on each reload with (count, total amount) of every matching
+    # transaction, or None when no search or filter narrows the rows
+    totalsLoaded = QtCore.pyqtSignal(object)
+
+    # Rows fetched per page
+    PAGE_SIZE = 200
+
+    # (header, Transaction field) for each column, in display order
+    COLUMNS = [
+        ("Transaction ID", "transaction_id"),
+        ("OR Number", "or_number"),
+        ("Customer Name", "customer_name"),
+        ("Phone", "customer_phone"),
+        ("Gender", "customer_gender"),
+        ("City", "customer_city"),
+        ("Service", "service_name"),
+        ("Amount", "total_amount"),
+        ("Payment Method", "payment_method"),
+        ("Discount", "discount_percentage"),
+        ("Date", "transaction_date"),
+        ("Staff", "staff_name"),
+    ]
+
+    # Fields stored as packed floats instead of Decimal objects
+    NUMERIC_FIELDS = ("total_amount", "discount_percentage")
+
+    CENTERED_FIELDS = (
+        "transaction_id", "or_number", "customer_phone", "customer_gender",
+        "payment_method", "discount_percentage", "transaction_date",
+    )
+
+    HIGH_VALUE_COLOR = QtGui.QColor("#4CAF50")
+    DISCOUNT_COLOR = QtGui.QColor("#FF9800")
+
+    def __init__(self, parent=None):
+        super(TransactionTableModel, self).__init__(parent)
+        self.fields = [field for _, field in self.COLUMNS]
+        self.columns = self.empty_columns()
+        self.row_count = 0
+
+        self.sort_field = "transaction_date"
+        self.descending = True
+        self.search = ""
+        self.filters = None
+
+        # Keyset of the last loaded row; the next page starts after it
+        self.after = None
+        self.has_more = False
+        self.fetch_task = None
+
+        # Last totals emitted, kept up to date as new sales are inserted
+        self.totals = None
+
+    def empty_columns(self):
+        """Create one empty array per column"""
+        return {
+            field: array("d") if field in self.NUMERIC_FIELDS else []
+            for field in self.fields
+        }
+
+    def reload(self):
+        """Fetch the first page again; it replaces the loaded rows when it arrives
+
+        Returns:
+            QueryTask: Handle of the first page's query
+        """
+        return self.fetch_page(replace=True)
+
+    def set_search(self, search):
+        """Reload with only the transactions matching a search term
+
+        Args:
+            search (str): Prefix of a customer name, phone, OR number or
+                transaction ID; blank to show every transaction
+
+        Returns:
+            QueryTask: Handle of the first page's query
+        """
+        self.search = search.strip()
+        return self.reload()
+
+    def set_filters(self, filter_state):
+        """Reload with only the transactions matching a filter dialog state
+
+        Args:
+            filter_state (dict): State from the transaction filter dialog
+
+        Returns:
+            QueryTask: Handle of the first page's query
+        """
+        self.filters = dict(filter_state)
+        return self.reload()
+
+    def is_narrowed(self):
+        """Check whether a search or filter limits the rows"""
+        return bool(self.search) or bool(self.filters and self.filters.get("is_active"))
+
+    def fetch_page(self, replace=False):
+        """Query a page in the background
+
+        Args:
+            replace (bool): Fetch the first page and swap it in for the
+                loaded rows, instead of the page after them
+
+        Returns:
+            QueryTask: Handle of the page's query
+        """
+        # A newer request supersedes whatever page is still in flight
+        if self.fetch_task:
+            self.fetch_task.cancel()
+
+        sort_field, descending, search, filters = self.sort_field, self.descending, self.search, self.filters
+        after = None if replace else self.after
+        with_totals = replace and self.is_narrowed()
+
+        def work(conn):
+            transactions = TransactionRepository.page(
+                conn, sort_field, descending, after, self.PAGE_SIZE, search, filters
+            )
+            totals = TransactionRepository.totals(conn, search, filters) if with_totals else None
+            return transactions, totals
+
+        self.fetch_task = QueryRunner.submit(
+            work,
+            on_result=lambda result: self.add_page(*result, replace=replace),
+            on_error=self.fail_page
+        )
+        return self.fetch_task
+
+    def pack(self, transactions):
+        """Split transactions into one list of values per column"""
+        packed = {}
+        for field in self.fields:
+            values = [getattr(transaction, field) for transaction in transactions]
+            if field in self.NUMERIC_FIELDS:
+                values = [float(value or 0) for value in values]
+            packed[field] = values
+        return packed
+
+    def add_page(self, transactions, totals=None, replace=False):
+        """Append a fetched page to the model, or swap it in for the loaded rows"""
+        self.fetch_task = None
+        self.has_more = len(transactions) == self.PAGE_SIZE
+
+        if transactions:
+            last = transactions[-1]
+            self.after = (getattr(last, self.sort_field), last.transaction_id)
+        elif replace:
+            self.after = None
+
+        packed = self.pack(transactions)
+
+        if replace:
+            self.beginResetModel()
+            self.columns = self.empty_columns()
+            for field, values in packed.items():
+                self.columns[field].extend(values)
+            self.row_count = len(transactions)
+            self.endResetModel()
+            self.totals = totals
+            self.totalsLoaded.emit(totals)
+        elif transactions:
+            first_row = self.row_count
+            self.beginInsertRows(QtCore.QModelIndex(), first_row, first_row + len(transactions) - 1)
+            for field, values in packed.items():
+                self.columns[field].extend(values)
+            self.row_count += len(transactions)
+            self.endInsertRows()
+
+        self.pageLoaded.emit(len(transactions))
+
+    def fetch_newer(self, transaction_ids=None):
+        """Insert transactions saved since the rows were loaded at the top of the model
+
+        Only rows newer than the newest loaded one are read, so the cost
+        follows the number of new sales rather than the length of the history.
+        Outside the default newest-first order the new rows have no fixed
+        place, so the model reloads instead.
+
+        Args:
+            transaction_ids (iterable, optional): IDs of the new transactions;
+                None when the writer could not tell which rows it added
+
+        Returns:
+            QueryTask: Handle of the query, or None when there is nothing to fetch
+        """
+        if transaction_ids is not None and not transaction_ids:
+            return None
+
+        if (
+            not (self.sort_field == "transaction_date" and self.descending)
+            or self.row_count == 0
+            or self.fetch_task is not None
+        ):
+            return self.reload()
+
+        since = (self.columns["transaction_date"][0], self.columns["transaction_id"][0])
+        search, filters = self.search, self.filters
+        transaction_ids = None if transaction_ids is None else tuple(transaction_ids)
+
+        def work(conn):
+            return TransactionRepository.newer(
+                conn, since, transaction_ids, search, filters, limit=self.PAGE_SIZE
+            )
+
+        self.fetch_task = QueryRunner.submit(work, on_result=self.insert_newer, on_error=self.fail_page)
+        return self.fetch_task
+
+    def insert_newer(self, transactions):
+        """Insert new transactions, fetched oldest first, above the loaded rows
+
+        Transactions already loaded are skipped. One that sorts below the top
+        row but is not loaded belongs somewhere inside the rows, so the model
+        reloads instead.
+        """
+        self.fetch_task = None
+
+        # Too many to be a few new sales; start over from the first page
+        if len(transactions) == self.PAGE_SIZE:
+            self.reload()
+            return
+
+        top = (self.columns["transaction_date"][0], self.columns["transaction_id"][0])
+        above, below = [], []
+        for transaction in transactions:
+            keyset = (transaction.transaction_date, transaction.transaction_id)
+            (above if keyset > top else below).append(transaction)
+
+        if below:
+            loaded = set(self.columns["transaction_id"])
+            if any(transaction.transaction_id not in loaded for transaction in below):
+                self.reload()
+                return
+            transactions = above
+
+        if transactions:
+            transactions = transactions[::-1]
+            packed = self.pack(transactions)
+
+            self.beginInsertRows(QtCore.QModelIndex(), 0, len(transactions) - 1)
+            for field, values in packed.items():
+                self.columns[field][0:0] = array("d", values) if field in self.NUMERIC_FIELDS else values
+            self.row_count += len(transactions)
+            self.endInsertRows()
+
+            if self.totals is not None:
+                count, total_amount = self.totals
+                added = sum(transaction.total_amount or 0 for transaction in transactions)
+                self.totals = (count + len(transactions), total_amount + added)
+                self.totalsLoaded.emit(self.totals)
+
+        self.pageLoaded.emit(len(transactions))
+
+    def fail_page(self, message):
+        """Stop paging after a failed query"""
+        self.fetch_task = None
+        self.has_more = False
+        self.loadFailed.emit(message)
+
+    def value(self, row, field):
+        """Get the raw value of a field in a loaded row"""
+        return self.columns[field][row]
+
+    def display_text(self, row, column):
+        """Get the text shown in a cell"""
+        field = self.fields[column]
+        return self.format_value(field, self.columns[field][row])
+
+    @staticmethod
+    def format_value(field, value):
+        """Format a raw value for display"""
+        if field == "total_amount":
+            return f"₱{value:.2f}"
+        if field == "discount_percentage":
+            return f"{value:.0f}%"
+        if field == "transaction_date":
+            return value.strftime('%Y-%m-%d %H:%M') if value else ""
+        return "" if value is None else str(value)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self.row_count
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        field = self.fields[index.column()]
+        value = self.columns[field][index.row()]
+
+        if role == QtCore.Qt.DisplayRole:
+            return self.format_value(field, value)
+
+        if role == QtCore.Qt.TextAlignmentRole:
+            if field == "total_amount":
+                return int(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+            if field in self.CENTERED_FIELDS:
+                return int(QtCore.Qt.AlignCenter)
+            return None
+
+        if role == QtCore.Qt.ForegroundRole:
+            if field == "total_amount" and value > 1000:
+                return self.HIGH_VALUE_COLOR
+            if field == "discount_percentage" and value > 0:
+                return self.DISCOUNT_COLOR
+            return None
+
+        if role == QtCore.Qt.UserRole:
+            return value
+
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.COLUMNS[section][0]
+        return None
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        return not parent.isValid() and self.has_more and self.fetch_task is None
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if self.canFetchMore(parent):
+            self.fetch_page()
+
+    def is_sortable(self, column):
+        """Check whether the database can order the rows by a column"""
+        return self.fields[column] in TransactionRepository.SORT_KEYS
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        """Reload in a new order; the database does the sorting"""
+        sort_field = self.fields[column]
+        descending = order == QtCore.Qt.DescendingOrder
+        if not self.is_sortable(column) or (sort_field, descending) == (self.sort_field, self.descending):
+            return
+
+        self.sort_field = sort_field
+        self.descending = descending
+        self.reload()
@@ -0,0 +1,137 @@
+from app.utils.chart_renderer import Chart
+from app.utils.dashboard_updater import DashboardUpdater
+
+
+class SalesChart(Chart):
+    """Daily revenue bars with a transaction count line, one bar per day"""
+
+    NAME = "dashboard_sales"
+
+    def create(self, figure):
+        ax = figure.add_subplot(111)
+        ax.set_facecolor(self.FACE_COLOR)
+        ax2 = ax.twinx()
+
+        # One bar and line point per day, kept for the life of the chart
+        days = range(DashboardUpdater.SALES_DAYS + 1)
+        self.bars = ax.bar(days, [0] * len(days), color='#4CAF50', alpha=0.7, label='Revenue (₱)', width=0.5)
+        self.line, = ax2.plot(days, [0] * len(days), color='#FF9800', marker='o', linewidth=2, markersize=4, label='Transactions')
+        ax.set_xticks(days)
+        ax.set_xticklabels([''] * len(days))
+
+        # Styling with smaller fonts for zoomed out view
+        ax.set_ylabel('Revenue (₱)', color='white', fontsize=9)
+        ax2.set_ylabel('Transactions', color='white', fontsize=9)
+        ax.set_xlabel('Date', color='white', fontsize=9)
+
+        ax.tick_params(colors='white', labelsize=8)
+        ax2.tick_params(colors='white', labelsize=8)
+        ax.grid(True, alpha=0.2)
+
+        # Compact legend
+        lines1, labels1 = ax.get_legend_handles_labels()
+        lines2, labels2 = ax2.get_legend_handles_labels()
+        ax.legend(lines1 + lines2, labels1 + labels2, loc='upper left',
+                 facecolor='#333', edgecolor='white', labelcolor='white', fontsize=8)
+
+        # Tighter layout
+        figure.subplots_adjust(left=0.1, right=0.9, top=0.95, bottom=0.15)
+
+        self.axes = (ax, ax2)
+
+    def update(self, data):
+        """Show daily sales rows, updating the bars and line in place"""
+        ax, ax2 = self.axes
+        revenue = [float(day.revenue) for day in data]
+        transactions = [day.transaction_count for day in data]
+
+        for bar, value in zip(self.bars, revenue):
+            bar.set_height(value)
+        self.line.set_ydata(transactions)
+        ax.set_xticklabels([day.sale_date.strftime('%m/%d') for day in data])
+
+        # Headroom above the tallest bar and point, which autoscaling would not add in place
+        ax.set_ylim(0, max(revenue, default=0) * 1.1 or 1)
+        ax2.set_ylim(0, max(transactions, default=0) * 1.2 or 1)
+
+
+class InventoryChart(Chart):
+    """Stacked stock level bars for the largest product categories"""
+
+    NAME = "dashboard_inventory"
+
+    def create(self, figure):
+        ax = figure.add_subplot(111)
+        ax.set_facecolor(self.FACE_COLOR)
+
+        # Stacked bars and a total label for each category slot; unused slots are hidden
+        slots = range(DashboardUpdater.INVENTORY_CATEGORIES)
+        bar_width = 0.4  # Narrower bars
+        zeros = [0] * len(slots)
+        self.bars = (
+            ax.bar(slots, zeros, bar_width, color='#4CAF50', alpha=0.8, label='In Stock'),
+            ax.bar(slots, zeros, bar_width, color='#FF9800', alpha=0.8, label='Low Stock'),
+            ax.bar(slots, zeros, bar_width, color='#F44336', alpha=0.8, label='Out of Stock'),
+        )
+        self.labels = [
+            ax.text(slot, 0, '', ha='center', va='bottom', color='white', fontweight='bold', fontsize=8)
+            for slot in slots
+        ]
+        self.empty_label = ax.text(0.5, 0.5, 'No Product Data Available', ha='center', va='center',
+                                   transform=ax.transAxes, color='white', fontsize=12)
+
+        ax.set_xticks(slots)
+        ax.set_xticklabels([''] * len(slots), rotation=45, ha='right')
+
+        # Styling with smaller fonts for zoomed out view
+        ax.set_ylabel('Products', color='white', fontsize=9)
+        ax.set_xlabel('Categories', color='white', fontsize=9)
+
+        ax.tick_params(colors='white', labelsize=8)
+        ax.grid(True, alpha=0.2, axis='y')
+
+        # Compact legend
+        ax.legend(loc='upper right', facecolor='#333', edgecolor='white', labelcolor='white', fontsize=8)
+
+        # Tighter layout
+        figure.subplots_adjust(left=0.12, right=0.95, top=0.95, bottom=0.25)
+
+        self.axes = ax
+
+    def update(self, data):
+        """Show category stock rows, updating the bars in place"""
+        ax = self.axes
+        data = list(data or [])[:len(self.labels)]
+
+        categories = []
+        totals = []
+        for slot, (in_bar, low_bar, out_bar) in enumerate(zip(*self.bars)):
+            if slot < len(data):
+                item = data[slot]
+                category = item['category']
+                categories.append(category[:8] + '...' if len(category) > 8 else category)
+                in_stock, low_stock, out_of_stock = int(item['in_stock']), int(item['low_stock']), int(item['out_of_stock'])
+            else:
+                categories.append('')
+                in_stock = low_stock = out_of_stock = 0
+
+            # Stack the three segments
+            in_bar.set_height(in_stock)
+            low_bar.set_y(in_stock)
+            low_bar.set_height(low_stock)
+            out_bar.set_y(in_stock + low_stock)
+            out_bar.set_height(out_of_stock)
+            for bar in (in_bar, low_bar, out_bar):
+                bar.set_visible(slot < len(data))
+
+            # Smaller value labels on bars, only where there's data
+            total = in_stock + low_stock + out_of_stock
+            totals.append(total)
+            label = self.labels[slot]
+            label.set_position((slot, total + 0.1))
+            label.set_text(str(total) if total > 0 else '')
+
+        ax.set_xticklabels(categories, rotation=45, ha='right')
+        ax.set_xlim(-0.5, max(len(data), 1) - 0.5)
+        ax.set_ylim(0, max(totals) * 1.15 or 1)
+        self.empty_label.set_visible(not data)
@@ -1,19 +1,28 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
 from app.ui.pages.base_page import BasePage
-from app.utils.db_manager import DBManager
 from app.utils.dashboard_updater import DashboardUpdater
-import mysql.connector
+from app.utils.event_bus import EventBus, TransactionCreated, StockChanged
+from app.ui.pages.chart_view import ChartView
+from .dashboard_charts import SalesChart, InventoryChart
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib
-matplotlib.use('Qt5Agg')
 
 class DashboardPage(BasePage):
+    # How often the visible dashboard checks for sales and stock changes, including other terminals'
+    POLL_INTERVAL = 30000
+    
     def __init__(self, parent=None, user_info=None):
+        self.refresh_task = None
+        # Data versions of the figures on screen; see DashboardUpdater.fetch_dashboard_data
+        self.data_versions = None
         super(DashboardPage, self).__init__(parent, title="Dashboard", user_info=user_info)
         self.user_info = user_info
+        
+        # Sales and stock movements feed the metrics and both charts
+        EventBus.subscribe((TransactionCreated, StockChanged), lambda event: self.load_dashboard_data(), widget=self)
+        
+        self.poll_timer = QtCore.QTimer(self)
+        self.poll_timer.setInterval(self.POLL_INTERVAL)
+        self.poll_timer.timeout.connect(self.load_dashboard_data)
     
     def createContent(self):
         # Content area - matching other pages style
@@ -120,8 +129,8 @@ class DashboardPage(BasePage):
         # Today's Revenue card
         self.today_revenue_card = self.create_metric_card("Today's Revenue", "₱0.00", "#2196F3", "")
         
-        # Services card
-        self.services_card = self.create_metric_card("Total Services", "0", "#9C27B0", "")
+        # Services sold today, counting every service on multi-service invoices
+        self.services_card = self.create_metric_card("Services Sold Today", "0", "#9C27B0", "")
         
         # Today's Transactions card
         self.transactions_card = self.create_metric_card("Today's Transactions", "0", "#FF9800", "")
@@ -219,154 +228,23 @@ class DashboardPage(BasePage):
         return widget
     
     def create_sales_chart(self):
-        """Create sales analytics chart with zoomed out view"""
-        # Smaller figure size for zoomed out effect
-        figure = Figure(figsize=(6, 3.5), facecolor='#232323', dpi=80)  # Reduced DPI and size
-        canvas = FigureCanvas(figure)
-        canvas.setStyleSheet("background-color: #232323;")
-        
-        ax = figure.add_subplot(111)
-        ax.set_facecolor('#232323')
-        
-        try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            
-            # Get daily transaction data for the last 7 days
-            cursor.execute("""
-                SELECT 
-                    DATE(transaction_date) as date,
-                    COUNT(*) as transactions,
-                    SUM(total_amount) as revenue
-                FROM transactions 
-                WHERE transaction_date >= DATE_SUB(CURDATE(), INTERVAL 7 DAY)
-                GROUP BY DATE(transaction_date)
-                ORDER BY date
-            """)
-            
-            data = cursor.fetchall()
-            cursor.close()
-            
-            if data:
-                dates = [item['date'].strftime('%m/%d') for item in data]
-                revenue = [float(item['revenue']) for item in data]
-                transactions = [item['transactions'] for item in data]
-            else:
-                dates = ['No Data']
-                revenue = [0]
-                transactions = [0]
-            
-        except Exception as e:
-            print(f"Error loading sales data: {e}")
-            dates = ['No Data']
-            revenue = [0]
-            transactions = [0]
-        
-        # Create bar chart for revenue
-        bars = ax.bar(dates, revenue, color='#4CAF50', alpha=0.7, label='Revenue (₱)', width=0.5)
-        
-        # Create line chart for transactions on secondary y-axis
-        ax2 = ax.twinx()
-        line = ax2.plot(dates, transactions, color='#FF9800', marker='o', linewidth=2, markersize=4, label='Transactions')
-        
-        # Styling with smaller fonts for zoomed out view
-        ax.set_ylabel('Revenue (₱)', color='white', fontsize=9)
-        ax2.set_ylabel('Transactions', color='white', fontsize=9)
-        ax.set_xlabel('Date', color='white', fontsize=9)
-        
-        ax.tick_params(colors='white', labelsize=8)
-        ax2.tick_params(colors='white', labelsize=8)
-        ax.grid(True, alpha=0.2)
-        
-        # Compact legend
-        lines1, labels1 = ax.get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
-        ax.legend(lines1 + lines2, labels1 + labels2, loc='upper left', 
-                 facecolor='#333', edgecolor='white', labelcolor='white', fontsize=8)
-        
-        # Tighter layout
-        figure.subplots_adjust(left=0.1, right=0.9, top=0.95, bottom=0.15)
-        
-        return canvas
+        """Create the sales analytics chart view; update_sales_chart fills in the data"""
+        self.sales_chart_view = ChartView(SalesChart())
+        return self.sales_chart_view
+    
+    def update_sales_chart(self, data):
+        """Show daily sales rows in the sales chart, rendered in the background"""
+        self.sales_chart_view.set_data(data, hash(tuple(data)))
     
     def create_inventory_chart(self):
-        """Create inventory status chart with zoomed out view"""
-        figure = Figure(figsize=(6, 3.5), facecolor='#232323', dpi=80)  # Reduced DPI and size
-        canvas = FigureCanvas(figure)
-        canvas.setStyleSheet("background-color: #232323;")
-        
-        ax = figure.add_subplot(111)
-        ax.set_facecolor('#232323')
-        
-        try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            
-            # Get product categories and their stock levels
-            cursor.execute("""
-                SELECT 
-                    category,
-                    COUNT(*) as total_products,
-                    SUM(CASE WHEN quantity > threshold_value THEN 1 ELSE 0 END) as in_stock,
-                    SUM(CASE WHEN quantity <= threshold_value AND quantity > 0 THEN 1 ELSE 0 END) as low_stock,
-                    SUM(CASE WHEN quantity = 0 THEN 1 ELSE 0 END) as out_of_stock
-                FROM products 
-                WHERE category IS NOT NULL AND category != ''
-                GROUP BY category
-                ORDER BY total_products DESC
-                LIMIT 5
-            """)
-            
-            data = cursor.fetchall()
-            cursor.close()
-            
-            if data:
-                categories = [item['category'][:8] + '...' if len(item['category']) > 8 else item['category'] for item in data] 
-                in_stock = [item['in_stock'] for item in data]
-                low_stock = [item['low_stock'] for item in data]
-                out_of_stock = [item['out_of_stock'] for item in data]
-                
-                # Create stacked bar chart with narrower bars
-                x_pos = range(len(categories))
-                bar_width = 0.4  # Narrower bars
-                
-                bars1 = ax.bar(x_pos, in_stock, bar_width, color='#4CAF50', alpha=0.8, label='In Stock')
-                bars2 = ax.bar(x_pos, low_stock, bar_width, bottom=in_stock, color='#FF9800', alpha=0.8, label='Low Stock')
-                bars3 = ax.bar(x_pos, out_of_stock, bar_width,
-                             bottom=[i+j for i,j in zip(in_stock, low_stock)], 
-                             color='#F44336', alpha=0.8, label='Out of Stock')
-                
-                ax.set_xticks(x_pos)
-                ax.set_xticklabels(categories, rotation=45, ha='right')
-                
-                # Add smaller value labels on bars
-                for i, (category, total) in enumerate(zip(categories, [i+j+k for i,j,k in zip(in_stock, low_stock, out_of_stock)])):
-                    if total > 0:  # Only show label if there's data
-                        ax.text(i, total + 0.1, str(total), ha='center', va='bottom', color='white', fontweight='bold', fontsize=8)
-                
-            else:
-                ax.text(0.5, 0.5, 'No Product Data Available', ha='center', va='center', 
-                       transform=ax.transAxes, color='white', fontsize=12)
-                
-        except Exception as e:
-            print(f"Error loading inventory data: {e}")
-            ax.text(0.5, 0.5, ' ', ha='center', va='center', 
-                   transform=ax.transAxes, color='white', fontsize=12)
-        
-        # Styling with smaller fonts for zoomed out view
-        ax.set_ylabel('Products', color='white', fontsize=9)
-        ax.set_xlabel('Categories', color='white', fontsize=9)
-        
-        ax.tick_params(colors='white', labelsize=8)
-        ax.grid(True, alpha=0.2, axis='y')
-        
-        # Compact legend
-        ax.legend(loc='upper right', facecolor='#333', edgecolor='white', labelcolor='white', fontsize=8)
-        
-        # Tighter layout
-        figure.subplots_adjust(left=0.12, right=0.95, top=0.95, bottom=0.25)
-        
-        return canvas
+        """Create the inventory status chart view; update_inventory_chart fills in the data"""
+        self.inventory_chart_view = ChartView(InventoryChart())
+        return self.inventory_chart_view
+    
+    def update_inventory_chart(self, data):
+        """Show category stock rows in the inventory chart, rendered in the background"""
+        version = hash(tuple(tuple(sorted(item.items())) for item in data))
+        self.inventory_chart_view.set_data(data, version)
     
     def navigate_to_page(self, page_name):
         """Navigate to specified page"""
@@ -403,53 +281,16 @@ class DashboardPage(BasePage):
     def showEvent(self, event):
         """Called when the page is shown"""
         super().showEvent(event)
-        # Use QTimer to ensure the refresh happens after the page is fully displayed
+        # Use QTimer to ensure the refresh happens after the page is fully displayed;
+        # it only reloads if the data changed while the page was hidden
         QtCore.QTimer.singleShot(100, lambda: DashboardUpdater.refresh_metrics_and_charts(self))
+        self.poll_timer.start()
+    
+    def hideEvent(self, event):
+        """Stop polling while the page is hidden"""
+        super().hideEvent(event)
+        self.poll_timer.stop()
     
     def load_dashboard_data(self):
-        """Load dashboard data from database"""
-        try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            
-            # Load total revenue (all time)
-            cursor.execute("""
-                SELECT COALESCE(SUM(total_amount), 0) as total_revenue 
-                FROM transactions
-            """)
-            total_revenue_data = cursor.fetchone()
-            total_revenue = total_revenue_data['total_revenue'] if total_revenue_data else 0
-            
-            # Load today's revenue
-            cursor.execute("""
-                SELECT COALESCE(SUM(total_amount), 0) as daily_revenue 
-                FROM transactions 
-                WHERE DATE(transaction_date) = CURDATE()
-            """)
-            daily_revenue_data = cursor.fetchone()
-            daily_revenue = daily_revenue_data['daily_revenue'] if daily_revenue_data else 0
-            
-            # Load total services count
-            cursor.execute("SELECT COUNT(*) as count FROM services")
-            services_count = cursor.fetchone()['count']
-            
-            # Load today's transactions count
-            cursor.execute("""
-                SELECT COUNT(*) as count 
-                FROM transactions 
-                WHERE DATE(transaction_date) = CURDATE()
-            """)
-            transactions_count = cursor.fetchone()['count']
-            
-            # Update metric cards
-            self.total_revenue_card.value_label.setText(f"₱{total_revenue:,.2f}")
-            self.today_revenue_card.value_label.setText(f"₱{daily_revenue:,.2f}")
-            self.services_card.value_label.setText(str(services_count))
-            self.transactions_card.value_label.setText(str(transactions_count))
-            
-            cursor.close()
-            
-        except mysql.connector.Error as err:
-            print(f"Database error loading dashboard: {err}")
-        except Exception as e:
-            print(f"Error loading dashboard data: {e}")
\ No newline at end of file
+        """Load dashboard data in the background"""
+        DashboardUpdater.refresh_metrics_and_charts(self)
@@ -1,6 +1,7 @@
 from PyQt5 import QtWidgets, QtCore
 import mysql.connector
 from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 from .base_dialog import BaseDialog
 
 class ProductDialog(BaseDialog):
@@ -170,6 +171,7 @@ class ProductDialog(BaseDialog):
                 )
             
             conn.commit()
+            ReferenceCache.invalidate("products", "inventory_status")
             cursor.close()
             
             self.accept()
@@ -1,7 +1,8 @@
 from PyQt5 import QtWidgets, QtCore
 import mysql.connector
-from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 from ..style_factory import StyleFactory
+from ..product_table_model import ProductFilterProxyModel
 from .base_dialog import BaseDialog
 
 class ProductFilterDialog(BaseDialog):
@@ -10,12 +11,7 @@ class ProductFilterDialog(BaseDialog):
     def __init__(self, parent=None, filter_state=None):
         super(ProductFilterDialog, self).__init__(parent, None, "Filter Products")
         self.parent = parent
-        self.filter_state = filter_state or {
-            "is_active": False,
-            "category": "All Categories",
-            "availability": "All",
-            "price_sort": "No Sorting"
-        }
+        self.filter_state = {**ProductFilterProxyModel.DEFAULT_FILTERS, **(filter_state or {})}
         self.result_filter_state = self.filter_state.copy()
         
         self.setup_ui()
@@ -32,13 +28,7 @@ class ProductFilterDialog(BaseDialog):
         
         # Get unique categories
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT DISTINCT category FROM products WHERE category IS NOT NULL AND category != ''")
-            categories = cursor.fetchall()
-            for category in categories:
-                self.category_combo.addItem(category['category'])
-            cursor.close()
+            self.category_combo.addItems(ReferenceCache.get("product_categories"))
         except mysql.connector.Error:
             pass
         
@@ -63,6 +53,49 @@ class ProductFilterDialog(BaseDialog):
             
         self.form_layout.addRow(availability_label, self.availability_combo)
         
+        # Stock level filter, against each product's threshold
+        stock_level_label = QtWidgets.QLabel("Stock Level:")
+        self.stock_level_combo = QtWidgets.QComboBox()
+        self.stock_level_combo.addItems(["All", "Above Threshold", "Low Stock", "Empty"])
+        
+        stock_level_index = self.stock_level_combo.findText(self.filter_state["stock_level"])
+        if stock_level_index >= 0:
+            self.stock_level_combo.setCurrentIndex(stock_level_index)
+            
+        self.form_layout.addRow(stock_level_label, self.stock_level_combo)
+        
+        # Expiry filter
+        expiry_label = QtWidgets.QLabel("Expiry:")
+        self.expiry_combo = QtWidgets.QComboBox()
+        self.expiry_combo.addItems(["All", "Expired", "Expiring Soon", "No Expiry Date"])
+        self.expiry_combo.setToolTip(
+            f"Expiring Soon: within {ProductFilterProxyModel.EXPIRY_WARNING_DAYS} days"
+        )
+        
+        expiry_index = self.expiry_combo.findText(self.filter_state["expiry"])
+        if expiry_index >= 0:
+            self.expiry_combo.setCurrentIndex(expiry_index)
+            
+        self.form_layout.addRow(expiry_label, self.expiry_combo)
+        
+        # Price range; zero leaves that end open
+        price_range_label = QtWidgets.QLabel("Price Range:")
+        price_range_layout = QtWidgets.QHBoxLayout()
+        self.price_min_spin = QtWidgets.QDoubleSpinBox()
+        self.price_max_spin = QtWidgets.QDoubleSpinBox()
+        for spin, value in ((self.price_min_spin, self.filter_state["price_min"]),
+                            (self.price_max_spin, self.filter_state["price_max"])):
+            spin.setPrefix("₱")
+            spin.setDecimals(2)
+            spin.setMaximum(999999.99)
+            spin.setSpecialValueText("Any")
+            spin.setValue(value)
+        price_range_layout.addWidget(self.price_min_spin)
+        price_range_layout.addWidget(QtWidgets.QLabel("to"))
+        price_range_layout.addWidget(self.price_max_spin)
+        
+        self.form_layout.addRow(price_range_label, price_range_layout)
+        
         # Price sorting options
         price_sort_label = QtWidgets.QLabel("Price Sort:")
         self.price_sort_combo = QtWidgets.QComboBox()
@@ -79,7 +112,7 @@ class ProductFilterDialog(BaseDialog):
         
         # Filter helper text
         helper_text = QtWidgets.QLabel(
-            "Tip: Filter by category and availability, then sort by price to find the perfect match."
+            "Tip: Filter by category, stock and expiry, then narrow the price range or sort by price."
         )
         helper_text.setStyleSheet("color: #4FC3F7; font-style: italic; font-size: 12px;")
         helper_text.setWordWrap(True)
@@ -114,12 +147,20 @@ class ProductFilterDialog(BaseDialog):
         # Save filter state
         self.result_filter_state["category"] = self.category_combo.currentText()
         self.result_filter_state["availability"] = self.availability_combo.currentText()
+        self.result_filter_state["stock_level"] = self.stock_level_combo.currentText()
+        self.result_filter_state["expiry"] = self.expiry_combo.currentText()
+        self.result_filter_state["price_min"] = self.price_min_spin.value()
+        self.result_filter_state["price_max"] = self.price_max_spin.value()
         self.result_filter_state["price_sort"] = self.price_sort_combo.currentText()
         
         # Determine if any filters are active
         self.result_filter_state["is_active"] = (
             self.result_filter_state["category"] != "All Categories" or
             self.result_filter_state["availability"] != "All" or
+            self.result_filter_state["stock_level"] != "All" or
+            self.result_filter_state["expiry"] != "All" or
+            bool(self.result_filter_state["price_min"]) or
+            bool(self.result_filter_state["price_max"]) or
             self.result_filter_state["price_sort"] != "No Sorting"
         )
         
@@ -127,12 +168,7 @@ class ProductFilterDialog(BaseDialog):
     
     def reset_filters(self):
         """Reset all filters"""
-        self.result_filter_state = {
-            "is_active": False,
-            "category": "All Categories",
-            "availability": "All",
-            "price_sort": "No Sorting"
-        }
+        self.result_filter_state = dict(ProductFilterProxyModel.DEFAULT_FILTERS)
         self.accept()
     
     def get_filter_state(self):
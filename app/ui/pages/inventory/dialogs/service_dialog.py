@@ -1,6 +1,7 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
 import mysql.connector
 from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 from .base_dialog import BaseDialog
 from .product_selection_dialog import ProductSelectionDialog
 from ..style_factory import StyleFactory
@@ -263,6 +264,7 @@ class ServiceDialog(BaseDialog):
                 )
             
             conn.commit()
+            ReferenceCache.invalidate("services")
             cursor.close()
             
             self.accept()
@@ -0,0 +1,304 @@
+from PyQt5 import QtCore, QtGui
+from datetime import date, timedelta
+from decimal import Decimal
+
+
+class ProductTableModel(QtCore.QAbstractTableModel):
+    """Table model holding the products shown in the products tab
+
+    Rows are the Product tuples themselves, so filters and sorting compare
+    typed values instead of cell text; text is only formatted when the view
+    paints a cell. Each row also keeps a lowercase search key built once from
+    its cell texts, so a search is one substring test per row. The model
+    sorts its own rows with a single keyed sort, rather than having the
+    proxy call back into Python for every comparison.
+    """
+
+    # (header, Product field) for each column, in display order
+    COLUMNS = [
+        ("ID", "product_id"),
+        ("Name", "product_name"),
+        ("Category", "category"),
+        ("Price", "price"),
+        ("Quantity", "quantity"),
+        ("Threshold", "threshold_value"),
+        ("Expiry Date", "expiry_date"),
+        ("Availability", "availability"),
+        ("Description", "description"),
+    ]
+
+    # Columns whose stock updates change; see update_products()
+    STOCK_FIELDS = ("quantity", "availability")
+
+    CENTERED_FIELDS = ("product_id", "quantity", "threshold_value", "expiry_date", "availability")
+
+    IN_STOCK_COLOR = QtGui.QColor("#4CAF50")
+    OUT_OF_STOCK_COLOR = QtGui.QColor("#FF5252")
+
+    def __init__(self, parent=None):
+        super(ProductTableModel, self).__init__(parent)
+        self.fields = [field for _, field in self.COLUMNS]
+        self.products = []
+        self.search_keys = []
+
+        # Product ID -> row
+        self.rows = {}
+
+        # Column and order the rows are kept in; -1 keeps the loaded order
+        self.sort_column = -1
+        self.sort_order = QtCore.Qt.AscendingOrder
+
+    def set_products(self, products):
+        """Replace every row with freshly loaded products"""
+        self.beginResetModel()
+        self.products = list(products)
+        self.search_keys = [self.search_key(product) for product in self.products]
+        self.apply_order(self.sorted_rows())
+        self.endResetModel()
+
+    def sorted_rows(self):
+        """Get the current rows' indexes in the sort order; empty values always go last"""
+        rows = range(len(self.products))
+        if self.sort_column < 0:
+            return list(rows)
+
+        field = self.fields[self.sort_column]
+        filled = [row for row in rows if getattr(self.products[row], field) is not None]
+        empty = [row for row in rows if getattr(self.products[row], field) is None]
+        filled.sort(
+            key=lambda row: self.sort_key(row, self.sort_column),
+            reverse=self.sort_order == QtCore.Qt.DescendingOrder
+        )
+        return filled + empty
+
+    def apply_order(self, order):
+        """Rearrange the rows so that new row i is old row order[i]"""
+        self.products = [self.products[row] for row in order]
+        self.search_keys = [self.search_keys[row] for row in order]
+        self.rows = {product.product_id: row for row, product in enumerate(self.products)}
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        """Reorder the rows by a column, keeping persistent indexes on their products"""
+        self.sort_column = column
+        self.sort_order = order
+
+        self.layoutAboutToBeChanged.emit()
+        new_order = self.sorted_rows()
+        new_rows = {old_row: new_row for new_row, old_row in enumerate(new_order)}
+        self.apply_order(new_order)
+
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(new_rows[index.row()], index.column()) for index in old_indexes]
+        )
+        self.layoutChanged.emit()
+
+    def update_products(self, products):
+        """Replace the rows of products that are already loaded, in place
+
+        Args:
+            products (list): Product tuples, e.g. with fresh stock levels
+
+        Returns:
+            list: Products that had no row and were skipped
+        """
+        missing = []
+        first_column = self.fields.index(self.STOCK_FIELDS[0])
+        last_column = self.fields.index(self.STOCK_FIELDS[-1])
+
+        for product in products:
+            row = self.rows.get(product.product_id)
+            if row is None:
+                missing.append(product)
+                continue
+
+            self.products[row] = product
+            self.search_keys[row] = self.search_key(product)
+            self.dataChanged.emit(self.index(row, first_column), self.index(row, last_column))
+
+        # New stock levels may move rows sorted by them
+        if self.sort_column >= 0 and self.fields[self.sort_column] in self.STOCK_FIELDS:
+            self.sort(self.sort_column, self.sort_order)
+        return missing
+
+    def product_ids(self):
+        """Get the IDs of every loaded product"""
+        return self.rows.keys()
+
+    def product(self, row):
+        """Get the Product tuple of a row"""
+        return self.products[row]
+
+    def search_key(self, product):
+        """Build the lowercase text a search is matched against
+
+        Cell texts are joined with newlines, which a search term never
+        contains, so a match never spans two cells.
+        """
+        return "\n".join(
+            self.format_value(field, getattr(product, field)) for field in self.fields
+        ).lower()
+
+    def sort_key(self, row, column):
+        """Get the typed value a column sorts by; strings sort ignoring case"""
+        value = getattr(self.products[row], self.fields[column])
+        return value.lower() if isinstance(value, str) else value
+
+    @staticmethod
+    def format_value(field, value):
+        """Format a raw value for display"""
+        if field == "price":
+            return f"₱{value:.2f}" if value is not None else ""
+        if field == "expiry_date":
+            return value.strftime('%Y-%m-%d') if value else "N/A"
+        if field == "availability":
+            return "In Stock" if value else "Out of Stock"
+        return "" if value is None else str(value)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.products)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        field = self.fields[index.column()]
+        value = getattr(self.products[index.row()], field)
+
+        if role == QtCore.Qt.DisplayRole:
+            return self.format_value(field, value)
+
+        if role == QtCore.Qt.TextAlignmentRole:
+            if field == "price":
+                return int(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+            if field in self.CENTERED_FIELDS:
+                return int(QtCore.Qt.AlignCenter)
+            return None
+
+        if role == QtCore.Qt.ForegroundRole and field == "availability":
+            return self.IN_STOCK_COLOR if value else self.OUT_OF_STOCK_COLOR
+
+        if role == QtCore.Qt.UserRole:
+            return value
+
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.COLUMNS[section][0]
+        return None
+
+
+class ProductFilterProxyModel(QtCore.QSortFilterProxyModel):
+    """Filters a ProductTableModel by typed product values
+
+    Filtering follows changes to the source rows, so stock updates move rows
+    across the active filters without re-applying them. Sorting is passed on
+    to the source model, and rows keep its order.
+    """
+
+    # Filter state meaning "show every product", as kept by the products tab
+    DEFAULT_FILTERS = {
+        "is_active": False,
+        "category": "All Categories",
+        "availability": "All",
+        "stock_level": "All",
+        "expiry": "All",
+        "price_min": 0.0,
+        "price_max": 0.0,
+        "price_sort": "No Sorting"
+    }
+
+    # Days ahead that count as expiring soon
+    EXPIRY_WARNING_DAYS = 30
+
+    def __init__(self, parent=None):
+        super(ProductFilterProxyModel, self).__init__(parent)
+        self.search = ""
+        self.filters = dict(self.DEFAULT_FILTERS)
+        self.price_min = self.price_max = Decimal(0)
+        self.today = date.today()
+
+    def set_search(self, search):
+        """Show only products with a cell containing a search term, ignoring case"""
+        self.search = search.strip().lower()
+        self.refilter()
+
+    def set_filters(self, filter_state):
+        """Show only products matching a filter dialog state
+
+        Args:
+            filter_state (dict): State from the product filter dialog; missing
+                keys take their DEFAULT_FILTERS values
+        """
+        self.filters = {**self.DEFAULT_FILTERS, **filter_state}
+
+        # Bounds as Decimal once, to compare with prices as loaded
+        self.price_min = Decimal(str(self.filters["price_min"] or 0))
+        self.price_max = Decimal(str(self.filters["price_max"] or 0))
+        self.refilter()
+
+    def refilter(self):
+        """Evaluate the filters again for every row"""
+        self.today = date.today()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        if self.search and self.search not in model.search_keys[source_row]:
+            return False
+
+        filters = self.filters
+        if not filters["is_active"]:
+            return True
+
+        product = model.products[source_row]
+
+        if filters["category"] != "All Categories" and product.category != filters["category"]:
+            return False
+
+        if filters["availability"] == "In Stock" and not product.availability:
+            return False
+        if filters["availability"] == "Out of Stock" and product.availability:
+            return False
+
+        # Stock level against the product's own reorder threshold
+        stock_level = filters["stock_level"]
+        if stock_level != "All":
+            quantity = product.quantity or 0
+            threshold = product.threshold_value or 0
+            if stock_level == "Above Threshold" and quantity <= threshold:
+                return False
+            if stock_level == "Low Stock" and not 0 < quantity <= threshold:
+                return False
+            if stock_level == "Empty" and quantity > 0:
+                return False
+
+        expiry = filters["expiry"]
+        if expiry != "All":
+            expiry_date = product.expiry_date
+            if expiry == "No Expiry Date" and expiry_date is not None:
+                return False
+            if expiry == "Expired" and (expiry_date is None or expiry_date >= self.today):
+                return False
+            if expiry == "Expiring Soon" and (
+                expiry_date is None
+                or not self.today <= expiry_date <= self.today + timedelta(days=self.EXPIRY_WARNING_DAYS)
+            ):
+                return False
+
+        # A zero bound leaves that end of the range open
+        price = product.price if product.price is not None else Decimal(0)
+        if self.price_min and price < self.price_min:
+            return False
+        if self.price_max and price > self.price_max:
+            return False
+
+        return True
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
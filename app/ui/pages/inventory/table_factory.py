@@ -46,4 +46,44 @@ class TableFactory:
         table.horizontalHeader().setStretchLastSection(True)
         
         for idx, (_, width_pct) in enumerate(column_data[:-1]):
-            table.setColumnWidth(idx, int(table_width * width_pct))
\ No newline at end of file
+            table.setColumnWidth(idx, int(table_width * width_pct))
+    
+    @staticmethod
+    def create_table_view(model):
+        """Create a sortable table view over a model, styled like create_table()
+        
+        Args:
+            model: Model the view displays, usually a sort/filter proxy
+        """
+        view = QtWidgets.QTableView()
+        view.setModel(model)
+        view.setStyleSheet(StyleFactory.get_table_style())
+        view.setSelectionBehavior(QtWidgets.QTableView.SelectRows)
+        view.setEditTriggers(QtWidgets.QTableView.NoEditTriggers)
+        view.setAlternatingRowColors(False)
+        view.verticalHeader().setVisible(False)
+        view.setSortingEnabled(True)
+        view.setShowGrid(True)
+        
+        # Make columns and rows not resizable
+        view.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        view.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        view.horizontalHeader().setStretchLastSection(True)
+        
+        return view
+    
+    @staticmethod
+    def configure_view_columns(view, column_widths, screen_width):
+        """Set column widths on a table view; headers come from its model
+        
+        Args:
+            view: QTableView to configure
+            column_widths: List of width percentages, one per column
+            screen_width: Total screen width to calculate from
+        """
+        # Calculate available width
+        table_width = screen_width - 300
+        
+        # The last column stretches to fill available space
+        for idx, width_pct in enumerate(column_widths[:-1]):
+            view.setColumnWidth(idx, int(table_width * width_pct))
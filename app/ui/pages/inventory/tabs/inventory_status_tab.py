@@ -2,6 +2,7 @@ from PyQt5 import QtWidgets, QtCore, QtGui
 from app.utils.db_manager import DBManager
 import mysql.connector
 from ..table_factory import TableFactory
+from app.utils.event_bus import EventBus, StockChanged, SupplierReceived
 
 class InventoryStatusTab(QtWidgets.QWidget):
     """Tab for viewing inventory status"""
@@ -10,6 +11,9 @@ class InventoryStatusTab(QtWidgets.QWidget):
         super(InventoryStatusTab, self).__init__()
         self.parent = parent
         self.setup_ui()
+        
+        # Reload when stock moves or a delivery is received
+        EventBus.subscribe((StockChanged, SupplierReceived), lambda event: self.refresh_data(), widget=self)
     
     def setup_ui(self):
         """Set up the UI components for the inventory status tab"""
@@ -273,4 +277,9 @@ class InventoryStatusTab(QtWidgets.QWidget):
             if self.parent:
                 self.parent.show_error_message(f"Database error: {err}")
             else:
-                QtWidgets.QMessageBox.critical(self, "Error", f"Database error: {err}")
\ No newline at end of file
+                QtWidgets.QMessageBox.critical(self, "Error", f"Database error: {err}")
+    
+    def refresh_data(self):
+        """Reload the inventory table and analytics"""
+        self.load_inventory()
+        self.update_analytics()
@@ -2,6 +2,7 @@ from PyQt5 import QtWidgets, QtCore, QtGui
 from app.utils.db_manager import DBManager
 import mysql.connector
 from datetime import datetime
+from app.utils.event_bus import EventBus, StockChanged, SupplierReceived
 
 class OverviewTab(QtWidgets.QWidget):
     """Tab for displaying overall inventory dashboard"""
@@ -10,6 +11,9 @@ class OverviewTab(QtWidgets.QWidget):
         super(OverviewTab, self).__init__()
         self.parent = parent
         self.setup_ui()
+        
+        # Recompute the summary when stock moves or a delivery is received
+        EventBus.subscribe((StockChanged, SupplierReceived), lambda event: self.update_dashboard(), widget=self)
     
     def setup_ui(self):
         """Set up the UI components for the overview tab"""
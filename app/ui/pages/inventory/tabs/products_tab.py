@@ -1,10 +1,15 @@
-from PyQt5 import QtWidgets, QtCore, QtGui
+from PyQt5 import QtWidgets, QtCore
 from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 import mysql.connector
 from ..style_factory import StyleFactory
 from ..table_factory import TableFactory
 from ..control_panel_factory import ControlPanelFactory
 from ..dialogs import ProductDialog
+from ..product_table_model import ProductTableModel, ProductFilterProxyModel
+from app.utils.query_runner import QueryRunner
+from app.utils.repositories import ProductRepository
+from app.utils.event_bus import EventBus, StockChanged
 
 class ProductsTab(QtWidgets.QWidget):
     """Tab for managing products in inventory"""
@@ -12,15 +17,15 @@ class ProductsTab(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super(ProductsTab, self).__init__()
         self.parent = parent
+        self.load_task = None
+        self.stock_task = None
         # Initialize filter state storage
-        self.filter_state = {
-            "is_active": False,
-            "category": "All Categories",
-            "availability": "All",
-            "price_sort": "No Sorting"
-        }
+        self.filter_state = dict(ProductFilterProxyModel.DEFAULT_FILTERS)
         self.setup_ui()
         
+        # Update stock cells in place when sales or deliveries move stock
+        EventBus.subscribe(StockChanged, self.refresh_stock, widget=self)
+        
     def setup_ui(self):
         """Set up the UI components for the products tab"""
         self.layout = QtWidgets.QVBoxLayout(self)
@@ -44,25 +49,21 @@ class ProductsTab(QtWidgets.QWidget):
         # Store reference to filter button
         self.filter_button = self.control_layout.filter_button
         
-        # Create products table
-        self.products_table = TableFactory.create_table()
-        
-        # Define column headers and their relative widths
-        product_columns = [
-            ("ID", 0.05),
-            ("Name", 0.17),
-            ("Category", 0.10),
-            ("Price", 0.07),
-            ("Quantity", 0.07),
-            ("Threshold", 0.07),
-            ("Expiry Date", 0.11),
-            ("Availability", 0.10),
-            ("Description", 0.26)
-        ]
+        # Products live in a model; the proxy filters them for the view
+        self.products_model = ProductTableModel(self)
+        self.products_proxy = ProductFilterProxyModel(self)
+        self.products_proxy.setSourceModel(self.products_model)
+        self.products_table = TableFactory.create_table_view(self.products_proxy)
         
-        # Configure the table columns
+        # Relative column widths, in the model's column order
+        product_column_widths = [0.05, 0.17, 0.10, 0.07, 0.07, 0.07, 0.11, 0.10, 0.26]
         screen_width = QtWidgets.QApplication.desktop().screenGeometry().width()
-        TableFactory.configure_table_columns(self.products_table, product_columns, screen_width)
+        TableFactory.configure_view_columns(self.products_table, product_column_widths, screen_width)
+        
+        # Alphabetical, matching the order products are loaded in
+        self.products_table.sortByColumn(
+            self.products_model.fields.index("product_name"), QtCore.Qt.AscendingOrder
+        )
         
         # Add context menu to the table
         self.products_table.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
@@ -76,109 +77,86 @@ class ProductsTab(QtWidgets.QWidget):
         self.filter_indicator.setVisible(False)
         self.layout.addWidget(self.filter_indicator)
     
-    def load_products(self, preserve_filter=False):
-        """Load products from the database and populate the table"""
-        try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            
-            # Remember the filter state if needed
-            filter_was_active = self.filter_state["is_active"] if preserve_filter else False
-            
-            # Clear existing items and reset table state completely
-            self.products_table.clearContents()
-            self.products_table.setRowCount(0)
-            
-            # Reset search filter (but preserve filter state)
-            self.search_input.blockSignals(True)
-            self.search_input.clear()
-            self.search_input.blockSignals(False)
-            
-            # Query for all products
-            cursor.execute("SELECT * FROM products ORDER BY product_name")
-            products = cursor.fetchall()
-            
-            # Populate the table
-            self.products_table.setRowCount(len(products))
-            
-            for row, product in enumerate(products):
-                # Set item with proper alignment
-                id_item = QtWidgets.QTableWidgetItem(str(product['product_id']))
-                id_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                self.products_table.setItem(row, 0, id_item)
-                
-                self.products_table.setItem(row, 1, QtWidgets.QTableWidgetItem(product['product_name']))
-                self.products_table.setItem(row, 2, QtWidgets.QTableWidgetItem(product.get('category', '')))
-                
-                price_item = QtWidgets.QTableWidgetItem(f"₱{product['price']:.2f}")
-                price_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-                self.products_table.setItem(row, 3, price_item)
-                
-                # Quantity with center alignment
-                qty_item = QtWidgets.QTableWidgetItem(str(product['quantity']))
-                qty_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                self.products_table.setItem(row, 4, qty_item)
-                
-                # Threshold with center alignment
-                threshold_item = QtWidgets.QTableWidgetItem(str(product.get('threshold_value', 0)))
-                threshold_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                self.products_table.setItem(row, 5, threshold_item)
-                
-                # Format expiry date
-                expiry_date = product.get('expiry_date')
-                expiry_str = expiry_date.strftime('%Y-%m-%d') if expiry_date else "N/A"
-                expiry_item = QtWidgets.QTableWidgetItem(expiry_str)
-                expiry_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                self.products_table.setItem(row, 6, expiry_item)
-                
-                # Format availability with color indicators
-                availability = "In Stock" if product.get('availability', True) else "Out of Stock"
-                availability_item = QtWidgets.QTableWidgetItem(availability)
-                availability_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                
-                # Set color based on availability
-                if product.get('availability', True):
-                    availability_item.setForeground(QtGui.QColor("#4CAF50")) 
-                else:
-                    availability_item.setForeground(QtGui.QColor("#FF5252")) 
-                    
-                self.products_table.setItem(row, 7, availability_item)
-                
-                # Description
-                self.products_table.setItem(row, 8, QtWidgets.QTableWidgetItem(product.get('description', '')))
-            
-            cursor.close()
-            
-            # Re-apply filters only if we need to preserve them
-            if filter_was_active and preserve_filter:
-                self.apply_stored_filters()
-            
-        except mysql.connector.Error as err:
-            if self.parent:
-                self.parent.show_error_message(f"Database error: {err}")
-            else:
-                QtWidgets.QMessageBox.critical(self, "Error", f"Database error: {err}")
+    def load_products(self):
+        """Load products in the background and populate the table"""
+        # Reset search filter (but preserve filter state)
+        self.search_input.blockSignals(True)
+        self.search_input.clear()
+        self.search_input.blockSignals(False)
+        self.products_proxy.set_search("")
+        
+        self.reload_products()
+    
+    def reload_products(self):
+        """Fetch every product in the background; the search and filters stay applied"""
+        # Drop any load still in flight so a stale result never lands last
+        if self.load_task:
+            self.load_task.cancel()
+        
+        self.load_task = QueryRunner.submit(
+            ProductRepository.all,
+            on_result=self.populate_products,
+            on_error=self.show_load_error
+        )
+    
+    def populate_products(self, products):
+        """Replace the model's rows with products fetched by the query runner"""
+        self.load_task = None
+        self.products_model.set_products(products)
+    
+    def refresh_stock(self, event):
+        """Refresh only the products named by a StockChanged event"""
+        # A full load already in flight will pick up the change
+        if self.load_task:
+            return
+        
+        if event.product_ids is not None and not event.product_ids:
+            return
+        
+        # Unknown or new products change the row set, so reload in full
+        if event.product_ids is None or not event.product_ids <= self.products_model.product_ids():
+            self.reload_products()
+            return
+        
+        if self.stock_task:
+            self.stock_task.cancel()
+        
+        product_ids = tuple(event.product_ids)
+        self.stock_task = QueryRunner.submit(
+            lambda conn: ProductRepository.by_ids(conn, product_ids),
+            on_result=self.update_stock_rows,
+            on_error=self.show_load_error
+        )
+    
+    def update_stock_rows(self, products):
+        """Update the rows of fetched products in place; the proxy re-sorts and re-filters them"""
+        self.stock_task = None
+        self.products_model.update_products(products)
+    
+    def show_load_error(self, message):
+        """Report a failed background load"""
+        self.load_task = None
+        if self.parent:
+            self.parent.show_error_message(f"Database error: {message}")
+        else:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Database error: {message}")
     
     def filter_products(self):
         """Filter products based on search input"""
-        search_text = self.search_input.text().lower()
-        
-        for row in range(self.products_table.rowCount()):
-            match_found = False
-            
-            for col in range(self.products_table.columnCount()):
-                item = self.products_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    match_found = True
-                    break
-            
-            # Show/hide row based on match
-            self.products_table.setRowHidden(row, not match_found)
+        self.products_proxy.set_search(self.search_input.text())
     
     def apply_stored_filters(self):
-        """Apply stored filters to the table"""
+        """Apply stored filters to the table
+        
+        Returns:
+            bool: True if any product matches, or none are loaded
+        """
         category = self.filter_state["category"]
         availability = self.filter_state["availability"]
+        stock_level = self.filter_state["stock_level"]
+        expiry = self.filter_state["expiry"]
+        price_min = self.filter_state["price_min"]
+        price_max = self.filter_state["price_max"]
         price_sort = self.filter_state["price_sort"]
         
         # Update the filter indicator text
@@ -187,6 +165,12 @@ class ProductsTab(QtWidgets.QWidget):
             filter_text.append(f"Category: {category}")
         if availability != "All":
             filter_text.append(f"Status: {availability}")
+        if stock_level != "All":
+            filter_text.append(f"Stock: {stock_level}")
+        if expiry != "All":
+            filter_text.append(f"Expiry: {expiry}")
+        if price_min or price_max:
+            filter_text.append(f"Price: ₱{price_min:,.2f} - " + (f"₱{price_max:,.2f}" if price_max else "any"))
         if price_sort != "No Sorting":
             filter_text.append(f"Price: {price_sort}")
             
@@ -196,62 +180,37 @@ class ProductsTab(QtWidgets.QWidget):
         else:
             self.filter_indicator.setVisible(False)
         
-        # Track if any row is visible
-        rows_visible = False
-        
-        # First apply filters
-        for row in range(self.products_table.rowCount()):
-            show_row = True
-            
-            # Apply category filter
-            if category != "All Categories":
-                category_cell = self.products_table.item(row, 2)
-                if category_cell is None or category_cell.text() != category:
-                    show_row = False
-            
-            # Apply availability filter
-            if availability != "All" and show_row:
-                availability_cell = self.products_table.item(row, 7)
-                if availability_cell is None:
-                    show_row = False
-                else:
-                    availability_text = availability_cell.text()
-                    if (availability == "In Stock" and availability_text != "In Stock") or \
-                       (availability == "Out of Stock" and availability_text != "Out of Stock"):
-                        show_row = False
-            
-            # Show/hide row based on filters
-            self.products_table.setRowHidden(row, not show_row)
-            
-            # Track if at least one row is visible
-            if show_row:
-                rows_visible = True
-        
-        # Show a message if no results are found
-        if not rows_visible and self.products_table.rowCount() > 0:
-            QtWidgets.QMessageBox.information(self, "No Results", 
-                "No products match the current filters. Try adjusting your filter criteria.")
+        # The proxy evaluates the filters against the typed values in the model
+        self.products_proxy.set_filters(self.filter_state)
         
         # Then apply sorting if selected
         if price_sort != "No Sorting":
-            # Use the built-in sort functionality with the correct column and order
             order = QtCore.Qt.AscendingOrder if price_sort == "Lowest - Highest" else QtCore.Qt.DescendingOrder
-            self.products_table.sortItems(3, order)
+            self.products_table.sortByColumn(self.products_model.fields.index("price"), order)
             
         # Update button appearance
         if self.filter_state["is_active"]:
             self.filter_button.setStyleSheet(StyleFactory.get_active_filter_button_style())
         else:
-            self.filter_button.setStyleSheet(StyleFactory.get_button_style(secondary=True)) 
+            self.filter_button.setStyleSheet(StyleFactory.get_button_style(secondary=True))
+        
+        return self.products_proxy.rowCount() > 0 or self.products_model.rowCount() == 0
+    
+    def selected_product(self):
+        """Get the Product tuple of the current row, or None"""
+        index = self.products_table.currentIndex()
+        if not index.isValid():
+            return None
+        return self.products_model.product(self.products_proxy.mapToSource(index).row())
     
     def show_context_menu(self, position):
         """Show context menu for product actions"""
         context_menu = QtWidgets.QMenu()
         
-        # Get the current row
-        current_row = self.products_table.currentRow()
+        # Get the current product
+        product = self.selected_product()
         
-        if current_row >= 0:
+        if product:
             edit_action = context_menu.addAction("Edit")
             delete_action = context_menu.addAction("Delete")
             
@@ -259,22 +218,19 @@ class ProductsTab(QtWidgets.QWidget):
             action = context_menu.exec_(self.products_table.mapToGlobal(position))
             
             if action == edit_action:
-                self.edit_product(current_row)
+                self.edit_product(product)
             elif action == delete_action:
-                self.delete_product(current_row)
+                self.delete_product(product)
     
     def show_add_product_dialog(self):
         """Show dialog to add a new product"""
         dialog = ProductDialog(self.parent or self)
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
             self.load_products()
-            # Reset row visibility
-            for row in range(self.products_table.rowCount()):
-                self.products_table.setRowHidden(row, False)
     
-    def edit_product(self, row):
+    def edit_product(self, selected):
         """Edit the selected product"""
-        product_id = int(self.products_table.item(row, 0).text())
+        product_id = selected.product_id
         
         try:
             conn = DBManager.get_connection()
@@ -287,10 +243,6 @@ class ProductsTab(QtWidgets.QWidget):
                 dialog = ProductDialog(self.parent or self, product)
                 if dialog.exec_() == QtWidgets.QDialog.Accepted:
                     self.load_products()
-                    
-            # Reset row visibility
-            for row in range(self.products_table.rowCount()):
-                self.products_table.setRowHidden(row, False)
             
             cursor.close()
             
@@ -300,10 +252,10 @@ class ProductsTab(QtWidgets.QWidget):
             else:
                 QtWidgets.QMessageBox.critical(self, "Error", f"Database error: {err}")
     
-    def delete_product(self, row):
+    def delete_product(self, selected):
         """Delete the selected product"""
-        product_id = int(self.products_table.item(row, 0).text())
-        product_name = self.products_table.item(row, 1).text()
+        product_id = selected.product_id
+        product_name = selected.product_name
         
         # Confirm deletion
         confirm = QtWidgets.QMessageBox.question(
@@ -326,6 +278,7 @@ class ProductsTab(QtWidgets.QWidget):
                 cursor.execute("DELETE FROM products WHERE product_id = %s", (product_id,))
                 
                 conn.commit()
+                ReferenceCache.invalidate("products", "inventory_status")
                 cursor.close()
                 
                 # Refresh the product list
@@ -349,107 +302,8 @@ class ProductsTab(QtWidgets.QWidget):
                     QtWidgets.QMessageBox.critical(self, "Error", f"Database error: {err}")
     
     def rebuild_table(self):
-        """Completely rebuild the table with fresh data"""
-        # Store current filter state
-        was_filtered = self.filter_state["is_active"]
-        filter_state_copy = self.filter_state.copy()
-        
-        # Reset filter state temporarily
-        self.filter_state = {
-            "is_active": False,
-            "category": "All Categories",
-            "availability": "All",
-            "price_sort": "No Sorting"
-        }
-        
-        try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            
-            # Query for all products
-            cursor.execute("SELECT * FROM products ORDER BY product_name")
-            products = cursor.fetchall()
-            
-            # Create and configure a new table from scratch
-            new_table = TableFactory.create_table()
-            product_columns = [
-                ("ID", 0.05),
-                ("Name", 0.17),
-                ("Category", 0.10),
-                ("Price", 0.07),
-                ("Quantity", 0.07),
-                ("Threshold", 0.07),
-                ("Expiry Date", 0.11),
-                ("Availability", 0.10),
-                ("Description", 0.26)
-            ]
-            screen_width = QtWidgets.QApplication.desktop().screenGeometry().width()
-            TableFactory.configure_table_columns(new_table, product_columns, screen_width)
-            
-            # Set up context menu for the new table
-            new_table.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
-            new_table.customContextMenuRequested.connect(self.show_context_menu)
-            
-            # Populate the new table
-            new_table.setRowCount(len(products))
-            
-            for row, product in enumerate(products):
-                id_item = QtWidgets.QTableWidgetItem(str(product['product_id']))
-                id_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                new_table.setItem(row, 0, id_item)
-                
-                new_table.setItem(row, 1, QtWidgets.QTableWidgetItem(product['product_name']))
-                new_table.setItem(row, 2, QtWidgets.QTableWidgetItem(product.get('category', '')))
-                
-                price_item = QtWidgets.QTableWidgetItem(f"₱{product['price']:.2f}")
-                price_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-                new_table.setItem(row, 3, price_item)
-                
-                qty_item = QtWidgets.QTableWidgetItem(str(product['quantity']))
-                qty_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                new_table.setItem(row, 4, qty_item)
-                
-                threshold_item = QtWidgets.QTableWidgetItem(str(product.get('threshold_value', 0)))
-                threshold_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                new_table.setItem(row, 5, threshold_item)
-                
-                expiry_date = product.get('expiry_date')
-                expiry_str = expiry_date.strftime('%Y-%m-%d') if expiry_date else "N/A"
-                expiry_item = QtWidgets.QTableWidgetItem(expiry_str)
-                expiry_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                new_table.setItem(row, 6, expiry_item)
-                
-                availability = "In Stock" if product.get('availability', True) else "Out of Stock"
-                availability_item = QtWidgets.QTableWidgetItem(availability)
-                availability_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                
-                if product.get('availability', True):
-                    availability_item.setForeground(QtGui.QColor("#4CAF50"))
-                else:
-                    availability_item.setForeground(QtGui.QColor("#FF5252"))
-                
-                new_table.setItem(row, 7, availability_item)
-                new_table.setItem(row, 8, QtWidgets.QTableWidgetItem(product.get('description', '')))
-        
-            # Replace the old table with the new one
-            old_table = self.products_table
-            self.layout.replaceWidget(old_table, new_table)
-            self.products_table = new_table
-            old_table.deleteLater()
-            
-            cursor.close()
-            
-            # Restore filter state if necessary
-            if was_filtered:
-                self.filter_state = filter_state_copy
-                # Add a short delay before applying filters to ensure table is fully rendered
-                QtCore.QTimer.singleShot(5, self.apply_stored_filters)
-        
-        except mysql.connector.Error as err:
-            if self.parent:
-                self.parent.show_error_message(f"Database error: {err}")
-            else:
-                QtWidgets.QMessageBox.critical(self, "Error", f"Database error: {err}")
+        """Reload the table with fresh data, keeping the search and filters"""
+        self.reload_products()
     
     def show_product_filter_dialog(self):
         """Show advanced filter dialog for products"""
@@ -457,29 +311,8 @@ class ProductsTab(QtWidgets.QWidget):
         
         filter_dialog = ProductFilterDialog(self, self.filter_state)
         if filter_dialog.exec_() == QtWidgets.QDialog.Accepted:
-            # Get the filter state from the dialog
-            new_filter_state = filter_dialog.get_filter_state()
-            
-            # Check if filters were reset
-            if not new_filter_state["is_active"] and self.filter_state["is_active"]:
-                # Filters were reset
-                self.filter_state = new_filter_state
-                self.filter_indicator.setVisible(False)
-                self.filter_button.setStyleSheet(StyleFactory.get_button_style(secondary=True))
-                
-                # Completely rebuild the table
-                QtCore.QTimer.singleShot(50, self.rebuild_table)
-            else:
-                # Regular filter applied
-                self.filter_state = new_filter_state
-                
-                # Apply filters after dialog is closed
-                if self.filter_state["is_active"]:
-                    QtCore.QTimer.singleShot(50, self.apply_stored_filters)
-                    # Show filter indicator
-                    self.filter_indicator.setVisible(True)
-                    # Use the same blue button style
-                    self.filter_button.setStyleSheet(StyleFactory.get_active_filter_button_style())
-                else:
-                    self.filter_indicator.setVisible(False)
-                    self.filter_button.setStyleSheet(StyleFactory.get_button_style(secondary=True))
\ No newline at end of file
+            # Filtering is immediate, so there is no need to wait for the dialog to close
+            self.filter_state = filter_dialog.get_filter_state()
+            if not self.apply_stored_filters():
+                QtWidgets.QMessageBox.information(self, "No Results", 
+                    "No products match the current filters. Try adjusting your filter criteria.")
@@ -1,5 +1,7 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
 from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
+from app.utils.repositories import ServiceRepository
 import mysql.connector
 from ..style_factory import StyleFactory
 from ..table_factory import TableFactory
@@ -78,7 +80,6 @@ class ServicesTab(QtWidgets.QWidget):
         """Load services from the database and populate the table"""
         try:
             conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
             
             # Clear existing items and reset table state completely
             self.services_table.clearContents()
@@ -90,33 +91,32 @@ class ServicesTab(QtWidgets.QWidget):
             self.search_input.blockSignals(False)
             
             # Query for all services
-            cursor.execute("SELECT * FROM services ORDER BY service_name")
-            services = cursor.fetchall()
+            services = ServiceRepository.all(conn)
             
             # Populate the table
             self.services_table.setRowCount(len(services))
             
             for row, service in enumerate(services):
                 # Set item with proper alignment
-                id_item = QtWidgets.QTableWidgetItem(str(service['service_id']))
+                id_item = QtWidgets.QTableWidgetItem(str(service.service_id))
                 id_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 self.services_table.setItem(row, 0, id_item)
                 
-                self.services_table.setItem(row, 1, QtWidgets.QTableWidgetItem(service['service_name']))
-                self.services_table.setItem(row, 2, QtWidgets.QTableWidgetItem(service.get('category', '')))
+                self.services_table.setItem(row, 1, QtWidgets.QTableWidgetItem(service.service_name))
+                self.services_table.setItem(row, 2, QtWidgets.QTableWidgetItem(service.category))
                 
                 # Price with better formatting and alignment
-                price_item = QtWidgets.QTableWidgetItem(f"₱{service['price']:.2f}")
+                price_item = QtWidgets.QTableWidgetItem(f"₱{service.price:.2f}")
                 price_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
                 self.services_table.setItem(row, 3, price_item)
                 
                 # Availability
-                availability_status = "Available" if service.get('availability', 0) else "Unavailable"
+                availability_status = "Available" if service.availability else "Unavailable"
                 availability_item = QtWidgets.QTableWidgetItem(availability_status)
                 availability_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 
                 # Set color based on availability
-                if service.get('availability', 0):
+                if service.availability:
                     availability_item.setForeground(QtGui.QColor(0, 170, 0))  # Green for available
                 else:
                     availability_item.setForeground(QtGui.QColor(200, 0, 0))  # Red for unavailable
@@ -124,10 +124,8 @@ class ServicesTab(QtWidgets.QWidget):
                 self.services_table.setItem(row, 4, availability_item)
                 
                 # Description
-                self.services_table.setItem(row, 5, QtWidgets.QTableWidgetItem(service.get('description', '')))
+                self.services_table.setItem(row, 5, QtWidgets.QTableWidgetItem(service.description))
     
-            cursor.close()
-            
             # Re-apply any active filters after loading data
             if self.filter_state["is_active"]:
                 self.apply_stored_filters()
@@ -332,6 +330,7 @@ class ServicesTab(QtWidgets.QWidget):
                 cursor.execute("DELETE FROM services WHERE service_id = %s", (service_id,))
                 
                 conn.commit()
+                ReferenceCache.invalidate("services")
                 cursor.close()
                 
                 # Refresh the service list
@@ -370,11 +369,9 @@ class ServicesTab(QtWidgets.QWidget):
         
         try:
             conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
             
             # Query for all services
-            cursor.execute("SELECT * FROM services ORDER BY service_name")
-            services = cursor.fetchall()
+            services = ServiceRepository.all(conn)
             
             # Create and configure a new table from scratch
             new_table = TableFactory.create_table()
@@ -397,24 +394,24 @@ class ServicesTab(QtWidgets.QWidget):
             new_table.setRowCount(len(services))
             
             for row, service in enumerate(services):
-                id_item = QtWidgets.QTableWidgetItem(str(service['service_id']))
+                id_item = QtWidgets.QTableWidgetItem(str(service.service_id))
                 id_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 new_table.setItem(row, 0, id_item)
                 
-                new_table.setItem(row, 1, QtWidgets.QTableWidgetItem(service['service_name']))
-                new_table.setItem(row, 2, QtWidgets.QTableWidgetItem(service.get('category', '')))
+                new_table.setItem(row, 1, QtWidgets.QTableWidgetItem(service.service_name))
+                new_table.setItem(row, 2, QtWidgets.QTableWidgetItem(service.category))
                 
-                price_item = QtWidgets.QTableWidgetItem(f"₱{service['price']:.2f}")
+                price_item = QtWidgets.QTableWidgetItem(f"₱{service.price:.2f}")
                 price_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
                 new_table.setItem(row, 3, price_item)
                 
                 # Availability
-                availability_status = "Available" if service.get('availability', 0) else "Unavailable"
+                availability_status = "Available" if service.availability else "Unavailable"
                 availability_item = QtWidgets.QTableWidgetItem(availability_status)
                 availability_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 
                 # Set color based on availability
-                if service.get('availability', 0):
+                if service.availability:
                     availability_item.setForeground(QtGui.QColor(0, 170, 0))  # Green for available
                 else:
                     availability_item.setForeground(QtGui.QColor(200, 0, 0))  # Red for unavailable
@@ -422,7 +419,7 @@ class ServicesTab(QtWidgets.QWidget):
                 new_table.setItem(row, 4, availability_item)
                 
                 # Description
-                new_table.setItem(row, 5, QtWidgets.QTableWidgetItem(service.get('description', '')))
+                new_table.setItem(row, 5, QtWidgets.QTableWidgetItem(service.description))
         
             # Replace the old table with the new one
             old_table = self.services_table
@@ -430,8 +427,6 @@ class ServicesTab(QtWidgets.QWidget):
             self.services_table = new_table
             old_table.deleteLater()
             
-            cursor.close()
-            
             # Restore filter state if necessary
             if was_filtered:
                 self.filter_state = filter_state_copy
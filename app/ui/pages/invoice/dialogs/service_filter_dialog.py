@@ -1,6 +1,6 @@
 from PyQt5 import QtWidgets, QtCore
 import mysql.connector
-from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 from app.ui.pages.inventory.dialogs.base_dialog import BaseDialog
 
 class ServiceFilterDialog(BaseDialog):
@@ -30,13 +30,7 @@ class ServiceFilterDialog(BaseDialog):
         
         # Get unique categories
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT DISTINCT category FROM services WHERE category IS NOT NULL AND category != '' AND availability = 1")
-            categories = cursor.fetchall()
-            for category in categories:
-                self.category_combo.addItem(category['category'])
-            cursor.close()
+            self.category_combo.addItems(ReferenceCache.get("available_service_categories"))
         except mysql.connector.Error:
             pass
         
@@ -1,13 +1,25 @@
 from PyQt5 import QtWidgets, QtCore
 from ..control_panel_factory import ControlPanelFactory
 from ..style_factory import StyleFactory
+from app.utils.query_runner import QueryRunner
+from app.utils.repositories import CustomerRepository
 
 class CustomerTab(QtWidgets.QWidget):
     """Tab for entering customer information"""
     
+    # Milliseconds of typing pause before returning customers are looked up
+    SUGGESTION_DELAY_MS = 250
+    
+    # Returning customers offered at once
+    SUGGESTION_LIMIT = 8
+    
     def __init__(self, parent=None):
         super(CustomerTab, self).__init__()
         self.parent = parent
+        self.suggestion_task = None
+        
+        # Suggestion text -> Customer profile, for the last lookup
+        self.suggestions = {}
         self.setup_ui()
     
     def setup_ui(self):
@@ -142,9 +154,85 @@ class CustomerTab(QtWidgets.QWidget):
         self.name_input.textChanged.connect(self.validate_inputs)
         self.phone_input.textChanged.connect(self.validate_inputs)
         
+        # Suggest returning customers as the name or phone is typed
+        self.suggestion_timer = QtCore.QTimer(self)
+        self.suggestion_timer.setSingleShot(True)
+        self.suggestion_timer.setInterval(self.SUGGESTION_DELAY_MS)
+        self.suggestion_timer.timeout.connect(self.load_suggestions)
+        self.suggestion_input = None
+        
+        for line_edit in (self.name_input, self.phone_input):
+            completer = QtWidgets.QCompleter(QtCore.QStringListModel(self), self)
+            # The lookup already matched by prefix, so show every suggestion
+            completer.setCompletionMode(QtWidgets.QCompleter.UnfilteredPopupCompletion)
+            completer.activated[str].connect(self.select_suggestion)
+            line_edit.setCompleter(completer)
+            line_edit.textEdited.connect(lambda text, line_edit=line_edit: self.queue_suggestions(line_edit))
+        
         # Initial validation
         self.validate_inputs()
     
+    def queue_suggestions(self, line_edit):
+        """Restart the suggestion delay after the name or phone is typed"""
+        self.suggestion_input = line_edit
+        self.suggestion_timer.start()
+    
+    def load_suggestions(self):
+        """Look up returning customers matching the input being typed"""
+        line_edit = self.suggestion_input
+        text = line_edit.text().strip()
+        
+        # A newer lookup supersedes one still in flight
+        if self.suggestion_task:
+            self.suggestion_task.cancel()
+        
+        if not text:
+            self.suggestion_task = None
+            return
+        
+        self.suggestion_task = QueryRunner.submit(
+            lambda conn: CustomerRepository.matching(conn, text, limit=self.SUGGESTION_LIMIT),
+            on_result=lambda customers: self.show_suggestions(line_edit, customers),
+            on_error=lambda message: print(f"Customer lookup failed: {message}")
+        )
+    
+    def show_suggestions(self, line_edit, customers):
+        """Offer the returning customers found for an input"""
+        self.suggestion_task = None
+        
+        self.suggestions = {}
+        for customer in customers:
+            if line_edit is self.phone_input:
+                text = f"{customer.customer_phone} - {customer.customer_name}"
+            else:
+                text = f"{customer.customer_name} - {customer.customer_phone}"
+            self.suggestions[text] = customer
+        
+        completer = line_edit.completer()
+        completer.model().setStringList(list(self.suggestions))
+        if self.suggestions and line_edit.hasFocus():
+            completer.complete()
+    
+    def select_suggestion(self, text):
+        """Fill the form from the chosen returning customer"""
+        customer = self.suggestions.get(text)
+        if customer is None:
+            return
+        
+        # The completer writes the suggestion text into the input first; replace it afterwards
+        QtCore.QTimer.singleShot(0, lambda: self.fill_customer(customer))
+    
+    def fill_customer(self, customer):
+        """Fill the form with a customer's latest details"""
+        self.name_input.setText(customer.customer_name)
+        self.phone_input.setText(customer.customer_phone)
+        self.city_input.setText(customer.customer_city or "")
+        
+        gender_radios = {"Male": self.male_radio, "Female": self.female_radio, "Other": self.other_radio}
+        radio = gender_radios.get(customer.customer_gender)
+        if radio:
+            radio.setChecked(True)
+    
     def validate_inputs(self):
         """Validate form inputs and enable/disable continue button"""
         has_name = len(self.name_input.text().strip()) > 0
@@ -185,6 +273,8 @@ class CustomerTab(QtWidgets.QWidget):
         self.name_input.clear()
         self.phone_input.clear()
         self.city_input.clear()
+        self.suggestion_timer.stop()
+        self.suggestions = {}
         
         # Uncheck all gender radio buttons
         self.male_radio.setChecked(False)
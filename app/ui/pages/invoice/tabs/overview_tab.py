@@ -3,8 +3,9 @@ from PyQt5.QtWidgets import QSizePolicy      # << add this
 from ..control_panel_factory import ControlPanelFactory
 from ..style_factory import StyleFactory
 from ..dialogs.payment_dialog import PaymentDialog
-import random
 from datetime import datetime
+import mysql.connector
+from app.utils.sequence_allocator import SequenceAllocator
 
 class OverviewTab(QtWidgets.QWidget):
     """Tab for reviewing the invoice before finalizing"""
@@ -323,10 +324,12 @@ class OverviewTab(QtWidgets.QWidget):
         # Update transaction info
         transaction_id = data.get("transaction_id", "")
         if not transaction_id:
-            # Generate if not exists
-            now = datetime.now()
-            transaction_id = f"TXN-{now.strftime('%Y%m%d')}-{random.randint(10000, 99999)}"
-            data["transaction_id"] = transaction_id
+            # Generate if not exists; finalizing retries if the database is unreachable
+            try:
+                transaction_id = SequenceAllocator.transaction_id()
+                data["transaction_id"] = transaction_id
+            except mysql.connector.Error as err:
+                print(f"Could not allocate a transaction ID: {err}")
         
         self.transaction_id_label.setText(f"ID: {transaction_id}")
         
@@ -398,17 +401,18 @@ class OverviewTab(QtWidgets.QWidget):
         notes = self.notes_text_edit.toPlainText().strip()
         self.parent.invoice_data["notes"] = notes
             
-        # Generate a simple OR number (in a real system, this would be more sophisticated)
-        now = datetime.now()
-        or_number = f"OR-{now.strftime('%Y%m%d')}-{random.randint(1000, 9999)}"
+        # Issue the OR number, and the transaction ID if not already issued, from this terminal's reserved block
+        try:
+            or_number = SequenceAllocator.or_number()
+            if not self.parent.invoice_data.get("transaction_id"):
+                self.parent.invoice_data["transaction_id"] = SequenceAllocator.transaction_id()
+        except mysql.connector.Error as err:
+            QtWidgets.QMessageBox.warning(self, "Database Error", f"Failed to issue an OR number: {err}")
+            return
         
         # Save OR number to invoice data
         self.parent.invoice_data["or_number"] = or_number
         
-        # Generate transaction ID if not already generated
-        if not self.parent.invoice_data.get("transaction_id"):
-            self.parent.invoice_data["transaction_id"] = f"TXN-{now.strftime('%Y%m%d')}-{random.randint(10000, 99999)}"
-        
         # Enable receipt tab and switch to it
         self.parent.enable_next_tab(3)
         self.parent.tabs.setCurrentIndex(4)
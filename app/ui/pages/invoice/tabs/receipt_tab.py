@@ -1,7 +1,13 @@
 from PyQt5 import QtWidgets, QtCore, QtGui, QtPrintSupport
 from ..control_panel_factory import ControlPanelFactory
 import datetime
-import random
+import mysql.connector
+from app.utils.event_bus import EventBus, TransactionCreated, StockChanged
+from app.utils.customer_profiles import CustomerProfiles
+from app.utils.inventory_updater import InventoryUpdater
+from app.utils.sales_rollup import SalesRollup
+from app.utils.sequence_allocator import SequenceAllocator
+from app.utils.transaction_lines import TransactionLines
 
 class ReceiptTab(QtWidgets.QWidget):
     """Tab for displaying and printing the final receipt"""
@@ -331,7 +337,10 @@ class ReceiptTab(QtWidgets.QWidget):
         
         # Generate transaction ID if not present
         if not data.get("transaction_id"):
-            data["transaction_id"] = f"TXN-{datetime.datetime.now().strftime('%Y%m%d')}-{random.randint(10000, 99999)}"
+            try:
+                data["transaction_id"] = SequenceAllocator.transaction_id()
+            except mysql.connector.Error as err:
+                print(f"Could not allocate a transaction ID: {err}")
         
         # Update receipt information
         current_datetime = datetime.datetime.now()
@@ -500,9 +509,6 @@ class ReceiptTab(QtWidgets.QWidget):
             if not all([services, customer, payment, data.get("or_number")]):
                 return
             
-            conn = DBManager.get_connection()
-            cursor = conn.cursor()
-            
             base_amount = sum(float(service.get('price', 0)) for service in services)
             discount_percentage = float(payment.get('discount_percentage', 0))
             discount_amount = base_amount * (discount_percentage / 100)
@@ -510,127 +516,93 @@ class ReceiptTab(QtWidgets.QWidget):
             
             user_id = self.parent.user_info.get('user_id') if hasattr(self.parent, 'user_info') and self.parent.user_info else None
             
-            # Insert transaction
-            cursor.execute("""
-                INSERT INTO transactions (
-                    transaction_id, or_number, service_id, customer_name, customer_phone,
-                    customer_gender, customer_city, payment_method, discount_percentage,
-                    discount_amount, base_amount, total_amount, coupon_code, notes, created_by
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                )
-            """, (
-                data["transaction_id"],
-                data["or_number"],
-                services[0].get("service_id"),  # Assuming first service for transaction
-                customer.get("name"),
-                customer.get("phone"),
-                customer.get("gender"),
-                customer.get("city"),
-                payment.get("method"),
-                discount_percentage,
-                discount_amount,
-                base_amount,
-                total_amount,
-                payment.get("coupon_code"),
-                notes,  # Add notes to database
-                user_id
-            ))
+            # One timestamp for the sale row and the customer's visit, whole
+            # seconds as the DATETIME column stores it
+            transaction_date = datetime.datetime.now().replace(microsecond=0)
             
-            # Deduct inventory for products used in services
-            service_ids = [service.get("service_id") for service in services if service.get("service_id")]
-            if service_ids:
-                # Get all products used in the services
-                cursor_dict = conn.cursor(dictionary=True)
-                query = """
-                    SELECT sp.product_id, sp.quantity, p.product_name, p.quantity as current_stock
-                    FROM service_products sp
-                    JOIN products p ON sp.product_id = p.product_id
-                    WHERE sp.service_id IN (%s)
-                """ % ','.join(['%s'] * len(service_ids))
-                cursor_dict.execute(query, tuple(service_ids))
-                products_to_deduct = cursor_dict.fetchall()
-                cursor_dict.close()
-                
-                # Update inventory for each product
-                for product in products_to_deduct:
-                    new_quantity = max(0, product['current_stock'] - product['quantity'])
-                    
-                    # Update product quantity
+            # A leased connection: if any step fails, the whole sale is rolled
+            # back when the block exits and no product locks stay held
+            with DBManager.connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    # Insert transaction
                     cursor.execute("""
-                        UPDATE products 
-                        SET quantity = %s, 
-                            availability = CASE WHEN %s <= 0 THEN 0 ELSE 1 END
-                        WHERE product_id = %s
-                    """, (new_quantity, new_quantity, product['product_id']))
+                        INSERT INTO transactions (
+                            transaction_id, or_number, service_id, customer_name, customer_phone, phone_key,
+                            customer_gender, customer_city, payment_method, discount_percentage,
+                            discount_amount, base_amount, total_amount, coupon_code, notes, created_by,
+                            transaction_date
+                        ) VALUES (
+                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                        )
+                    """, (
+                        data["transaction_id"],
+                        data["or_number"],
+                        services[0].get("service_id"),  # Primary service; every service gets a transaction line
+                        customer.get("name"),
+                        customer.get("phone"),
+                        CustomerProfiles.normalize_phone(customer.get("phone")),
+                        customer.get("gender"),
+                        customer.get("city"),
+                        payment.get("method"),
+                        discount_percentage,
+                        discount_amount,
+                        base_amount,
+                        total_amount,
+                        payment.get("coupon_code"),
+                        notes,  # Add notes to database
+                        user_id,
+                        transaction_date
+                    ))
                     
-                    # Update inventory table
-                    cursor.execute("""
-                        INSERT INTO inventory (product_id, quantity, status, last_updated) 
-                        VALUES (%s, %s, %s, NOW())
-                        ON DUPLICATE KEY UPDATE 
-                        quantity = VALUES(quantity),
-                        status = VALUES(status),
-                        last_updated = NOW()
-                    """, (product['product_id'], new_quantity, "Used in Service"))
+                    # Keep the customer's profile in step with the sale, in the same transaction
+                    CustomerProfiles.record_visits(cursor, [(
+                        customer.get("name"),
+                        customer.get("phone"),
+                        customer.get("gender"),
+                        customer.get("city"),
+                        [service.get("service_id") for service in services],
+                        total_amount,
+                        transaction_date
+                    )])
                     
-                    print(f"Deducted {product['quantity']} units of {product['product_name']} from inventory")
-            
-            conn.commit()
-            cursor.close()
+                    # One line per selected service, so service reports count all of them
+                    TransactionLines.record(cursor, data["transaction_id"], services, total_amount)
+                    SalesRollup.record(cursor, [data["transaction_id"]])
+                    
+                    # Deduct inventory for products used in services, all products at once
+                    service_ids = [service.get("service_id") for service in services]
+                    deducted_product_ids, shortfalls = InventoryUpdater.deduct_for_services(
+                        cursor, service_ids, data["transaction_id"]
+                    )
+                    
+                    conn.commit()
+                finally:
+                    cursor.close()
             
-            # Refresh inventory display if parent has inventory page reference
-            self.refresh_inventory_display()
+            # Let the customer, report and inventory views refresh what changed
+            EventBus.publish(TransactionCreated([data["transaction_id"]]))
+            if deducted_product_ids:
+                EventBus.publish(StockChanged(deducted_product_ids))
             
-            # Refresh customers table if parent has customers page reference
-            self.refresh_customers_display()
+            if shortfalls:
+                self.show_stock_shortfalls(shortfalls)
             
         except Exception as e:
             print(f"Database error: {e}")
             QtWidgets.QMessageBox.warning(self, "Database Error", f"Failed to save transaction: {e}")
     
-    def refresh_inventory_display(self):
-        """Refresh inventory displays across the application"""
-        try:
-            # Get main window reference
-            main_window = self.parent
-            while main_window and not hasattr(main_window, 'page_manager'):
-                main_window = getattr(main_window, 'parent', None)
-            
-            if main_window and hasattr(main_window, 'page_manager'):
-                # Find inventory page and refresh products tab
-                for page_name, page_info in main_window.page_manager.pages.items():
-                    if 'inventory' in page_name.lower() and hasattr(page_info, 'page') and page_info.page:
-                        inventory_page = page_info.page
-                        if hasattr(inventory_page, 'products_tab'):
-                            inventory_page.products_tab.load_products(preserve_filter=True)
-                            print("Refreshed inventory products display")
-                        if hasattr(inventory_page, 'inventory_status_tab'):
-                            inventory_page.inventory_status_tab.load_inventory_status()
-                            print("Refreshed inventory status display")
-                        break
-        except Exception as e:
-            print(f"Error refreshing inventory display: {e}")
-    
-    def refresh_customers_display(self):
-        """Refresh customers table across the application"""
-        try:
-            # Get main window reference
-            main_window = self.parent
-            while main_window and not hasattr(main_window, 'page_manager'):
-                main_window = getattr(main_window, 'parent', None)
-            
-            if main_window and hasattr(main_window, 'page_manager'):
-                # Find customers page and refresh table
-                for page_name, page_info in main_window.page_manager.pages.items():
-                    if 'customer' in page_name.lower() and hasattr(page_info, 'page') and page_info.page:
-                        customers_page = page_info.page
-                        if hasattr(customers_page, 'customers_tab'):
-                            customers_page.customers_tab.load_transactions()
-                            print("Refreshed customers table display")
-                        break
-        except Exception as e:
-            print(f"Error refreshing customers display: {e}")
+    def show_stock_shortfalls(self, shortfalls):
+        """Warn that some products used by the sale ran out"""
+        lines = "\n".join(
+            f"• {shortfall.product_name}: needed {shortfall.required}, had {shortfall.available}"
+            for shortfall in shortfalls
+        )
+        QtWidgets.QMessageBox.warning(
+            self,
+            "Insufficient Stock",
+            f"The sale was saved, but these products did not have enough stock and are now at zero:\n\n{lines}"
+        )
     
     def exit_transaction(self):
         """Save the transaction and exit to main dashboard"""
@@ -1,6 +1,7 @@
 from PyQt5 import QtWidgets, QtCore
 import mysql.connector
 from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 import hashlib
 from .base_dialog import BaseDialog
 
@@ -217,6 +218,7 @@ class UserDialog(BaseDialog):
                 action = "created"
             
             conn.commit()
+            ReferenceCache.invalidate("users")
             cursor.close()
             
             QtWidgets.QMessageBox.information(self, "Success", f"User {action} successfully!")
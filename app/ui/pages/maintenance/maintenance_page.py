@@ -9,7 +9,7 @@ from .table_factory import TableFactory
 from .control_panel_factory import ControlPanelFactory
 
 # Import tab components
-from .tabs import DatabaseBackupTab, UserManagementTab
+from .tabs import DatabaseBackupTab, UserManagementTab, QueryPerformanceTab
 
 class MaintenancePage(BasePage):
     def __init__(self, parent=None, user_info=None):
@@ -32,10 +32,12 @@ class MaintenancePage(BasePage):
         # Create tab components
         self.database_backup_tab = DatabaseBackupTab(self)
         self.user_management_tab = UserManagementTab(self)
+        self.query_performance_tab = QueryPerformanceTab(self)
         
         # Add the tabs to the tab widget
         self.tabs.addTab(self.database_backup_tab, "Database Backup")
         self.tabs.addTab(self.user_management_tab, "User Management")
+        self.tabs.addTab(self.query_performance_tab, "Query Performance")
         
         # Connect tab changed signal to handle refreshes
         self.tabs.currentChanged.connect(self.handle_tab_change)
@@ -56,6 +58,8 @@ class MaintenancePage(BasePage):
                 self.database_backup_tab.load_table_info()
             elif index == 1:  # User Management tab
                 self.user_management_tab.refresh_data()
+            elif index == 2:  # Query Performance tab
+                self.query_performance_tab.refresh_stats()
     
     def load_initial_data(self):
         """Load initial data for all tabs"""
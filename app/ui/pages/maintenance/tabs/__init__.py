@@ -1,3 +1,4 @@
 # Import all tab classes for easy access
 from .database_backup_tab import DatabaseBackupTab
-from .user_management_tab import UserManagementTab
\ No newline at end of file
+from .user_management_tab import UserManagementTab
+from .query_performance_tab import QueryPerformanceTab
\ No newline at end of file
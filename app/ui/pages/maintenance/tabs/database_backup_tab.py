@@ -1,6 +1,7 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
 import mysql.connector
 from app.utils.db_manager import DBManager
+from app.utils.data_versions import DataVersions
 from datetime import datetime
 import os
 from ..style_factory import StyleFactory
@@ -504,6 +505,12 @@ class DatabaseBackupTab(QtWidgets.QWidget):
                         self.progress_bar.setValue(progress)
                     
                     conn.commit()
+                    
+                    # The restore dropped the tables the data version triggers were on;
+                    # recreate them and bump every counter so open dashboards reload
+                    DataVersions.ensure(cursor)
+                    DataVersions.touch(cursor)
+                    conn.commit()
                     cursor.close()
                     
                     self.progress_bar.setValue(100)
@@ -0,0 +1,291 @@
+from PyQt5 import QtWidgets, QtCore, QtGui
+from app.utils.query_stats import QueryStats
+from app.utils.query_runner import QueryRunner
+from ..style_factory import StyleFactory
+from ..table_factory import TableFactory
+
+class QueryPerformanceTab(QtWidgets.QWidget):
+    """Tab for inspecting statement timings collected from database cursors"""
+
+    # Milliseconds between live table refreshes while the tab is visible
+    REFRESH_INTERVAL = 2000
+
+    # Sort options mapped to the stats key they order by
+    SORT_OPTIONS = {
+        "Slowest (Total Time)": "total_ms",
+        "Slowest (p95)": "p95_ms",
+        "Most Frequent": "count",
+        "Most Rows": "rows"
+    }
+
+    def __init__(self, parent=None):
+        super(QueryPerformanceTab, self).__init__()
+        self.parent = parent
+        self.explain_task = None
+
+        # Statement stats shown in the table, keyed by fingerprint
+        self.statements = {}
+
+        self.setup_ui()
+
+        self.refresh_timer = QtCore.QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL)
+        self.refresh_timer.timeout.connect(self.refresh_stats)
+
+    def setup_ui(self):
+        """Set up the UI components for the query performance tab"""
+        self.layout = QtWidgets.QVBoxLayout(self)
+        self.layout.setContentsMargins(10, 15, 10, 10)
+        self.layout.setSpacing(15)
+
+        # Header section
+        header_layout = QtWidgets.QVBoxLayout()
+
+        title_label = QtWidgets.QLabel("Query Performance")
+        title_label.setStyleSheet("color: white; font-size: 20px; font-weight: bold;")
+        header_layout.addWidget(title_label)
+
+        desc_label = QtWidgets.QLabel("Live timings for every database statement issued since the application started")
+        desc_label.setStyleSheet("color: #cccccc; font-size: 12px;")
+        header_layout.addWidget(desc_label)
+
+        self.layout.addLayout(header_layout)
+
+        # Controls
+        controls_layout = QtWidgets.QHBoxLayout()
+        controls_layout.setSpacing(10)
+
+        sort_label = QtWidgets.QLabel("Sort by:")
+        sort_label.setStyleSheet("color: #cccccc; font-size: 13px;")
+
+        self.sort_combo = QtWidgets.QComboBox()
+        self.sort_combo.addItems(list(self.SORT_OPTIONS.keys()))
+        self.sort_combo.setStyleSheet(StyleFactory.get_search_input_style())
+        self.sort_combo.setMinimumWidth(200)
+        self.sort_combo.currentIndexChanged.connect(self.refresh_stats)
+
+        self.summary_label = QtWidgets.QLabel()
+        self.summary_label.setStyleSheet("color: #4FC3F7; font-size: 12px;")
+
+        self.explain_button = QtWidgets.QPushButton("Explain")
+        self.explain_button.setStyleSheet(StyleFactory.get_button_style())
+        self.explain_button.clicked.connect(self.explain_selected)
+
+        self.reset_button = QtWidgets.QPushButton("Reset Stats")
+        self.reset_button.setStyleSheet(StyleFactory.get_button_style(secondary=True))
+        self.reset_button.clicked.connect(self.reset_stats)
+
+        controls_layout.addWidget(sort_label)
+        controls_layout.addWidget(self.sort_combo)
+        controls_layout.addWidget(self.summary_label)
+        controls_layout.addStretch()
+        controls_layout.addWidget(self.explain_button)
+        controls_layout.addWidget(self.reset_button)
+
+        self.layout.addLayout(controls_layout)
+
+        # Statements table
+        self.stats_table = TableFactory.create_table()
+
+        stats_columns = [
+            ("Statement", 0.40),
+            ("Calls", 0.06),
+            ("Avg (ms)", 0.08),
+            ("p95 (ms)", 0.08),
+            ("Max (ms)", 0.08),
+            ("Rows/Call", 0.08),
+            ("Page", 0.22)
+        ]
+
+        screen_width = QtWidgets.QApplication.desktop().screenGeometry().width()
+        TableFactory.configure_table_columns(self.stats_table, stats_columns, screen_width)
+
+        # Sorting is driven by the combo box so refreshes keep a stable order
+        self.stats_table.setSortingEnabled(False)
+        self.stats_table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.stats_table.itemSelectionChanged.connect(self.show_selected_statement)
+
+        self.layout.addWidget(self.stats_table, 3)
+
+        # Selected statement and execution plan
+        plan_frame = QtWidgets.QFrame()
+        plan_frame.setStyleSheet("""
+            QFrame {
+                background-color: #232323;
+                border-radius: 8px;
+                border: 1px solid rgba(100, 100, 100, 0.3);
+            }
+        """)
+        plan_layout = QtWidgets.QVBoxLayout(plan_frame)
+        plan_layout.setContentsMargins(15, 15, 15, 15)
+        plan_layout.setSpacing(10)
+
+        plan_title = QtWidgets.QLabel("Execution Plan")
+        plan_title.setStyleSheet("color: white; font-size: 14px; font-weight: bold; border: none;")
+        plan_layout.addWidget(plan_title)
+
+        self.statement_label = QtWidgets.QLabel("Select a statement and click Explain")
+        self.statement_label.setWordWrap(True)
+        self.statement_label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        self.statement_label.setStyleSheet("color: #cccccc; font-size: 12px; font-family: monospace; border: none;")
+        plan_layout.addWidget(self.statement_label)
+
+        self.plan_table = TableFactory.create_table()
+        plan_layout.addWidget(self.plan_table)
+
+        self.layout.addWidget(plan_frame, 2)
+
+    def showEvent(self, event):
+        """Start live refreshes when the tab becomes visible"""
+        super().showEvent(event)
+        self.refresh_stats()
+        self.refresh_timer.start()
+
+    def hideEvent(self, event):
+        """Stop live refreshes while the tab is hidden"""
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+
+    def refresh_stats(self):
+        """Reload the statements table from the collected stats"""
+        sort_key = self.SORT_OPTIONS[self.sort_combo.currentText()]
+        statements = sorted(QueryStats.statements(), key=lambda item: item[sort_key], reverse=True)
+        self.statements = {item["key"]: item for item in statements}
+
+        selected_key = self.selected_statement_key()
+
+        self.stats_table.blockSignals(True)
+        self.stats_table.clearSelection()
+        self.stats_table.setRowCount(len(statements))
+
+        for row, stats in enumerate(statements):
+            statement_item = QtWidgets.QTableWidgetItem(stats["key"])
+            statement_item.setData(QtCore.Qt.UserRole, stats["key"])
+            statement_item.setToolTip(stats["key"])
+            self.stats_table.setItem(row, 0, statement_item)
+
+            self.stats_table.setItem(row, 1, self.create_number_item(str(stats["count"])))
+            self.stats_table.setItem(row, 2, self.create_number_item(f"{stats['avg_ms']:.1f}"))
+
+            p95_item = self.create_number_item(f"{stats['p95_ms']:.1f}")
+            if stats["p95_ms"] >= QueryStats.slow_query_ms:
+                p95_item.setForeground(QtGui.QColor("#FF5252"))  # Red for slow statements
+            self.stats_table.setItem(row, 3, p95_item)
+
+            self.stats_table.setItem(row, 4, self.create_number_item(f"{stats['max_ms']:.1f}"))
+            self.stats_table.setItem(row, 5, self.create_number_item(f"{stats['rows_per_call']:.1f}"))
+            self.stats_table.setItem(row, 6, QtWidgets.QTableWidgetItem(self.describe_pages(stats["call_sites"])))
+
+            if stats["key"] == selected_key:
+                self.stats_table.selectRow(row)
+
+        self.stats_table.blockSignals(False)
+
+        total_calls = sum(item["count"] for item in statements)
+        total_ms = sum(item["total_ms"] for item in statements)
+        self.summary_label.setText(f"{len(statements)} statements, {total_calls} calls, {total_ms / 1000:.2f} s total")
+
+    def create_number_item(self, text):
+        """Create a right aligned table item for a numeric column"""
+        item = QtWidgets.QTableWidgetItem(text)
+        item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        return item
+
+    def describe_pages(self, call_sites):
+        """Summarize which pages issued a statement, most frequent first"""
+        pages = {}
+        for call_site, count in call_sites.items():
+            page = self.page_for_call_site(call_site)
+            pages[page] = pages.get(page, 0) + count
+
+        ordered = sorted(pages.items(), key=lambda item: item[1], reverse=True)
+        return ", ".join(page for page, _ in ordered)
+
+    def page_for_call_site(self, call_site):
+        """Map a module.function call site to the page that owns it"""
+        parts = call_site.split(".")
+
+        # app.ui.pages.<page>... belongs to that page
+        if parts[:3] == ["app", "ui", "pages"] and len(parts) > 4:
+            return parts[3].replace("_", " ").title()
+
+        # Shared helpers are reported by module name
+        if len(parts) > 1:
+            return parts[-2].replace("_", " ").title()
+        return call_site
+
+    def selected_statement_key(self):
+        """Get the fingerprint of the selected statement, if any"""
+        row = self.stats_table.currentRow()
+        if row < 0 or not self.stats_table.selectionModel().hasSelection():
+            return None
+        item = self.stats_table.item(row, 0)
+        return item.data(QtCore.Qt.UserRole) if item else None
+
+    def show_selected_statement(self):
+        """Show the last executed text of the selected statement"""
+        stats = self.statements.get(self.selected_statement_key())
+        if stats:
+            self.statement_label.setText(stats["last_sql"].strip() if isinstance(stats["last_sql"], str) else str(stats["last_sql"]))
+
+    def explain_selected(self):
+        """Run EXPLAIN on the last executed instance of the selected statement"""
+        stats = self.statements.get(self.selected_statement_key())
+        if not stats:
+            self.parent.show_info_message("Please select a statement to explain.")
+            return
+
+        sql = stats["last_sql"]
+        if not isinstance(sql, str) or not sql.lstrip().upper().startswith("SELECT"):
+            self.parent.show_info_message("Only SELECT statements can be explained.")
+            return
+
+        if self.explain_task:
+            self.explain_task.cancel()
+
+        self.explain_button.setEnabled(False)
+        self.explain_task = QueryRunner.execute(
+            "EXPLAIN " + sql,
+            stats["last_params"],
+            on_result=self.show_plan,
+            on_error=self.show_explain_error
+        )
+
+    def show_plan(self, rows):
+        """Populate the plan table with EXPLAIN output"""
+        self.explain_task = None
+        self.explain_button.setEnabled(True)
+
+        columns = list(rows[0].keys()) if rows else []
+        self.plan_table.clear()
+        self.plan_table.setColumnCount(len(columns))
+        self.plan_table.setHorizontalHeaderLabels(columns)
+        self.plan_table.setRowCount(len(rows))
+
+        for row, plan_row in enumerate(rows):
+            for col, column in enumerate(columns):
+                value = plan_row[column]
+                item = QtWidgets.QTableWidgetItem("" if value is None else str(value))
+
+                # Full table scans are the usual culprit
+                if column == "type" and value == "ALL":
+                    item.setForeground(QtGui.QColor("#FF5252"))
+
+                self.plan_table.setItem(row, col, item)
+
+        self.plan_table.resizeColumnsToContents()
+
+    def show_explain_error(self, message):
+        """Report a failed EXPLAIN"""
+        self.explain_task = None
+        self.explain_button.setEnabled(True)
+        self.parent.show_error_message(f"Could not explain statement: {message}")
+
+    def reset_stats(self):
+        """Discard collected stats and start measuring afresh"""
+        QueryStats.reset()
+        self.plan_table.clear()
+        self.plan_table.setRowCount(0)
+        self.plan_table.setColumnCount(0)
+        self.statement_label.setText("Select a statement and click Explain")
+        self.refresh_stats()
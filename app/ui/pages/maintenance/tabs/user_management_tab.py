@@ -1,17 +1,51 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
 import mysql.connector
 from app.utils.db_manager import DBManager
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib
+from app.utils.reference_cache import ReferenceCache
+from app.utils.repositories import UserRepository
+from app.utils.chart_renderer import Chart
+from app.ui.pages.chart_view import ChartView
 from ..style_factory import StyleFactory
 from ..table_factory import TableFactory
 from ..control_panel_factory import ControlPanelFactory
 from ..dialogs import UserDialog
 
-# Set matplotlib to use a non-GUI backend
-matplotlib.use('Qt5Agg')
+class UserDistributionChart(Chart):
+    """Pie chart of admin and staff accounts"""
+    
+    NAME = "user_distribution"
+    
+    def create(self, figure):
+        self.axes = figure.add_subplot(111)
+    
+    def update(self, data):
+        """Redraw the pie for (admin count, staff count)"""
+        admin_count, staff_count = data
+        ax = self.axes
+        ax.clear()
+        ax.set_facecolor(self.FACE_COLOR)
+        
+        if admin_count == 0 and staff_count == 0:
+            # Show empty chart message
+            ax.text(0.5, 0.5, 'No Users Found', ha='center', va='center', 
+                   fontsize=16, color='white', transform=ax.transAxes)
+            ax.axis('off')
+            return
+        
+        # Data for pie chart
+        sizes = [admin_count, staff_count]
+        labels = ['Admin', 'Staff']
+        colors = ['#FF9800', '#2196F3']
+        
+        # Create pie chart
+        wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors, 
+                                        autopct='%1.1f%%', startangle=90,
+                                        textprops={'color': 'white', 'fontsize': 12})
+        
+        # Styling
+        for autotext in autotexts:
+            autotext.set_color('white')
+            autotext.set_fontweight('bold')
 
 class UserManagementTab(QtWidgets.QWidget):
     """Tab for user management and statistics"""
@@ -94,11 +128,9 @@ class UserManagementTab(QtWidgets.QWidget):
         chart_title.setStyleSheet("color: white; font-size: 14px; font-weight: bold; border: none; background: transparent;")
         chart_layout.addWidget(chart_title)
         
-        # Create matplotlib figure - smaller size
-        self.figure = Figure(figsize=(4, 3), facecolor='#232323')
-        self.canvas = FigureCanvas(self.figure)
-        self.canvas.setStyleSheet("background-color: #232323;")
-        chart_layout.addWidget(self.canvas)
+        # Chart rendered in the background
+        self.chart_view = ChartView(UserDistributionChart())
+        chart_layout.addWidget(self.chart_view)
         
         stats_layout.addLayout(stats_cards_layout, 1)
         stats_layout.addWidget(chart_frame, 1)  # Reduced proportion
@@ -218,55 +250,20 @@ class UserManagementTab(QtWidgets.QWidget):
         return card
     
     def create_pie_chart(self, admin_count, staff_count):
-        """Create pie chart for user distribution"""
-        self.figure.clear()
-        
-        if admin_count == 0 and staff_count == 0:
-            # Show empty chart message
-            ax = self.figure.add_subplot(111)
-            ax.text(0.5, 0.5, 'No Users Found', ha='center', va='center', 
-                   fontsize=16, color='white', transform=ax.transAxes)
-            ax.set_facecolor('#232323')
-            ax.axis('off')
-        else:
-            ax = self.figure.add_subplot(111)
-            
-            # Data for pie chart
-            sizes = [admin_count, staff_count]
-            labels = ['Admin', 'Staff']
-            colors = ['#FF9800', '#2196F3']
-            
-            # Create pie chart
-            wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors, 
-                                            autopct='%1.1f%%', startangle=90,
-                                            textprops={'color': 'white', 'fontsize': 12})
-            
-            # Styling
-            ax.set_facecolor('#232323')
-            for autotext in autotexts:
-                autotext.set_color('white')
-                autotext.set_fontweight('bold')
-        
-        self.canvas.draw()
+        """Show the user distribution pie chart"""
+        self.chart_view.set_data((admin_count, staff_count), (admin_count, staff_count))
     
     def load_user_data(self):
         """Load user data from database"""
         try:
             conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
             
             # Get all users
-            cursor.execute("""
-                SELECT user_id, username, full_name, role, login_time, 
-                       logout_time, created_at
-                FROM users 
-                ORDER BY created_at DESC
-            """)
-            users = cursor.fetchall()
+            users = UserRepository.all(conn)
             
             # Count users by role
-            admin_count = sum(1 for user in users if user['role'] == 'admin')
-            staff_count = sum(1 for user in users if user['role'] == 'staff')
+            admin_count = sum(1 for user in users if user.role == 'admin')
+            staff_count = sum(1 for user in users if user.role == 'staff')
             total_count = len(users)
             
             # Update info cards
@@ -282,22 +279,22 @@ class UserManagementTab(QtWidgets.QWidget):
             
             for row, user in enumerate(users):
                 # ID
-                id_item = QtWidgets.QTableWidgetItem(str(user['user_id']))
+                id_item = QtWidgets.QTableWidgetItem(str(user.user_id))
                 id_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 self.users_table.setItem(row, 0, id_item)
                 
                 # Username
-                self.users_table.setItem(row, 1, QtWidgets.QTableWidgetItem(user['username']))
+                self.users_table.setItem(row, 1, QtWidgets.QTableWidgetItem(user.username))
                 
                 # Full Name
-                self.users_table.setItem(row, 2, QtWidgets.QTableWidgetItem(user['full_name']))
+                self.users_table.setItem(row, 2, QtWidgets.QTableWidgetItem(user.full_name))
                 
                 # Role
-                role_item = QtWidgets.QTableWidgetItem(user['role'].title())
+                role_item = QtWidgets.QTableWidgetItem(user.role.title())
                 role_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 
                 # Color code roles
-                if user['role'] == 'admin':
+                if user.role == 'admin':
                     role_item.setForeground(QtGui.QColor("#FF9800"))
                 else:
                     role_item.setForeground(QtGui.QColor("#2196F3"))
@@ -305,22 +302,20 @@ class UserManagementTab(QtWidgets.QWidget):
                 self.users_table.setItem(row, 3, role_item)
                 
                 # Last Login
-                login_time = user['login_time']
+                login_time = user.login_time
                 login_str = login_time.strftime('%Y-%m-%d %H:%M') if login_time else "Never"
                 login_item = QtWidgets.QTableWidgetItem(login_str)
                 login_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 self.users_table.setItem(row, 4, login_item)
                 
                 # Created Date - replaced Status column
-                created_at = user['created_at']
+                created_at = user.created_at
                 created_str = created_at.strftime('%Y-%m-%d %H:%M') if created_at else "Unknown"
                 created_item = QtWidgets.QTableWidgetItem(created_str)
                 created_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 created_item.setForeground(QtGui.QColor("#B0B0B0"))  # Gray color for created date
                 self.users_table.setItem(row, 5, created_item)
             
-            cursor.close()
-            
         except mysql.connector.Error as err:
             if self.parent:
                 self.parent.show_error_message(f"Database error: {err}")
@@ -422,6 +417,7 @@ class UserManagementTab(QtWidgets.QWidget):
                 
                 cursor.execute("DELETE FROM users WHERE user_id = %s", (user_id,))
                 conn.commit()
+                ReferenceCache.invalidate("users")
                 cursor.close()
                 
                 QtWidgets.QMessageBox.information(self, "Success", f"User '{username}' deleted successfully!")
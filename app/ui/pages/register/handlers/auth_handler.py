@@ -1,5 +1,6 @@
 from app.utils.auth_manager import AuthManager
 from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 import hashlib
 
 class RegisterAuthHandler:
@@ -96,6 +97,7 @@ class RegisterAuthHandler:
                     (username, hashed_password, full_name, 'staff', reason, admin_id)
                 )
                 conn.commit()
+                ReferenceCache.invalidate("users")
                 return True
             finally:
                 cursor.close()
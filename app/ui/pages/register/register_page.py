@@ -2,6 +2,7 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 import re
 import hashlib
 from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 from .style_factory import StyleFactory
 from .form_factory import FormFactory
 from .dialogs.admin_verification_dialog import AdminVerificationDialog
@@ -334,6 +335,7 @@ class RegisterPage(QtWidgets.QWidget):
                 (username, hashed_password, full_name, 'staff', reason, admin_id, security_question, security_answer)
             )
             conn.commit()
+            ReferenceCache.invalidate("users")
             return True
         finally:
             cursor.close()
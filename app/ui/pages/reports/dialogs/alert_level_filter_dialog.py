@@ -1,6 +1,6 @@
 from PyQt5 import QtWidgets, QtCore
 import mysql.connector
-from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 from .base_dialog import BaseDialog
 
 class AlertLevelFilterDialog(BaseDialog):
@@ -49,13 +49,7 @@ class AlertLevelFilterDialog(BaseDialog):
         
         # Get unique categories
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT DISTINCT category FROM products WHERE category IS NOT NULL AND category != ''")
-            categories = cursor.fetchall()
-            for category in categories:
-                self.category_combo.addItem(category['category'])
-            cursor.close()
+            self.category_combo.addItems(ReferenceCache.get("product_categories"))
         except mysql.connector.Error:
             pass
         
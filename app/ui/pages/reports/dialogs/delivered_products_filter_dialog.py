@@ -1,6 +1,6 @@
 from PyQt5 import QtWidgets, QtCore
 import mysql.connector
-from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 from .base_dialog import BaseDialog
 
 class DeliveredProductsFilterDialog(BaseDialog):
@@ -49,18 +49,7 @@ class DeliveredProductsFilterDialog(BaseDialog):
         
         # Get unique suppliers from inventory_status
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("""
-                SELECT DISTINCT supplier_name 
-                FROM inventory_status 
-                WHERE supplier_name IS NOT NULL AND supplier_name != '' AND status = 'Received'
-            """)
-            suppliers = cursor.fetchall()
-            for supplier in suppliers:
-                if supplier['supplier_name']:
-                    self.supplier_combo.addItem(supplier['supplier_name'])
-            cursor.close()
+            self.supplier_combo.addItems(ReferenceCache.get("delivered_supplier_names"))
         except mysql.connector.Error:
             pass
         
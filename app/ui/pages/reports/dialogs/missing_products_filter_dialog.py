@@ -1,6 +1,6 @@
 from PyQt5 import QtWidgets, QtCore
 import mysql.connector
-from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 from app.ui.pages.inventory.dialogs.base_dialog import BaseDialog
 
 class MissingProductsFilterDialog(BaseDialog):
@@ -52,13 +52,7 @@ class MissingProductsFilterDialog(BaseDialog):
         
         # Get unique categories from products
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT DISTINCT category FROM products WHERE category IS NOT NULL AND category != ''")
-            categories = cursor.fetchall()
-            for category in categories:
-                self.category_combo.addItem(category['category'])
-            cursor.close()
+            self.category_combo.addItems(ReferenceCache.get("product_categories"))
         except mysql.connector.Error:
             pass
         
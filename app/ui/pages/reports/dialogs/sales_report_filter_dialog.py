@@ -1,6 +1,6 @@
 from PyQt5 import QtWidgets, QtCore
 import mysql.connector
-from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 from .base_dialog import BaseDialog
 
 class SalesReportFilterDialog(BaseDialog):
@@ -51,18 +51,7 @@ class SalesReportFilterDialog(BaseDialog):
         
         # Get unique payment methods
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("""
-                SELECT DISTINCT payment_method 
-                FROM transactions 
-                WHERE payment_method IS NOT NULL AND payment_method != ''
-            """)
-            methods = cursor.fetchall()
-            for method in methods:
-                if method['payment_method']:
-                    self.payment_combo.addItem(method['payment_method'])
-            cursor.close()
+            self.payment_combo.addItems(ReferenceCache.get("payment_methods"))
         except mysql.connector.Error:
             # Add defaults if DB connection fails
             self.payment_combo.addItems(["Cash", "Credit Card", "GCash", "PayMaya"])
@@ -100,19 +89,7 @@ class SalesReportFilterDialog(BaseDialog):
         
         # Get unique services
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("""
-                SELECT DISTINCT s.service_name 
-                FROM services s
-                INNER JOIN transactions t ON s.service_id = t.service_id
-                WHERE s.service_name IS NOT NULL AND s.service_name != ''
-            """)
-            services = cursor.fetchall()
-            for service in services:
-                if service['service_name']:
-                    self.service_combo.addItem(service['service_name'])
-            cursor.close()
+            self.service_combo.addItems(ReferenceCache.get("sold_service_names"))
         except mysql.connector.Error:
             pass
         
@@ -1,6 +1,6 @@
 from PyQt5 import QtWidgets, QtCore
 import mysql.connector
-from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 from app.ui.pages.inventory.dialogs.base_dialog import BaseDialog
 
 class TransactionLogsFilterDialog(BaseDialog):
@@ -42,13 +42,7 @@ class TransactionLogsFilterDialog(BaseDialog):
         
         # Get unique payment methods
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT DISTINCT payment_method FROM transactions WHERE payment_method IS NOT NULL AND payment_method != ''")
-            methods = cursor.fetchall()
-            for method in methods:
-                self.payment_combo.addItem(method['payment_method'])
-            cursor.close()
+            self.payment_combo.addItems(ReferenceCache.get("payment_methods"))
         except mysql.connector.Error:
             # Add default if DB connection fails
             self.payment_combo.addItem("Cash")
@@ -84,13 +78,7 @@ class TransactionLogsFilterDialog(BaseDialog):
         
         # Get unique staff members
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT DISTINCT u.username FROM users u INNER JOIN transactions t ON u.user_id = t.created_by WHERE u.username IS NOT NULL")
-            staff_members = cursor.fetchall()
-            for staff in staff_members:
-                self.staff_combo.addItem(staff['username'])
-            cursor.close()
+            self.staff_combo.addItems(ReferenceCache.get("transaction_staff"))
         except mysql.connector.Error:
             pass
         
@@ -1,6 +1,6 @@
 from PyQt5 import QtWidgets, QtCore
 import mysql.connector
-from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
 from app.ui.pages.inventory.dialogs.base_dialog import BaseDialog
 
 class UndeliveredProductsFilterDialog(BaseDialog):
@@ -30,13 +30,7 @@ class UndeliveredProductsFilterDialog(BaseDialog):
         
         # Get unique suppliers
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT DISTINCT supplier_name FROM suppliers WHERE supplier_name IS NOT NULL AND supplier_name != ''")
-            suppliers = cursor.fetchall()
-            for supplier in suppliers:
-                self.supplier_combo.addItem(supplier['supplier_name'])
-            cursor.close()
+            self.supplier_combo.addItems(ReferenceCache.get("supplier_names"))
         except mysql.connector.Error:
             pass
         
@@ -53,13 +47,7 @@ class UndeliveredProductsFilterDialog(BaseDialog):
         
         # Get unique categories
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT DISTINCT category FROM suppliers WHERE category IS NOT NULL AND category != ''")
-            categories = cursor.fetchall()
-            for category in categories:
-                self.category_combo.addItem(category['category'])
-            cursor.close()
+            self.category_combo.addItems(ReferenceCache.get("supplier_categories"))
         except mysql.connector.Error:
             pass
         
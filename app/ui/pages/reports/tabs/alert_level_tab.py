@@ -5,6 +5,7 @@ from datetime import datetime
 from ..table_factory import TableFactory
 from ..style_factory import StyleFactory
 from ..control_panel_factory import ControlPanelFactory
+from app.utils.event_bus import EventBus, StockChanged
 
 class AlertLevelTab(QtWidgets.QWidget):
     """Tab for displaying alert level report - overstock and understock statuses"""
@@ -20,6 +21,9 @@ class AlertLevelTab(QtWidgets.QWidget):
         }
         self.setup_ui()
         
+        # Reload when the data behind this report changes
+        EventBus.subscribe(StockChanged, lambda event: self.refresh_data(), widget=self)
+        
     def setup_ui(self):
         """Set up the UI components"""
         self.layout = QtWidgets.QVBoxLayout(self)
@@ -2,9 +2,11 @@ from PyQt5 import QtWidgets, QtCore, QtGui, QtPrintSupport
 import mysql.connector
 from app.utils.db_manager import DBManager
 from datetime import datetime, timedelta
+from app.utils.date_ranges import DateRange
 from ..table_factory import TableFactory
 from ..style_factory import StyleFactory
 from ..control_panel_factory import ControlPanelFactory
+from app.utils.event_bus import EventBus, SupplierReceived
 
 class DeliveredProductsTab(QtWidgets.QWidget):
     """Tab for displaying delivered/received products report"""
@@ -19,6 +21,9 @@ class DeliveredProductsTab(QtWidgets.QWidget):
             "status": "All Statuses"
         }
         self.setup_ui()
+        
+        # Reload when the data behind this report changes
+        EventBus.subscribe(SupplierReceived, lambda event: self.refresh_data(), widget=self)
         self.load_delivered_products()
     
     def setup_ui(self):
@@ -307,7 +312,7 @@ class DeliveredProductsTab(QtWidgets.QWidget):
         if not self.filter_state["is_active"]:
             return
             
-        current_date = datetime.now()
+        date_bounds = DateRange.bounds(self.filter_state["date_range"])
         
         # Track if any row is visible
         rows_visible = False
@@ -316,31 +321,13 @@ class DeliveredProductsTab(QtWidgets.QWidget):
             visible = True
             
             # Apply date range filter
-            if self.filter_state["date_range"] != "All Time":
+            if date_bounds:
                 date_item = self.delivered_table.item(row, 4)
                 if date_item and date_item.text() and date_item.text() != "N/A":
                     try:
                         delivery_date = datetime.strptime(date_item.text(), '%Y-%m-%d %H:%M')
-                        
-                        if self.filter_state["date_range"] == "Today":
-                            if delivery_date.date() != current_date.date():
-                                visible = False
-                        elif self.filter_state["date_range"] == "This Week":
-                            days_since = (current_date.date() - delivery_date.date()).days
-                            if days_since < 0 or days_since >= 7:
-                                visible = False
-                        elif self.filter_state["date_range"] == "This Month":
-                            if (delivery_date.year != current_date.year or 
-                                delivery_date.month != current_date.month):
-                                visible = False
-                        elif self.filter_state["date_range"] == "Last 30 Days":
-                            days_since = (current_date.date() - delivery_date.date()).days
-                            if days_since < 0 or days_since > 30:
-                                visible = False
-                        elif self.filter_state["date_range"] == "Last 90 Days":
-                            days_since = (current_date.date() - delivery_date.date()).days
-                            if days_since < 0 or days_since > 90:
-                                visible = False
+                        if not DateRange.contains(date_bounds, delivery_date):
+                            visible = False
                     except ValueError:
                         pass
             
@@ -4,6 +4,7 @@ from app.utils.db_manager import DBManager
 from ..table_factory import TableFactory
 from ..style_factory import StyleFactory
 from ..control_panel_factory import ControlPanelFactory
+from app.utils.event_bus import EventBus, StockChanged
 
 class MissingProductsTab(QtWidgets.QWidget):
     """Tab for displaying missing products report"""
@@ -19,6 +20,9 @@ class MissingProductsTab(QtWidgets.QWidget):
         }
         self.setup_ui()
         
+        # Reload when the data behind this report changes
+        EventBus.subscribe(StockChanged, lambda event: self.refresh_data(), widget=self)
+        
     def setup_ui(self):
         """Set up the UI components"""
         self.layout = QtWidgets.QVBoxLayout(self)
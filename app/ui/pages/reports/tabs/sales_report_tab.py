@@ -1,17 +1,25 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
-import mysql.connector
-from app.utils.db_manager import DBManager
-from datetime import datetime, timedelta
 from ..table_factory import TableFactory
 from ..style_factory import StyleFactory
 from ..control_panel_factory import ControlPanelFactory
+from app.utils.query_runner import QueryRunner
+from app.utils.repositories import TransactionRepository, TransactionLineRepository, SalesRollupRepository
+from app.utils.date_ranges import DateRange
+from app.utils.event_bus import EventBus, TransactionCreated
 
 class SalesReportTab(QtWidgets.QWidget):
     """Tab for displaying sales report - customer service transactions"""
     
+    # Most recent matching sales listed in the table; the statistics cover all of them
+    SALES_LIMIT = 1000
+    
     def __init__(self, parent=None):
         super(SalesReportTab, self).__init__()
         self.parent = parent
+        self.load_task = None
+        
+        # Set when applying filters, so an empty result can be reported once it arrives
+        self.report_no_results = False
         self.filter_state = {
             "is_active": False,
             "date_range": "All Time",
@@ -21,6 +29,9 @@ class SalesReportTab(QtWidgets.QWidget):
         }
         self.setup_ui()
         
+        # Reload when the data behind this report changes
+        EventBus.subscribe(TransactionCreated, lambda event: self.refresh_data(), widget=self)
+        
     def setup_ui(self):
         """Set up the UI components"""
         self.layout = QtWidgets.QVBoxLayout(self)
@@ -65,11 +76,13 @@ class SalesReportTab(QtWidgets.QWidget):
         self.total_transactions = self.create_stat_card("Total Transactions", "0", "#2196F3")
         self.avg_transaction = self.create_stat_card("Avg. Transaction", "₱0.00", "#FF9800")
         self.today_sales = self.create_stat_card("Today's Sales", "₱0.00", "#9C27B0")
+        self.top_service = self.create_stat_card("Top Service", "-", "#E91E63")
         
         stats_layout.addWidget(self.total_revenue)
         stats_layout.addWidget(self.total_transactions)
         stats_layout.addWidget(self.avg_transaction)
         stats_layout.addWidget(self.today_sales)
+        stats_layout.addWidget(self.top_service)
         stats_layout.addStretch()
         
         self.layout.addWidget(stats_frame)
@@ -100,6 +113,12 @@ class SalesReportTab(QtWidgets.QWidget):
         
         self.layout.addWidget(self.sales_table)
         
+        # Shown when more sales match than the table lists
+        self.limit_notice = QtWidgets.QLabel()
+        self.limit_notice.setStyleSheet("color: #FF9800; font-style: italic;")
+        self.limit_notice.setVisible(False)
+        self.layout.addWidget(self.limit_notice)
+        
         # Load initial data
         self.load_sales_data()
         
@@ -147,109 +166,130 @@ class SalesReportTab(QtWidgets.QWidget):
         return card
     
     def load_sales_data(self):
-        """Load sales data from the database"""
-        try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
+        """Load sales data in the background"""
+        # Drop any load still in flight so a stale result never lands last
+        if self.load_task:
+            self.load_task.cancel()
+        
+        filter_state = dict(self.filter_state)
+        
+        # The filters run in SQL; totals are aggregated there rather than over the listed rows
+        def work(conn):
+            transactions = TransactionRepository.filtered(conn, filter_state, limit=self.SALES_LIMIT)
+            totals = TransactionRepository.totals(conn, filters=filter_state)
+            today_totals = SalesRollupRepository.totals(conn, DateRange.bounds("Today"))
+            service_revenue = TransactionLineRepository.service_revenue(conn, filters=filter_state)
+            return transactions, totals, today_totals, service_revenue
+        
+        self.load_task = QueryRunner.submit(
+            work,
+            on_result=lambda result: self.populate_sales(*result),
+            on_error=self.show_load_error
+        )
+    
+    def populate_sales(self, transactions, totals, today_totals, service_revenue):
+        """Populate the table and statistics with sales fetched by the query runner"""
+        self.load_task = None
+        
+        # Clear existing items
+        self.sales_table.clearContents()
+        self.sales_table.setRowCount(0)
+        
+        # Statistics over every matching sale, not just the listed ones
+        total_count, total_revenue = totals
+        total_revenue = float(total_revenue)
+        avg_transaction = total_revenue / total_count if total_count > 0 else 0
+        today_sales = float(today_totals[1])
+        
+        # Populate the table
+        self.sales_table.setRowCount(len(transactions))
+        
+        for row, transaction in enumerate(transactions):
+            # Transaction ID
+            self.sales_table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(transaction.transaction_id)))
             
-            # Clear existing items
-            self.sales_table.clearContents()
-            self.sales_table.setRowCount(0)
+            # OR Number
+            self.sales_table.setItem(row, 1, QtWidgets.QTableWidgetItem(str(transaction.or_number)))
             
-            # Query for sales transactions
-            cursor.execute("""
-                SELECT 
-                    t.transaction_id,
-                    t.or_number,
-                    t.customer_name,
-                    s.service_name,
-                    t.total_amount,
-                    t.discount_amount,
-                    t.payment_method,
-                    t.transaction_date,
-                    u.username as staff_name
-                FROM transactions t
-                LEFT JOIN services s ON t.service_id = s.service_id
-                LEFT JOIN users u ON t.created_by = u.user_id
-                ORDER BY t.transaction_date DESC
-            """)
+            # Customer
+            self.sales_table.setItem(row, 2, QtWidgets.QTableWidgetItem(transaction.customer_name))
             
-            transactions = cursor.fetchall()
+            # Service
+            self.sales_table.setItem(row, 3, QtWidgets.QTableWidgetItem(transaction.service_name))
             
-            # Calculate statistics
-            total_revenue = sum(float(t.get('total_amount', 0)) for t in transactions)
-            total_count = len(transactions)
-            avg_transaction = total_revenue / total_count if total_count > 0 else 0
+            # Amount
+            amount = float(transaction.total_amount)
+            amount_item = QtWidgets.QTableWidgetItem(f"₱{amount:.2f}")
+            amount_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+            if amount > 1000:
+                amount_item.setForeground(QtGui.QColor("#4CAF50"))
+            self.sales_table.setItem(row, 4, amount_item)
             
-            # Today's sales
-            today = datetime.now().date()
-            today_sales = sum(float(t.get('total_amount', 0)) for t in transactions 
-                            if t.get('transaction_date') and t['transaction_date'].date() == today)
+            # Discount
+            discount = float(transaction.discount_amount or 0)
+            discount_item = QtWidgets.QTableWidgetItem(f"₱{discount:.2f}")
+            discount_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+            if discount > 0:
+                discount_item.setForeground(QtGui.QColor("#FF9800"))
+            self.sales_table.setItem(row, 5, discount_item)
             
-            # Populate the table
-            self.sales_table.setRowCount(len(transactions))
+            # Payment Method
+            payment_item = QtWidgets.QTableWidgetItem(transaction.payment_method)
+            payment_item.setTextAlignment(QtCore.Qt.AlignCenter)
+            self.sales_table.setItem(row, 6, payment_item)
             
-            for row, transaction in enumerate(transactions):
-                # Transaction ID
-                self.sales_table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(transaction.get('transaction_id', ''))))
-                
-                # OR Number
-                self.sales_table.setItem(row, 1, QtWidgets.QTableWidgetItem(str(transaction.get('or_number', ''))))
-                
-                # Customer
-                self.sales_table.setItem(row, 2, QtWidgets.QTableWidgetItem(transaction.get('customer_name', '')))
-                
-                # Service
-                self.sales_table.setItem(row, 3, QtWidgets.QTableWidgetItem(transaction.get('service_name', '')))
-                
-                # Amount
-                amount = float(transaction.get('total_amount', 0))
-                amount_item = QtWidgets.QTableWidgetItem(f"₱{amount:.2f}")
-                amount_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-                if amount > 1000:
-                    amount_item.setForeground(QtGui.QColor("#4CAF50"))
-                self.sales_table.setItem(row, 4, amount_item)
-                
-                # Discount
-                discount = float(transaction.get('discount_amount', 0))
-                discount_item = QtWidgets.QTableWidgetItem(f"₱{discount:.2f}")
-                discount_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-                if discount > 0:
-                    discount_item.setForeground(QtGui.QColor("#FF9800"))
-                self.sales_table.setItem(row, 5, discount_item)
-                
-                # Payment Method
-                payment_item = QtWidgets.QTableWidgetItem(transaction.get('payment_method', ''))
-                payment_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                self.sales_table.setItem(row, 6, payment_item)
-                
-                # Date
-                date = transaction.get('transaction_date')
-                date_str = date.strftime('%Y-%m-%d %H:%M') if date else ""
-                date_item = QtWidgets.QTableWidgetItem(date_str)
-                date_item.setTextAlignment(QtCore.Qt.AlignCenter)
-                self.sales_table.setItem(row, 7, date_item)
-                
-                # Staff
-                self.sales_table.setItem(row, 8, QtWidgets.QTableWidgetItem(transaction.get('staff_name', '')))
-            
-            # Update statistics
-            self.total_revenue.value_label.setText(f"₱{total_revenue:.2f}")
-            self.total_transactions.value_label.setText(str(total_count))
-            self.avg_transaction.value_label.setText(f"₱{avg_transaction:.2f}")
-            self.today_sales.value_label.setText(f"₱{today_sales:.2f}")
+            # Date
+            date = transaction.transaction_date
+            date_str = date.strftime('%Y-%m-%d %H:%M') if date else ""
+            date_item = QtWidgets.QTableWidgetItem(date_str)
+            date_item.setTextAlignment(QtCore.Qt.AlignCenter)
+            self.sales_table.setItem(row, 7, date_item)
             
-            cursor.close()
-            
-            # Re-apply any active filters after loading data
-            if self.filter_state["is_active"]:
-                self.apply_stored_filters()
-            
-        except mysql.connector.Error as err:
-            if self.parent:
-                self.parent.show_error_message(f"Database error: {err}")
-            else:
-                QtWidgets.QMessageBox.critical(self, "Error", f"Database error: {err}")
+            # Staff
+            self.sales_table.setItem(row, 8, QtWidgets.QTableWidgetItem(transaction.staff_name))
+        
+        # Say so when the table lists only part of what the statistics cover
+        if total_count > len(transactions):
+            self.limit_notice.setText(
+                f"Showing the {len(transactions):,} most recent of {total_count:,} matching sales; "
+                "the statistics cover all of them. Narrow the filters to list the rest."
+            )
+            self.limit_notice.setVisible(True)
+        else:
+            self.limit_notice.setVisible(False)
+        
+        # Update statistics
+        self.total_revenue.value_label.setText(f"₱{total_revenue:.2f}")
+        self.total_transactions.value_label.setText(str(total_count))
+        self.avg_transaction.value_label.setText(f"₱{avg_transaction:.2f}")
+        self.today_sales.value_label.setText(f"₱{today_sales:.2f}")
+        
+        # Per-service revenue, with each service on a multi-service sale credited its share
+        top_service = service_revenue[0] if service_revenue else None
+        self.top_service.value_label.setText((top_service.service_name or "Unknown") if top_service else "-")
+        self.top_service.setToolTip("\n".join(
+            f"{service.service_name or 'Unknown'}: {service.times_sold} sold, ₱{service.revenue:,.2f}"
+            for service in service_revenue
+        ))
+        
+        # Keep the search box applied to the new rows
+        if self.search_input.text():
+            self.filter_sales()
+        
+        # Show a message if no results are found
+        if self.report_no_results:
+            self.report_no_results = False
+            if not transactions:
+                QtWidgets.QMessageBox.information(self, "No Results", 
+                    "No sales match the current filters. Try adjusting your filter criteria.")
+    
+    def show_load_error(self, message):
+        """Report a failed background load"""
+        self.load_task = None
+        if self.parent:
+            self.parent.show_error_message(f"Database error: {message}")
+        else:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Database error: {message}")
     
     def filter_sales(self):
         """Filter sales based on search input"""
@@ -312,107 +352,16 @@ class SalesReportTab(QtWidgets.QWidget):
                     self.filter_button.setStyleSheet(StyleFactory.get_button_style(secondary=True))
     
     def apply_stored_filters(self):
-        """Apply the filters stored in filter_state"""
+        """Reload the sales matching the filters stored in filter_state"""
         if not self.filter_state["is_active"]:
             return
-            
-        current_date = datetime.now()
-        
-        # Track if any row is visible
-        rows_visible = False
         
-        for row in range(self.sales_table.rowCount()):
-            visible = True
-            
-            # Apply date range filter
-            if self.filter_state["date_range"] != "All Time":
-                date_item = self.sales_table.item(row, 7)
-                if date_item and date_item.text() and date_item.text() != "":
-                    try:
-                        transaction_date = datetime.strptime(date_item.text(), '%Y-%m-%d %H:%M')
-                        
-                        if self.filter_state["date_range"] == "Today":
-                            if transaction_date.date() != current_date.date():
-                                visible = False
-                        elif self.filter_state["date_range"] == "This Week":
-                            days_since = (current_date.date() - transaction_date.date()).days
-                            if days_since < 0 or days_since >= 7:
-                                visible = False
-                        elif self.filter_state["date_range"] == "This Month":
-                            if (transaction_date.year != current_date.year or 
-                                transaction_date.month != current_date.month):
-                                visible = False
-                    except ValueError:
-                        pass
-            
-            # Apply payment method filter
-            if visible and self.filter_state["payment_method"] != "All Methods":
-                payment_item = self.sales_table.item(row, 6)
-                if payment_item and payment_item.text() != self.filter_state["payment_method"]:
-                    visible = False
-            
-            # Apply amount range filter
-            if visible and self.filter_state["amount_range"] != "All Amounts":
-                amount_item = self.sales_table.item(row, 4)
-                if amount_item:
-                    try:
-                        amount = float(amount_item.text().replace('₱', '').replace(',', ''))
-                        amount_range = self.filter_state["amount_range"]
-                        
-                        if amount_range == "Under ₱500" and amount >= 500:
-                            visible = False
-                        elif amount_range == "₱500 - ₱1,000" and (amount < 500 or amount > 1000):
-                            visible = False
-                        elif amount_range == "₱1,000 - ₱2,500" and (amount < 1000 or amount > 2500):
-                            visible = False
-                        elif amount_range == "₱2,500 - ₱5,000" and (amount < 2500 or amount > 5000):
-                            visible = False
-                        elif amount_range == "Over ₱5,000" and amount <= 5000:
-                            visible = False
-                    except ValueError:
-                        pass
-            
-            # Apply service filter
-            if visible and self.filter_state["service"] != "All Services":
-                service_item = self.sales_table.item(row, 3)
-                if service_item and service_item.text() != self.filter_state["service"]:
-                    visible = False
-            
-            # Set row visibility
-            self.sales_table.setRowHidden(row, not visible)
-            
-            # Track if at least one row is visible
-            if visible:
-                rows_visible = True
-        
-        # Show a message if no results are found
-        if not rows_visible and self.sales_table.rowCount() > 0:
-            QtWidgets.QMessageBox.information(self, "No Results", 
-                "No sales match the current filters. Try adjusting your filter criteria.")
+        self.report_no_results = True
+        self.load_sales_data()
     
     def rebuild_table(self):
         """Completely rebuild the table with fresh data"""
-        # Store current filter state
-        was_filtered = self.filter_state["is_active"]
-        filter_state_copy = self.filter_state.copy()
-        
-        # Reset filter state temporarily
-        self.filter_state = {
-            "is_active": False,
-            "date_range": "All Time",
-            "payment_method": "All Methods",
-            "amount_range": "All Amounts",
-            "service": "All Services"
-        }
-        
-        # Reload data
         self.load_sales_data()
-        
-        # Restore filter state if necessary
-        if was_filtered:
-            self.filter_state = filter_state_copy
-            # Add a short delay before applying filters to ensure table is fully rendered
-            QtCore.QTimer.singleShot(50, self.apply_stored_filters)
     
     def show_context_menu(self, position):
         """Show context menu for the table"""
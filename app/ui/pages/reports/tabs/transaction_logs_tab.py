@@ -1,17 +1,23 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
-import mysql.connector
-from app.utils.db_manager import DBManager
 from datetime import datetime, timedelta
+from app.utils.date_ranges import DateRange
 from ..table_factory import TableFactory
 from ..style_factory import StyleFactory
 from ..control_panel_factory import ControlPanelFactory
+from app.utils.query_runner import QueryRunner
+from app.utils.repositories import TransactionRepository
+from app.utils.event_bus import EventBus, TransactionCreated
 
 class TransactionLogsTab(QtWidgets.QWidget):
     """Tab for displaying transaction logs"""
     
+    # Most recent transactions shown in the log
+    LOG_LIMIT = 1000
+    
     def __init__(self, parent=None):
         super(TransactionLogsTab, self).__init__()
         self.parent = parent
+        self.load_task = None
         self.filter_state = {
             "is_active": False,
             "date_range": "All Time",
@@ -21,6 +27,9 @@ class TransactionLogsTab(QtWidgets.QWidget):
         }
         self.setup_ui()
         
+        # Reload when the data behind this report changes
+        EventBus.subscribe(TransactionCreated, lambda event: self.refresh_data(), widget=self)
+        
     def setup_ui(self):
         """Set up the UI components"""
         self.layout = QtWidgets.QVBoxLayout(self)
@@ -88,59 +97,51 @@ class TransactionLogsTab(QtWidgets.QWidget):
         self.layout.addWidget(self.filter_indicator)
     
     def load_transaction_logs(self):
-        """Load transaction logs data"""
-        try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
+        """Load transaction logs data in the background"""
+        # Drop any load still in flight so a stale result never lands last
+        if self.load_task:
+            self.load_task.cancel()
+        
+        self.load_task = QueryRunner.submit(
+            lambda conn: TransactionRepository.history(conn, limit=self.LOG_LIMIT, with_notes=True),
+            on_result=self.populate_transaction_logs,
+            on_error=self.show_load_error
+        )
+    
+    def populate_transaction_logs(self, logs):
+        """Populate the table with logs fetched by the query runner"""
+        self.load_task = None
+        
+        self.logs_table.setRowCount(len(logs))
+        
+        for row, log in enumerate(logs):
+            self.logs_table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(log.transaction_id)))
+            self.logs_table.setItem(row, 1, QtWidgets.QTableWidgetItem(log.customer_name))
+            self.logs_table.setItem(row, 2, QtWidgets.QTableWidgetItem(log.service_name))
             
-            cursor.execute("""
-                SELECT 
-                    t.transaction_id,
-                    t.customer_name,
-                    s.service_name,
-                    t.total_amount,
-                    t.payment_method,
-                    u.username as staff_name,
-                    t.transaction_date,
-                    t.notes
-                FROM transactions t
-                LEFT JOIN services s ON t.service_id = s.service_id
-                LEFT JOIN users u ON t.created_by = u.user_id
-                ORDER BY t.transaction_date DESC
-                LIMIT 1000
-            """)
+            amount_item = QtWidgets.QTableWidgetItem(f"₱{float(log.total_amount):.2f}")
+            amount_item.setTextAlignment(QtCore.Qt.AlignRight)
+            self.logs_table.setItem(row, 3, amount_item)
             
-            logs = cursor.fetchall()
-            self.logs_table.setRowCount(len(logs))
+            self.logs_table.setItem(row, 4, QtWidgets.QTableWidgetItem(log.payment_method))
+            self.logs_table.setItem(row, 5, QtWidgets.QTableWidgetItem(log.staff_name))
             
-            for row, log in enumerate(logs):
-                self.logs_table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(log.get('transaction_id', ''))))
-                self.logs_table.setItem(row, 1, QtWidgets.QTableWidgetItem(log.get('customer_name', '')))
-                self.logs_table.setItem(row, 2, QtWidgets.QTableWidgetItem(log.get('service_name', '')))
-                
-                amount_item = QtWidgets.QTableWidgetItem(f"₱{float(log.get('total_amount', 0)):.2f}")
-                amount_item.setTextAlignment(QtCore.Qt.AlignRight)
-                self.logs_table.setItem(row, 3, amount_item)
-                
-                self.logs_table.setItem(row, 4, QtWidgets.QTableWidgetItem(log.get('payment_method', '')))
-                self.logs_table.setItem(row, 5, QtWidgets.QTableWidgetItem(log.get('staff_name', '')))
-                
-                date = log.get('transaction_date')
-                date_str = date.strftime('%Y-%m-%d %H:%M') if date else ""
-                self.logs_table.setItem(row, 6, QtWidgets.QTableWidgetItem(date_str))
-                
-                notes = log.get('notes', '') or 'No notes'
-                self.logs_table.setItem(row, 7, QtWidgets.QTableWidgetItem(notes[:50] + '...' if len(notes) > 50 else notes))
-            
-            cursor.close()
-            
-            # Re-apply any active filters after loading data
-            if self.filter_state["is_active"]:
-                self.apply_stored_filters()
+            date = log.transaction_date
+            date_str = date.strftime('%Y-%m-%d %H:%M') if date else ""
+            self.logs_table.setItem(row, 6, QtWidgets.QTableWidgetItem(date_str))
             
-        except mysql.connector.Error as err:
-            if self.parent:
-                self.parent.show_error_message(f"Database error: {err}")
+            notes = log.notes or 'No notes'
+            self.logs_table.setItem(row, 7, QtWidgets.QTableWidgetItem(notes[:50] + '...' if len(notes) > 50 else notes))
+        
+        # Re-apply any active filters after loading data
+        if self.filter_state["is_active"]:
+            self.apply_stored_filters()
+    
+    def show_load_error(self, message):
+        """Report a failed background load"""
+        self.load_task = None
+        if self.parent:
+            self.parent.show_error_message(f"Database error: {message}")
     
     def filter_transaction_logs(self):
         """Filter transaction logs based on search input"""
@@ -207,7 +208,7 @@ class TransactionLogsTab(QtWidgets.QWidget):
         if not self.filter_state["is_active"]:
             return
             
-        current_date = datetime.now()
+        date_bounds = DateRange.bounds(self.filter_state["date_range"])
         
         # Track if any row is visible
         rows_visible = False
@@ -216,31 +217,13 @@ class TransactionLogsTab(QtWidgets.QWidget):
             visible = True
             
             # Apply date range filter
-            if self.filter_state["date_range"] != "All Time":
+            if date_bounds:
                 date_item = self.logs_table.item(row, 6)
                 if date_item and date_item.text():
                     try:
                         transaction_date = datetime.strptime(date_item.text(), '%Y-%m-%d %H:%M')
-                        
-                        if self.filter_state["date_range"] == "Today":
-                            if transaction_date.date() != current_date.date():
-                                visible = False
-                        elif self.filter_state["date_range"] == "This Week":
-                            days_since = (current_date.date() - transaction_date.date()).days
-                            if days_since < 0 or days_since >= 7:
-                                visible = False
-                        elif self.filter_state["date_range"] == "This Month":
-                            if (transaction_date.year != current_date.year or 
-                                transaction_date.month != current_date.month):
-                                visible = False
-                        elif self.filter_state["date_range"] == "Last 30 Days":
-                            days_since = (current_date.date() - transaction_date.date()).days
-                            if days_since < 0 or days_since > 30:
-                                visible = False
-                        elif self.filter_state["date_range"] == "Last 90 Days":
-                            days_since = (current_date.date() - transaction_date.date()).days
-                            if days_since < 0 or days_since > 90:
-                                visible = False
+                        if not DateRange.contains(date_bounds, transaction_date):
+                            visible = False
                     except ValueError:
                         pass
             
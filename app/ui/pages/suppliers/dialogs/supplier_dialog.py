@@ -1,6 +1,8 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
 import mysql.connector
 from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
+from app.utils.event_bus import EventBus, StockChanged, SupplierReceived
 from .base_dialog import BaseDialog
 
 class SupplierDialog(BaseDialog):
@@ -199,6 +201,7 @@ class SupplierDialog(BaseDialog):
                     (supplier_name, product_name, category, contact_number, 
                      email, accepts_returns, products_on_the_way, status, self.item['supplier_id'])
                 )
+                supplier_id = self.item['supplier_id']
             else:
                 # Insert new supplier
                 cursor.execute(
@@ -208,14 +211,24 @@ class SupplierDialog(BaseDialog):
                     (supplier_name, product_name, category, contact_number, 
                      email, accepts_returns, products_on_the_way, status)
                 )
+                supplier_id = cursor.lastrowid
             
             # If status changed to "received", update inventory
-            if status == 'received' and (old_status != 'received' or not self.item):
-                self.update_inventory_on_received(cursor, product_name, category, products_on_the_way)
+            received = status == 'received' and (old_status != 'received' or not self.item)
+            product_id = None
+            if received:
+                product_id = self.update_inventory_on_received(cursor, product_name, category, products_on_the_way)
             
             conn.commit()
+            ReferenceCache.invalidate("suppliers", "products", "inventory_status")
             cursor.close()
             
+            # Inventory and delivery report views refresh themselves
+            if received:
+                EventBus.publish(SupplierReceived([supplier_id]))
+                if product_id is not None:
+                    EventBus.publish(StockChanged([product_id]))
+            
             # Show success message with inventory update info
             if status == 'received' and products_on_the_way > 0:
                 QtWidgets.QMessageBox.information(
@@ -232,9 +245,12 @@ class SupplierDialog(BaseDialog):
             QtWidgets.QMessageBox.critical(self, "Database Error", f"Error saving supplier: {err}")
 
     def update_inventory_on_received(self, cursor, product_name, category, quantity):
-        """Update inventory when supplier status changes to received"""
+        """Update inventory when supplier status changes to received
+        
+        Returns the ID of the restocked product, or None when nothing was received
+        """
         if quantity <= 0:
-            return
+            return None
         
         try:
             # Check if product already exists in inventory
@@ -279,6 +295,7 @@ class SupplierDialog(BaseDialog):
             )
             
             print(f"✓ Updated inventory status for {product_name}: {quantity} units received")
+            return product_id
             
         except mysql.connector.Error as err:
             print(f"Error updating inventory: {err}")
@@ -1,7 +1,10 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
 import mysql.connector
 from app.utils.db_manager import DBManager
+from app.utils.reference_cache import ReferenceCache
+from app.utils.repositories import SupplierRepository
 from app.utils.inventory_updater import InventoryUpdater
+from app.utils.event_bus import EventBus, StockChanged, SupplierReceived
 from ..table_factory import TableFactory
 from ..style_factory import StyleFactory
 from ..control_panel_factory import ControlPanelFactory
@@ -85,48 +88,46 @@ class SuppliersTab(QtWidgets.QWidget):
         """Load suppliers from the database and populate the table"""
         try:
             conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
             
             # Clear existing items
             self.suppliers_table.setRowCount(0)
             
             # Query for all suppliers
-            cursor.execute("SELECT * FROM suppliers ORDER BY supplier_name")
-            suppliers = cursor.fetchall()
+            suppliers = SupplierRepository.all(conn)
             
             # Populate the table
             self.suppliers_table.setRowCount(len(suppliers))
             
             for row, supplier in enumerate(suppliers):
                 # Set item with proper alignment
-                id_item = QtWidgets.QTableWidgetItem(str(supplier['supplier_id']))
+                id_item = QtWidgets.QTableWidgetItem(str(supplier.supplier_id))
                 id_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 self.suppliers_table.setItem(row, 0, id_item)
                 
                 # Supplier name
-                self.suppliers_table.setItem(row, 1, QtWidgets.QTableWidgetItem(supplier['supplier_name']))
+                self.suppliers_table.setItem(row, 1, QtWidgets.QTableWidgetItem(supplier.supplier_name))
                 
                 # Product name
-                self.suppliers_table.setItem(row, 2, QtWidgets.QTableWidgetItem(supplier['product_name']))
+                self.suppliers_table.setItem(row, 2, QtWidgets.QTableWidgetItem(supplier.product_name))
                 
                 # Category
-                self.suppliers_table.setItem(row, 3, QtWidgets.QTableWidgetItem(supplier.get('category', '')))
+                self.suppliers_table.setItem(row, 3, QtWidgets.QTableWidgetItem(supplier.category))
                 
                 # Contact number - center aligned
-                contact_item = QtWidgets.QTableWidgetItem(supplier.get('contact_number', ''))
+                contact_item = QtWidgets.QTableWidgetItem(supplier.contact_number)
                 contact_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 self.suppliers_table.setItem(row, 4, contact_item)
                 
                 # Email
-                self.suppliers_table.setItem(row, 5, QtWidgets.QTableWidgetItem(supplier.get('email', '')))
+                self.suppliers_table.setItem(row, 5, QtWidgets.QTableWidgetItem(supplier.email))
                 
                 # Accepts Returns with color indicators
-                accepts_returns = "Yes" if supplier.get('accepts_returns', False) else "No"
+                accepts_returns = "Yes" if supplier.accepts_returns else "No"
                 returns_item = QtWidgets.QTableWidgetItem(accepts_returns)
                 returns_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 
                 # Set color based on accepts_returns
-                if supplier.get('accepts_returns', False):
+                if supplier.accepts_returns:
                     returns_item.setForeground(QtGui.QColor("#4CAF50"))  # Green for yes
                 else:
                     returns_item.setForeground(QtGui.QColor("#FF5252"))  # Red for no
@@ -134,7 +135,7 @@ class SuppliersTab(QtWidgets.QWidget):
                 self.suppliers_table.setItem(row, 6, returns_item)
                 
                 # Products on the way
-                on_the_way = supplier.get('products_on_the_way', 0)
+                on_the_way = supplier.products_on_the_way or 0
                 on_the_way_text = str(on_the_way) if on_the_way > 0 else "None"
                 on_the_way_item = QtWidgets.QTableWidgetItem(on_the_way_text)
                 on_the_way_item.setTextAlignment(QtCore.Qt.AlignCenter)
@@ -145,7 +146,7 @@ class SuppliersTab(QtWidgets.QWidget):
                 self.suppliers_table.setItem(row, 7, on_the_way_item)
                 
                 # Status column with special handling for received items
-                status = supplier.get('status', 'pending')
+                status = supplier.status
                 status_item = QtWidgets.QTableWidgetItem(status.capitalize())
                 status_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 
@@ -159,8 +160,6 @@ class SuppliersTab(QtWidgets.QWidget):
                 
                 self.suppliers_table.setItem(row, 8, status_item)
             
-            cursor.close()
-            
             # Re-apply any active filters after loading data
             if self.filter_state["is_active"]:
                 self.apply_stored_filters()
@@ -375,27 +374,34 @@ class SuppliersTab(QtWidgets.QWidget):
         
         if confirm == QtWidgets.QMessageBox.Yes:
             try:
-                conn = DBManager.get_connection()
-                cursor = conn.cursor()
-                
-                # Update supplier status to received
-                cursor.execute(
-                    "UPDATE suppliers SET status = 'received' WHERE supplier_id = %s",
-                    (supplier_id,)
-                )
-                
-                # Update inventory
-                success, message = InventoryUpdater.update_inventory_on_delivery(
-                    supplier_id, product_name, category, products_on_way, supplier_name
-                )
-                
-                conn.commit()
-                cursor.close()
+                # Lease a dedicated connection so the status change and the
+                # inventory update commit or roll back together
+                with DBManager.connection() as conn:
+                    cursor = conn.cursor()
+                    
+                    # Update supplier status to received
+                    cursor.execute(
+                        "UPDATE suppliers SET status = 'received' WHERE supplier_id = %s",
+                        (supplier_id,)
+                    )
+                    cursor.close()
+                    
+                    # Update inventory
+                    success, message = InventoryUpdater.update_inventory_on_delivery(
+                        supplier_id, product_name, category, products_on_way, supplier_name, conn=conn
+                    )
+                    
+                    if success:
+                        conn.commit()
+                        ReferenceCache.invalidate("suppliers", "products", "inventory_status")
                 
                 if success:
+                    # Inventory and delivery report views refresh themselves
+                    EventBus.publish(SupplierReceived([supplier_id]))
+                    EventBus.publish(StockChanged())
+                    
                     QtWidgets.QMessageBox.information(self, "Success", message)
                     self.load_suppliers()  # Refresh the table
-                    self.refresh_inventory_displays()  # Refresh inventory displays
                 else:
                     QtWidgets.QMessageBox.critical(self, "Error", message)
                     
@@ -407,8 +413,6 @@ class SuppliersTab(QtWidgets.QWidget):
         dialog = SupplierDialog(self)
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
             self.load_suppliers()
-            # Refresh inventory if needed
-            self.refresh_inventory_displays()
     
     def edit_supplier(self, row):
         """Edit the selected supplier - with protection for received items"""
@@ -438,8 +442,6 @@ class SuppliersTab(QtWidgets.QWidget):
                 dialog = SupplierDialog(self, supplier)
                 if dialog.exec_() == QtWidgets.QDialog.Accepted:
                     self.load_suppliers()
-                    # Refresh inventory if needed
-                    self.refresh_inventory_displays()
                     
         except mysql.connector.Error as err:
             if self.parent:
@@ -539,6 +541,7 @@ class SuppliersTab(QtWidgets.QWidget):
                 cursor.execute("DELETE FROM suppliers WHERE supplier_id = %s", (supplier_id,))
                 
                 conn.commit()
+                ReferenceCache.invalidate("suppliers")
                 cursor.close()
                 
                 # Refresh the supplier list
@@ -574,11 +577,9 @@ class SuppliersTab(QtWidgets.QWidget):
         
         try:
             conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
             
             # Query for all suppliers
-            cursor.execute("SELECT * FROM suppliers ORDER BY supplier_name")
-            suppliers = cursor.fetchall()
+            suppliers = SupplierRepository.all(conn)
             
             # Create and configure a new table from scratch
             new_table = TableFactory.create_table()
@@ -605,34 +606,34 @@ class SuppliersTab(QtWidgets.QWidget):
             
             for row, supplier in enumerate(suppliers):
                 # Set item with proper alignment
-                id_item = QtWidgets.QTableWidgetItem(str(supplier['supplier_id']))
+                id_item = QtWidgets.QTableWidgetItem(str(supplier.supplier_id))
                 id_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 new_table.setItem(row, 0, id_item)
                 
                 # Supplier name
-                new_table.setItem(row, 1, QtWidgets.QTableWidgetItem(supplier['supplier_name']))
+                new_table.setItem(row, 1, QtWidgets.QTableWidgetItem(supplier.supplier_name))
                 
                 # Product name
-                new_table.setItem(row, 2, QtWidgets.QTableWidgetItem(supplier['product_name']))
+                new_table.setItem(row, 2, QtWidgets.QTableWidgetItem(supplier.product_name))
                 
                 # Category
-                new_table.setItem(row, 3, QtWidgets.QTableWidgetItem(supplier.get('category', '')))
+                new_table.setItem(row, 3, QtWidgets.QTableWidgetItem(supplier.category))
                 
                 # Contact number - center aligned
-                contact_item = QtWidgets.QTableWidgetItem(supplier.get('contact_number', ''))
+                contact_item = QtWidgets.QTableWidgetItem(supplier.contact_number)
                 contact_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 new_table.setItem(row, 4, contact_item)
                 
                 # Email
-                new_table.setItem(row, 5, QtWidgets.QTableWidgetItem(supplier.get('email', '')))
+                new_table.setItem(row, 5, QtWidgets.QTableWidgetItem(supplier.email))
                 
                 # Accepts Returns with color indicators
-                accepts_returns = "Yes" if supplier.get('accepts_returns', False) else "No"
+                accepts_returns = "Yes" if supplier.accepts_returns else "No"
                 returns_item = QtWidgets.QTableWidgetItem(accepts_returns)
                 returns_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 
                 # Set color based on accepts_returns
-                if supplier.get('accepts_returns', False):
+                if supplier.accepts_returns:
                     returns_item.setForeground(QtGui.QColor("#4CAF50"))  # Green for yes
                 else:
                     returns_item.setForeground(QtGui.QColor("#FF5252"))  # Red for no
@@ -640,7 +641,7 @@ class SuppliersTab(QtWidgets.QWidget):
                 new_table.setItem(row, 6, returns_item)
                 
                 # Products on the way
-                on_the_way = supplier.get('products_on_the_way', 0)
+                on_the_way = supplier.products_on_the_way or 0
                 on_the_way_text = str(on_the_way) if on_the_way > 0 else "None"
                 on_the_way_item = QtWidgets.QTableWidgetItem(on_the_way_text)
                 on_the_way_item.setTextAlignment(QtCore.Qt.AlignCenter)
@@ -651,7 +652,7 @@ class SuppliersTab(QtWidgets.QWidget):
                 new_table.setItem(row, 7, on_the_way_item)
                 
                 # Status - new column logic with special styling for received items
-                status = supplier.get('status', 'pending')
+                status = supplier.status
                 status_item = QtWidgets.QTableWidgetItem(status.capitalize())
                 status_item.setTextAlignment(QtCore.Qt.AlignCenter)
                 
@@ -682,8 +683,6 @@ class SuppliersTab(QtWidgets.QWidget):
             self.suppliers_table = new_table
             old_table.deleteLater()
             
-            cursor.close()
-            
             # Restore filter state if necessary
             if was_filtered:
                 self.filter_state = filter_state_copy
@@ -694,11 +693,4 @@ class SuppliersTab(QtWidgets.QWidget):
             if self.parent:
                 self.parent.show_error_message(f"Database error: {err}")
             else:
-                QtWidgets.QMessageBox.critical(self, "Error", f"Database error: {err}")
-
-    def refresh_inventory_displays(self):
-        """Refresh inventory-related displays"""
-        if self.parent and hasattr(self.parent, "update_overview_tab"):
-            self.parent.update_overview_tab()
-        if self.parent and hasattr(self.parent, "inventory_status_tab"):
-            self.parent.inventory_status_tab.load_inventory()
\ No newline at end of file
+                QtWidgets.QMessageBox.critical(self, "Error", f"Database error: {err}")
\ No newline at end of file
@@ -0,0 +1,215 @@
+from collections import OrderedDict
+import abc
+from PyQt5 import QtCore, QtGui
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import threading
+
+
+class Chart(abc.ABC):
+    """Base class for charts drawn by ChartRenderer
+
+    A chart owns one Agg figure for its lifetime. create() adds its axes and
+    artists once; update() then changes their data in place for each render.
+    Both only ever run on the render thread, so subclasses must define
+    them; one missing fails when the chart is constructed.
+    """
+
+    # Identifies the chart's images in the render cache
+    NAME = ""
+
+    # Figure resolution; the widget size in pixels sets the figure size
+    DPI = 80
+
+    FACE_COLOR = '#232323'
+
+    def __init__(self):
+        self.figure = None
+        self.canvas = None
+
+    @abc.abstractmethod
+    def create(self, figure):
+        """Add the chart's axes and artists to its new figure"""
+
+    @abc.abstractmethod
+    def update(self, data):
+        """Show new data in the chart's existing artists"""
+
+    def render(self, data, width, height, pixel_ratio=1.0):
+        """Draw the chart with some data into an image
+
+        Args:
+            data: Rows the chart's update() accepts
+            width (int): Image width in device-independent pixels
+            height (int): Image height in device-independent pixels
+            pixel_ratio (float): Device pixels per device-independent pixel
+
+        Returns:
+            QImage: The rendered chart
+        """
+        if self.figure is None:
+            self.figure = Figure(facecolor=self.FACE_COLOR, dpi=self.DPI)
+            self.canvas = FigureCanvasAgg(self.figure)
+            self.create(self.figure)
+
+        dpi = self.DPI * pixel_ratio
+        self.figure.set_dpi(dpi)
+        self.figure.set_size_inches(width * pixel_ratio / dpi, height * pixel_ratio / dpi)
+
+        self.update(data)
+        self.canvas.draw()
+
+        # Copy out of matplotlib's buffer, which the next draw reuses
+        buffer = self.canvas.buffer_rgba()
+        image = QtGui.QImage(buffer, buffer.shape[1], buffer.shape[0], QtGui.QImage.Format_RGBA8888).copy()
+        image.setDevicePixelRatio(pixel_ratio)
+        return image
+
+
+class ChartRenderSignals(QtCore.QObject):
+    """Signals emitted by a chart render task"""
+
+    rendered = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(str)
+
+
+class ChartRenderTask(QtCore.QRunnable):
+    """Runnable that renders a chart on the render thread"""
+
+    def __init__(self, chart, data, key):
+        """Initialize the task
+
+        Args:
+            chart (Chart): Chart to draw
+            data: Data to draw it with
+            key (tuple): Cache key of the image; see ChartRenderer.key()
+        """
+        super(ChartRenderTask, self).__init__()
+        self.chart = chart
+        self.data = data
+        self.key = key
+        self.signals = ChartRenderSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Cancel the task; a cancelled task is skipped if it has not started"""
+        self._cancelled.set()
+
+    def is_cancelled(self):
+        """Check whether the task has been cancelled"""
+        return self._cancelled.is_set()
+
+    def run(self):
+        """Render the chart and cache the image"""
+        if self.is_cancelled():
+            return
+
+        _, _, width, height, pixel_ratio = self.key
+        try:
+            image = self.chart.render(self.data, width, height, pixel_ratio)
+        except Exception as err:
+            if not self.is_cancelled():
+                self.signals.failed.emit(str(err))
+            return
+
+        ChartRenderer.store(self.key, image)
+        if not self.is_cancelled():
+            self.signals.rendered.emit(image)
+
+
+class ChartRenderer:
+    """Renders charts to images off the UI thread, caching the results
+
+    Charts are drawn with matplotlib's Agg backend on a single render thread,
+    so each chart's figure is only touched by one thread, and the Qt
+    backend is never loaded. Images are cached by chart, data version and
+    size: showing data that was already drawn at that size costs nothing.
+    """
+
+    # Images kept; the least recently used are dropped first
+    CAPACITY = 16
+
+    # Cache key -> QImage, least recently used first
+    _images = OrderedDict()
+    _lock = threading.Lock()
+
+    _thread_pool = None
+
+    @classmethod
+    def thread_pool(cls):
+        """Get the render thread pool, a single thread separate from the database workers
+
+        Returns:
+            QThreadPool: The render thread pool
+        """
+        if cls._thread_pool is None:
+            cls._thread_pool = QtCore.QThreadPool()
+            cls._thread_pool.setMaxThreadCount(1)
+        return cls._thread_pool
+
+    @staticmethod
+    def key(chart, version, width, height, pixel_ratio=1.0):
+        """Build the cache key of a chart image
+
+        Args:
+            chart (Chart): The chart
+            version: Hashable version of the data drawn; equal versions must
+                mean equal data
+            width, height (int): Image size in device-independent pixels
+            pixel_ratio (float): Device pixels per device-independent pixel
+
+        Returns:
+            tuple: Cache key
+        """
+        return (chart.NAME, version, int(width), int(height), float(pixel_ratio))
+
+    @classmethod
+    def cached(cls, key):
+        """Get a cached image
+
+        Returns:
+            QImage: The image, or None if it has not been rendered
+        """
+        with cls._lock:
+            image = cls._images.get(key)
+            if image is not None:
+                cls._images.move_to_end(key)
+            return image
+
+    @classmethod
+    def store(cls, key, image):
+        """Cache a rendered image"""
+        with cls._lock:
+            cls._images[key] = image
+            cls._images.move_to_end(key)
+            while len(cls._images) > cls.CAPACITY:
+                cls._images.popitem(last=False)
+
+    @classmethod
+    def submit(cls, chart, data, key, on_result=None, on_error=None):
+        """Render a chart in the background
+
+        Args:
+            chart (Chart): Chart to draw
+            data: Data to draw it with
+            key (tuple): Cache key from key(), which also sets the size
+            on_result (callable, optional): Receives the QImage on the UI thread
+            on_error (callable, optional): Receives the error message on the UI thread
+
+        Returns:
+            ChartRenderTask: Handle that can be used to cancel the render
+        """
+        task = ChartRenderTask(chart, data, key)
+
+        # Re-check cancellation on delivery, as QueryRunner does
+        if on_result:
+            task.signals.rendered.connect(
+                lambda image: None if task.is_cancelled() else on_result(image)
+            )
+        if on_error:
+            task.signals.failed.connect(
+                lambda message: None if task.is_cancelled() else on_error(message)
+            )
+
+        cls.thread_pool().start(task)
+        return task
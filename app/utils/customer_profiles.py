@@ -0,0 +1,288 @@
+import re
+
+
+class CustomerProfiles:
+    """Maintains the customers table of per-customer lifetime aggregates
+
+    Transactions only carry the customer's name and phone as typed at the
+    till. Profiles group them by normalized phone number and keep the visit
+    count, lifetime spend, first and last visit and favorite service up to
+    date, so looking a customer up is a primary key read instead of a GROUP BY
+    over the whole sales history.
+    """
+
+    # Transactions read per batch while backfilling
+    BACKFILL_BATCH_SIZE = 5000
+
+    CREATE_CUSTOMERS = """
+        CREATE TABLE IF NOT EXISTS customers (
+            phone_key VARCHAR(20) NOT NULL,
+            customer_name VARCHAR(100) NOT NULL,
+            customer_phone VARCHAR(20) NOT NULL,
+            customer_gender VARCHAR(20) DEFAULT NULL,
+            customer_city VARCHAR(100) DEFAULT NULL,
+            visit_count INT NOT NULL DEFAULT 0,
+            lifetime_spend DECIMAL(14,2) NOT NULL DEFAULT 0.00,
+            first_visit DATETIME NOT NULL,
+            last_visit DATETIME NOT NULL,
+            favorite_service_id INT DEFAULT NULL,
+            PRIMARY KEY (phone_key),
+            KEY idx_customers_name (customer_name),
+            KEY idx_customers_last_visit (last_visit)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci
+    """
+
+    CREATE_CUSTOMER_SERVICES = """
+        CREATE TABLE IF NOT EXISTS customer_services (
+            phone_key VARCHAR(20) NOT NULL,
+            service_id INT NOT NULL,
+            visit_count INT NOT NULL DEFAULT 0,
+            last_visit DATETIME NOT NULL,
+            PRIMARY KEY (phone_key, service_id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci
+    """
+
+    # Contact details follow the most recent visit, except that a missing
+    # gender or city (NULL) never replaces a known one; the aggregates accumulate.
+    # MySQL applies the assignments in order, so last_visit is compared before
+    # it is updated.
+    UPSERT_CUSTOMER = """
+        INSERT INTO customers (
+            phone_key, customer_name, customer_phone, customer_gender, customer_city,
+            visit_count, lifetime_spend, first_visit, last_visit
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            customer_name = IF(VALUES(last_visit) >= last_visit, VALUES(customer_name), customer_name),
+            customer_phone = IF(VALUES(last_visit) >= last_visit, VALUES(customer_phone), customer_phone),
+            customer_gender = IF(VALUES(last_visit) >= last_visit AND VALUES(customer_gender) IS NOT NULL,
+                                 VALUES(customer_gender), customer_gender),
+            customer_city = IF(VALUES(last_visit) >= last_visit AND VALUES(customer_city) IS NOT NULL,
+                               VALUES(customer_city), customer_city),
+            visit_count = visit_count + VALUES(visit_count),
+            lifetime_spend = lifetime_spend + VALUES(lifetime_spend),
+            first_visit = LEAST(first_visit, VALUES(first_visit)),
+            last_visit = GREATEST(last_visit, VALUES(last_visit))
+    """
+
+    UPSERT_CUSTOMER_SERVICE = """
+        INSERT INTO customer_services (phone_key, service_id, visit_count, last_visit)
+        VALUES (%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            visit_count = visit_count + VALUES(visit_count),
+            last_visit = GREATEST(last_visit, VALUES(last_visit))
+    """
+
+    # Most visited service, most recent first on ties; reads one primary key prefix
+    FAVORITE_SERVICE = """
+        SELECT cs.service_id FROM customer_services cs
+        WHERE cs.phone_key = c.phone_key
+        ORDER BY cs.visit_count DESC, cs.last_visit DESC
+        LIMIT 1
+    """
+
+    @staticmethod
+    def normalize_phone(phone):
+        """Reduce a phone number as typed to the key profiles are stored under
+
+        Only digits are kept, and the +63 country code is written as the
+        local leading 0, so "+63 917-123-4567" and "09171234567" match.
+
+        Returns:
+            str: Phone key; empty when the phone has no digits
+        """
+        digits = re.sub(r"\D", "", phone or "")
+        if digits.startswith("63") and len(digits) == 12:
+            digits = "0" + digits[2:]
+        return digits[:20]
+
+    @classmethod
+    def create_tables(cls, cursor):
+        """Create the customers and customer_services tables"""
+        cursor.execute(cls.CREATE_CUSTOMERS)
+        cursor.execute(cls.CREATE_CUSTOMER_SERVICES)
+
+    @classmethod
+    def record_visits(cls, cursor, visits, update_favorites=True):
+        """Add visits to the customers' profiles
+
+        Call inside the transaction that saves the sales, so a profile never
+        counts a sale that was rolled back.
+
+        Args:
+            cursor: Cursor on the writing connection
+            visits (list): (name, phone, gender, city, service IDs, amount,
+                visit date) tuples, one per sale; every service sold counts
+                towards the customer's services, while the visit and amount
+                count once. Visits without a usable phone are skipped.
+            update_favorites (bool): Recompute the changed profiles' favorite
+                service; bulk loads do it once at the end instead
+
+        Returns:
+            list: Phone keys of the profiles that changed
+        """
+        customers = {}
+        services = {}
+
+        for name, phone, gender, city, service_ids, amount, visit_date in visits:
+            key = cls.normalize_phone(phone)
+            if not key:
+                continue
+
+            profile = customers.get(key)
+            if profile is None:
+                profile = customers[key] = {
+                    "visits": 0, "spend": 0, "first": visit_date, "last": visit_date,
+                    "contact": (name, phone, gender or None, city or None),
+                }
+            profile["visits"] += 1
+            profile["spend"] += amount or 0
+            profile["first"] = min(profile["first"], visit_date)
+            if visit_date >= profile["last"]:
+                profile["last"] = visit_date
+                profile["contact"] = (name, phone, gender or None, city or None)
+
+            # A service sold twice on one invoice is still one visit for it
+            for service_id in set(service_ids) - {None}:
+                count, last = services.get((key, service_id), (0, visit_date))
+                services[(key, service_id)] = (count + 1, max(last, visit_date))
+
+        if not customers:
+            return []
+
+        cursor.executemany(cls.UPSERT_CUSTOMER, [
+            (key, *profile["contact"], profile["visits"], profile["spend"], profile["first"], profile["last"])
+            for key, profile in customers.items()
+        ])
+        if services:
+            cursor.executemany(cls.UPSERT_CUSTOMER_SERVICE, [
+                (key, service_id, count, last) for (key, service_id), (count, last) in services.items()
+            ])
+
+        keys = list(customers)
+        if update_favorites:
+            cls.refresh_favorites(cursor, keys)
+        return keys
+
+    @classmethod
+    def refresh_favorites(cls, cursor, phone_keys=None):
+        """Recompute the favorite service of some profiles, or of all of them"""
+        sql = f"UPDATE customers c SET favorite_service_id = ({cls.FAVORITE_SERVICE})"
+        params = ()
+        if phone_keys is not None:
+            sql += f" WHERE c.phone_key IN ({', '.join(['%s'] * len(phone_keys))})"
+            params = tuple(phone_keys)
+        cursor.execute(sql, params)
+
+    @classmethod
+    def backfill(cls, conn):
+        """Rebuild every profile from the sales history, one batch of transactions at a time
+
+        Services come from transaction_lines, so the lines must be backfilled
+        first. The tables are emptied first, so an interrupted backfill can simply be
+        run again. Each batch is committed as soon as it is written, so locks
+        on the profile tables are held for one batch, not the whole history.
+
+        Args:
+            conn: Open database connection; any open transaction is committed
+
+        Returns:
+            int: Number of transactions read
+        """
+        cursor = conn.cursor()
+        try:
+            cursor.execute("DELETE FROM customer_services")
+            cursor.execute("DELETE FROM customers")
+            conn.commit()
+
+            after = ""
+            total = 0
+            while True:
+                cursor.execute("""
+                    SELECT transaction_id, customer_name, customer_phone, customer_gender,
+                           customer_city, total_amount, transaction_date
+                    FROM transactions
+                    WHERE transaction_id > %s
+                    ORDER BY transaction_id
+                    LIMIT %s
+                """, (after, cls.BACKFILL_BATCH_SIZE))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+
+                # The batch's lines are one primary key range
+                cursor.execute("""
+                    SELECT transaction_id, service_id FROM transaction_lines
+                    WHERE transaction_id > %s AND transaction_id <= %s
+                """, (after, rows[-1][0]))
+                service_ids = {}
+                for transaction_id, service_id in cursor.fetchall():
+                    service_ids.setdefault(transaction_id, []).append(service_id)
+
+                # Favorites are computed once at the end rather than per batch
+                visits = [
+                    (name, phone, gender, city, service_ids.get(transaction_id, ()), amount, visit_date)
+                    for transaction_id, name, phone, gender, city, amount, visit_date in rows
+                ]
+                cls.record_visits(cursor, visits, update_favorites=False)
+                conn.commit()
+                after = rows[-1][0]
+                total += len(rows)
+
+            cls.refresh_favorites(cursor)
+            conn.commit()
+            return total
+        finally:
+            cursor.close()
+
+    @classmethod
+    def backfill_phone_keys(cls, conn):
+        """Store the phone key of every transaction, committing one batch at a time
+
+        Transactions keep the phone as typed; the key lets a profile's visits
+        be found with the same normalization the profile is stored under.
+
+        Args:
+            conn: Open database connection; any open transaction is committed
+
+        Returns:
+            int: Number of transactions updated
+        """
+        cursor = conn.cursor()
+        try:
+            after = ""
+            total = 0
+            while True:
+                cursor.execute("""
+                    SELECT transaction_id, customer_phone FROM transactions
+                    WHERE transaction_id > %s
+                    ORDER BY transaction_id
+                    LIMIT %s
+                """, (after, cls.BACKFILL_BATCH_SIZE))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+
+                cursor.executemany(
+                    "UPDATE transactions SET phone_key = %s WHERE transaction_id = %s",
+                    [(cls.normalize_phone(phone), transaction_id) for transaction_id, phone in rows]
+                )
+                conn.commit()
+                after = rows[-1][0]
+                total += len(rows)
+            return total
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def clear_blank_contacts(cursor):
+        """Store blank genders and cities as NULL, as missing values are elsewhere
+
+        Returns:
+            int: Number of profiles changed
+        """
+        cursor.execute("""
+            UPDATE customers
+            SET customer_gender = NULLIF(customer_gender, ''), customer_city = NULLIF(customer_city, '')
+            WHERE customer_gender = '' OR customer_city = ''
+        """)
+        return cursor.rowcount
@@ -1,91 +1,152 @@
 from PyQt5 import QtWidgets, QtCore
-from app.utils.db_manager import DBManager
-import mysql.connector
-from datetime import datetime
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from app.utils.query_runner import QueryRunner
+from app.utils.date_ranges import DateRange
+from app.utils.repositories import SalesRollupRepository, DailySales
+from app.utils.data_versions import DataVersions
+from datetime import date, timedelta
+from decimal import Decimal
 
 class DashboardUpdater:
     """Utility class for updating dashboard metrics and charts with fresh data"""
     
+    # Days before today shown in the sales chart, which always has a bar for each
+    SALES_DAYS = 7
+    
+    # Largest categories shown in the inventory chart
+    INVENTORY_CATEGORIES = 5
+    
     @staticmethod
-    def refresh_metrics_and_charts(dashboard_page):
-        """Refresh all dashboard metrics and charts with fresh data"""
-        print("Refreshing dashboard metrics and charts...")
+    def refresh_metrics_and_charts(dashboard_page, force=False):
+        """Refresh all dashboard metrics and charts with fresh data
         
-        try:
-            # First refresh metrics
-            DashboardUpdater._update_metrics(dashboard_page)
-            
-            # Then refresh charts
-            DashboardUpdater._update_charts(dashboard_page)
+        Only the data versions are read when nothing has changed since the
+        page's last refresh, so this is cheap enough to poll.
+        
+        Args:
+            dashboard_page: Page to refresh
+            force (bool): Reload even if the data versions have not changed
+        """
+        # Drop any refresh still in flight so a stale result never lands last
+        if getattr(dashboard_page, 'refresh_task', None):
+            dashboard_page.refresh_task.cancel()
+        
+        known_versions = None if force else getattr(dashboard_page, 'data_versions', None)
+        
+        def on_result(data):
+            dashboard_page.refresh_task = None
+            # Nothing changed; stay quiet, as this runs on every poll
+            if data is None:
+                return
             
-            print("✓ Dashboard refresh complete")
-            return True
-        except Exception as e:
-            print(f"Error refreshing dashboard: {e}")
-            return False
+            try:
+                # First refresh metrics
+                DashboardUpdater._update_metrics(dashboard_page, data['metrics'])
+                
+                # Then refresh charts
+                DashboardUpdater._update_charts(dashboard_page, data['sales'], data['inventory'])
+                
+                dashboard_page.data_versions = data['versions']
+                print("✓ Dashboard refresh complete")
+            except Exception as e:
+                print(f"Error refreshing dashboard: {e}")
+        
+        def on_error(message):
+            dashboard_page.refresh_task = None
+            print(f"Database error refreshing dashboard: {message}")
+        
+        # Query on a worker thread; widgets are only touched in on_result
+        dashboard_page.refresh_task = QueryRunner.submit(
+            lambda conn: DashboardUpdater.fetch_dashboard_data(conn, known_versions), on_result, on_error
+        )
+        return True
     
     @staticmethod
-    def _update_metrics(dashboard_page):
-        """Update the dashboard metric cards with fresh data"""
-        try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            
-            # Load total revenue (all time)
-            cursor.execute("""
-                SELECT COALESCE(SUM(total_amount), 0) as total_revenue 
-                FROM transactions
-            """)
-            total_revenue_data = cursor.fetchone()
-            total_revenue = total_revenue_data['total_revenue'] if total_revenue_data else 0
-            
-            # Load today's revenue
-            cursor.execute("""
-                SELECT COALESCE(SUM(total_amount), 0) as daily_revenue 
-                FROM transactions 
-                WHERE DATE(transaction_date) = CURDATE()
-            """)
-            daily_revenue_data = cursor.fetchone()
-            daily_revenue = daily_revenue_data['daily_revenue'] if daily_revenue_data else 0
-            
-            # Load total services count
-            cursor.execute("SELECT COUNT(*) as count FROM services")
-            services_count = cursor.fetchone()['count']
+    def fetch_dashboard_data(conn, known_versions=None):
+        """Fetch metrics and chart data for the dashboard
+        
+        Runs on a query runner worker thread and must not touch any widgets.
+        
+        Args:
+            conn: Leased database connection
+            known_versions (tuple, optional): Versions returned with the data
+                currently shown
             
-            # Load today's transactions count
+        Returns:
+            dict: Metric values plus sales and inventory chart rows and their
+                versions, or None if the versions equal known_versions
+        """
+        # Today's figures change at midnight as well as with the data. The
+        # probe's read opens the transaction's snapshot, so the data below is
+        # exactly what these versions describe.
+        versions = DataVersions.fetch(conn) + (date.today(),)
+        if versions == known_versions:
+            return None
+        
+        today = DateRange.bounds("Today")
+        week = DateRange.last_days(DashboardUpdater.SALES_DAYS)
+        
+        # Sales figures come from the daily rollup, all four in one statement
+        metrics = SalesRollupRepository.dashboard_metrics(conn, today)
+        
+        # Daily totals for the last week, with empty days filled in so the chart keeps its bars
+        sales_by_day = {day.sale_date: day for day in SalesRollupRepository.daily(conn, week)}
+        sales_data = [
+            sales_by_day.get(day) or DailySales(day, 0, Decimal(0))
+            for day in (date.today() - timedelta(days=days) for days in range(DashboardUpdater.SALES_DAYS, -1, -1))
+        ]
+        
+        cursor = conn.cursor(dictionary=True)
+        try:
+            # Get product categories and their stock levels
             cursor.execute("""
-                SELECT COUNT(*) as count 
-                FROM transactions 
-                WHERE DATE(transaction_date) = CURDATE()
-            """)
-            transactions_count = cursor.fetchone()['count']
-            
+                SELECT 
+                    category,
+                    COUNT(*) as total_products,
+                    SUM(CASE WHEN quantity > threshold_value THEN 1 ELSE 0 END) as in_stock,
+                    SUM(CASE WHEN quantity <= threshold_value AND quantity > 0 THEN 1 ELSE 0 END) as low_stock,
+                    SUM(CASE WHEN quantity = 0 THEN 1 ELSE 0 END) as out_of_stock
+                FROM products 
+                WHERE category IS NOT NULL AND category != ''
+                GROUP BY category
+                ORDER BY total_products DESC
+                LIMIT %s
+            """, (DashboardUpdater.INVENTORY_CATEGORIES,))
+            inventory_data = cursor.fetchall()
+        finally:
             cursor.close()
+        
+        return {
+            'metrics': metrics._asdict(),
+            'sales': sales_data,
+            'inventory': inventory_data,
+            'versions': versions
+        }
+    
+    @staticmethod
+    def _update_metrics(dashboard_page, metrics):
+        """Update the dashboard metric cards with fetched data"""
+        # Update metric cards if they exist
+        if hasattr(dashboard_page, 'total_revenue_card') and dashboard_page.total_revenue_card:
+            dashboard_page.total_revenue_card.value_label.setText(f"₱{metrics['total_revenue']:,.2f}")
             
-            # Update metric cards if they exist
-            if hasattr(dashboard_page, 'total_revenue_card') and dashboard_page.total_revenue_card:
-                dashboard_page.total_revenue_card.value_label.setText(f"₱{total_revenue:,.2f}")
-                
-            if hasattr(dashboard_page, 'today_revenue_card') and dashboard_page.today_revenue_card:
-                dashboard_page.today_revenue_card.value_label.setText(f"₱{daily_revenue:,.2f}")
-                
-            if hasattr(dashboard_page, 'services_card') and dashboard_page.services_card:
-                dashboard_page.services_card.value_label.setText(str(services_count))
-                
-            if hasattr(dashboard_page, 'transactions_card') and dashboard_page.transactions_card:
-                dashboard_page.transactions_card.value_label.setText(str(transactions_count))
+        if hasattr(dashboard_page, 'today_revenue_card') and dashboard_page.today_revenue_card:
+            dashboard_page.today_revenue_card.value_label.setText(f"₱{metrics['daily_revenue']:,.2f}")
             
-            print("✓ Dashboard metrics updated successfully")
+        if hasattr(dashboard_page, 'services_card') and dashboard_page.services_card:
+            dashboard_page.services_card.value_label.setText(str(metrics['services_count']))
+            dashboard_page.services_card.setToolTip("\n".join(
+                f"{service.service_name or 'Unknown'}: {service.times_sold} sold, ₱{service.revenue:,.2f}"
+                for service in metrics['service_revenue']
+            ))
             
-        except mysql.connector.Error as err:
-            print(f"Database error updating metrics: {err}")
-        except Exception as e:
-            print(f"Error updating metrics: {e}")
+        if hasattr(dashboard_page, 'transactions_card') and dashboard_page.transactions_card:
+            dashboard_page.transactions_card.value_label.setText(str(metrics['transactions_count']))
+        
+        print("✓ Dashboard metrics updated successfully")
     
     @staticmethod
-    def _update_charts(dashboard_page):
-        """Update the dashboard charts with fresh data"""
+    def _update_charts(dashboard_page, sales_data, inventory_data):
+        """Update the dashboard charts with fetched data"""
         try:
             # Check if the chart widgets exist
             if not (hasattr(dashboard_page, 'sales_chart_widget') and dashboard_page.sales_chart_widget):
@@ -96,48 +157,18 @@ class DashboardUpdater:
                 print("Inventory chart widget not found")
                 return
                 
-            # First replace the sales chart
+            # Both charts keep their canvas; only their data changes
             try:
-                new_sales_chart = dashboard_page.create_sales_chart()
-                
-                # Safely remove the old chart
-                for i in reversed(range(dashboard_page.sales_chart_widget.layout().count())):
-                    item = dashboard_page.sales_chart_widget.layout().itemAt(i)
-                    if item and item.widget() and isinstance(item.widget(), FigureCanvas):
-                        widget = item.widget()
-                        dashboard_page.sales_chart_widget.layout().removeWidget(widget)
-                        widget.setParent(None)
-                        widget.deleteLater()
-                
-                # Add the new chart and force a layout update
-                dashboard_page.sales_chart_widget.layout().addWidget(new_sales_chart, 1)
-                dashboard_page.sales_chart_widget.layout().update()
+                dashboard_page.update_sales_chart(sales_data)
                 print("✓ Sales chart updated successfully")
             except Exception as e:
                 print(f"Error updating sales chart: {e}")
                 
-            # Then replace the inventory chart
             try:
-                new_inventory_chart = dashboard_page.create_inventory_chart()
-                
-                # Safely remove the old chart
-                for i in reversed(range(dashboard_page.inventory_chart_widget.layout().count())):
-                    item = dashboard_page.inventory_chart_widget.layout().itemAt(i)
-                    if item and item.widget() and isinstance(item.widget(), FigureCanvas):
-                        widget = item.widget()
-                        dashboard_page.inventory_chart_widget.layout().removeWidget(widget)
-                        widget.setParent(None)
-                        widget.deleteLater()
-                
-                # Add the new chart and force a layout update
-                dashboard_page.inventory_chart_widget.layout().addWidget(new_inventory_chart, 1)
-                dashboard_page.inventory_chart_widget.layout().update()
+                dashboard_page.update_inventory_chart(inventory_data)
                 print("✓ Inventory chart updated successfully")
             except Exception as e:
                 print(f"Error updating inventory chart: {e}")
             
-            # Force update of the dashboard page
-            dashboard_page.update()
-            
         except Exception as e:
             print(f"Error updating charts: {e}")
\ No newline at end of file
@@ -0,0 +1,107 @@
+class DataVersions:
+    """Maintains data_versions, a change counter per watched table
+
+    Triggers bump a table's counter on every insert, update and delete, in
+    the same database transaction as the change, so a counter moves exactly
+    when other sessions can see new data. Views that poll read the counters
+    with one primary key lookup and only reload when a counter has moved,
+    which also picks up changes made on other terminals.
+    """
+
+    # Tables with counters; the dashboard reads sales from the rollup and stock from products
+    TABLES = ("sales_daily_rollup", "products")
+
+    EVENTS = ("INSERT", "UPDATE", "DELETE")
+
+    CREATE_TABLE = """
+        CREATE TABLE IF NOT EXISTS data_versions (
+            table_name VARCHAR(64) NOT NULL,
+            version BIGINT UNSIGNED NOT NULL DEFAULT 0,
+            PRIMARY KEY (table_name)
+        )
+    """
+
+    @staticmethod
+    def trigger_name(table, event):
+        """Get the name of the trigger counting one kind of change to a table"""
+        return f"trg_{table}_{event.lower()}_version"
+
+    @classmethod
+    def create(cls, cursor):
+        """Create the counters table and the triggers that maintain it
+
+        Existing triggers are replaced, so this can be re-run safely.
+        """
+        cursor.execute(cls.CREATE_TABLE)
+        cursor.execute(
+            "INSERT IGNORE INTO data_versions (table_name) VALUES "
+            + ", ".join(["(%s)"] * len(cls.TABLES)),
+            cls.TABLES
+        )
+
+        for table in cls.TABLES:
+            for event in cls.EVENTS:
+                name = cls.trigger_name(table, event)
+                cursor.execute(f"DROP TRIGGER IF EXISTS `{name}`")
+                cursor.execute(f"""
+                    CREATE TRIGGER `{name}` AFTER {event} ON `{table}` FOR EACH ROW
+                    UPDATE data_versions SET version = version + 1 WHERE table_name = '{table}'
+                """)
+
+    @classmethod
+    def ensure(cls, cursor):
+        """Recreate the counters table and triggers if any are missing
+
+        Dropping a watched table drops its triggers too, e.g. when a backup
+        is restored, and its counter would then stop moving for good.
+
+        Returns:
+            bool: True if anything had to be recreated
+        """
+        names = [cls.trigger_name(table, event) for table in cls.TABLES for event in cls.EVENTS]
+        cursor.execute(f"""
+            SELECT COUNT(*) FROM information_schema.TRIGGERS
+            WHERE TRIGGER_SCHEMA = DATABASE() AND TRIGGER_NAME IN ({', '.join(['%s'] * len(names))})
+        """, names)
+        if cursor.fetchone()[0] == len(names):
+            return False
+
+        cls.create(cursor)
+        return True
+
+    @classmethod
+    def touch(cls, cursor, tables=None):
+        """Bump the counters of some tables, for changes the triggers did not see
+
+        Args:
+            cursor: Cursor on the connection that made the changes; the caller commits
+            tables (iterable, optional): Tables to bump; defaults to every watched table
+        """
+        tables = tuple(tables or cls.TABLES)
+        cursor.execute(
+            f"UPDATE data_versions SET version = version + 1 WHERE table_name IN ({', '.join(['%s'] * len(tables))})",
+            tables
+        )
+
+    @classmethod
+    def fetch(cls, conn, tables=None):
+        """Read the current counters of some tables
+
+        Args:
+            conn: Open database connection
+            tables (iterable, optional): Tables to read; defaults to every watched table
+
+        Returns:
+            tuple: Counter of each table, in the order given; None for a table without one
+        """
+        tables = tuple(tables or cls.TABLES)
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                f"SELECT table_name, version FROM data_versions WHERE table_name IN ({', '.join(['%s'] * len(tables))})",
+                tables
+            )
+            versions = dict(cursor.fetchall())
+        finally:
+            cursor.close()
+        return tuple(versions.get(table) for table in tables)
@@ -0,0 +1,114 @@
+from datetime import datetime, date, time, timedelta
+
+
+class DateRange:
+    """Half-open [start, end) timestamp bounds for the date range filters
+
+    Comparing the raw column against both bounds, instead of wrapping it in
+    DATE(), lets MySQL answer date filters from an index on the column.
+    """
+
+    ALL_TIME = "All Time"
+
+    # Rolling ranges, as the number of days before today they reach back.
+    # "This Week" has always meant today and the six days before it.
+    ROLLING_DAYS = {
+        "Today": 0,
+        "This Week": 6,
+        "Last 7 Days": 7,
+        "Last 30 Days": 30,
+        "Last 90 Days": 90,
+    }
+
+    @staticmethod
+    def start_of_day(day):
+        """Get midnight at the start of a date"""
+        return datetime.combine(day, time.min)
+
+    @classmethod
+    def custom(cls, start_date, end_date):
+        """Get bounds covering two dates, both inclusive
+
+        Args:
+            start_date (date): First day in the range
+            end_date (date): Last day in the range
+
+        Returns:
+            tuple: (start, end) datetimes
+        """
+        return cls.start_of_day(start_date), cls.start_of_day(end_date + timedelta(days=1))
+
+    @classmethod
+    def last_days(cls, days, today=None):
+        """Get bounds covering today and the given number of days before it
+
+        Args:
+            days (int): Days before today to include
+            today (date, optional): Override for the current date
+
+        Returns:
+            tuple: (start, end) datetimes
+        """
+        today = today or date.today()
+        return cls.custom(today - timedelta(days=days), today)
+
+    @classmethod
+    def bounds(cls, label, today=None):
+        """Get bounds for a date range filter label
+
+        Args:
+            label (str): Filter option such as "Today", "This Month" or "Last 30 Days"
+            today (date, optional): Override for the current date
+
+        Returns:
+            tuple: (start, end) datetimes, or None for "All Time" and unknown labels
+        """
+        today = today or date.today()
+
+        if label in cls.ROLLING_DAYS:
+            return cls.last_days(cls.ROLLING_DAYS[label], today)
+
+        if label == "This Month":
+            start = today.replace(day=1)
+            end = (start + timedelta(days=32)).replace(day=1)
+            return cls.start_of_day(start), cls.start_of_day(end)
+
+        if label == "This Year":
+            return cls.start_of_day(date(today.year, 1, 1)), cls.start_of_day(date(today.year + 1, 1, 1))
+
+        return None
+
+    @classmethod
+    def sql(cls, column, label, today=None):
+        """Build a sargable SQL predicate for a date range filter label
+
+        Args:
+            column (str): Column to filter, e.g. "t.transaction_date"
+            label (str): Filter option
+            today (date, optional): Override for the current date
+
+        Returns:
+            tuple: (predicate, params); ("", ()) when the label does not filter
+        """
+        range_bounds = cls.bounds(label, today)
+        if range_bounds is None:
+            return "", ()
+        return f"{column} >= %s AND {column} < %s", range_bounds
+
+    @staticmethod
+    def contains(range_bounds, value):
+        """Check whether a date or datetime falls within bounds
+
+        Args:
+            range_bounds (tuple): (start, end) from bounds() or custom(), or None
+            value (date | datetime): Value to test
+
+        Returns:
+            bool: True if the value is in range; None bounds contain everything
+        """
+        if range_bounds is None:
+            return True
+        if not isinstance(value, datetime):
+            value = datetime.combine(value, time.min)
+        start, end = range_bounds
+        return start <= value < end
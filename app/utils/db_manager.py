@@ -1,12 +1,155 @@
 import mysql.connector
 from mysql.connector import Error
+from mysql.connector.errors import PoolError
 import os
 import json
+import time
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from app.utils.query_stats import QueryStats, InstrumentedConnection
+
+class ConnectionPool:
+    """Bounded pool of MySQL connections, each leased to one caller at a time"""
+
+    def __init__(self, config, size=5, timeout=10, max_idle=300):
+        """Initialize the pool
+
+        Args:
+            config (dict): Keyword arguments passed to mysql.connector.connect
+            size (int): Maximum number of connections open at once
+            timeout (float): Seconds to wait for a free connection before giving up
+            max_idle (float): Seconds an idle connection may sit before it is recycled
+        """
+        self.config = config
+        self.size = size
+        self.timeout = timeout
+        self.max_idle = max_idle
+
+        # Idle connections as (connection, released_at) pairs, most recent last
+        self._idle = []
+        self._leased = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout=None):
+        """Lease a live connection from the pool
+
+        Args:
+            timeout (float, optional): Override for the pool wait timeout
+
+        Returns:
+            connection: MySQL connection owned by the caller until released
+
+        Raises:
+            mysql.connector.errors.PoolError: If no connection frees up in time
+            mysql.connector.Error: If a new connection cannot be opened
+        """
+        wait = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + wait
+
+        candidate = None
+        with self._condition:
+            while not self._idle and self._leased >= self.size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolError(f"No database connection available after {wait} seconds")
+                self._condition.wait(remaining)
+
+            self._leased += 1
+            expired = self._take_expired()
+            if self._idle:
+                candidate, _ = self._idle.pop()
+
+        # Closing, liveness check and connect happen outside the lock so
+        # a slow server never blocks other threads returning connections.
+        # A dead idle connection is replaced by a new one on the same lease.
+        for connection in expired:
+            self._close_quietly(connection)
+        try:
+            if candidate is not None:
+                if candidate.is_connected():
+                    return candidate
+                self._close_quietly(candidate)
+            return mysql.connector.connect(**self.config)
+        except Error:
+            self._forget_lease()
+            raise
+
+    def release(self, connection):
+        """Return a leased connection to the pool
+
+        Any transaction left open by the borrower is rolled back so the next
+        borrower always starts from a clean session.
+
+        Args:
+            connection: Connection previously returned by acquire()
+        """
+        reusable = False
+        try:
+            if connection.is_connected():
+                if connection.in_transaction:
+                    connection.rollback()
+                reusable = True
+        except Error:
+            reusable = False
+
+        with self._condition:
+            self._leased -= 1
+            if reusable:
+                self._idle.append((connection, time.monotonic()))
+            expired = self._take_expired()
+            self._condition.notify()
+
+        if not reusable:
+            self._close_quietly(connection)
+        for connection in expired:
+            self._close_quietly(connection)
+
+    def close_all(self):
+        """Close every idle connection held by the pool"""
+        with self._condition:
+            idle = self._idle
+            self._idle = []
+
+        for connection, _ in idle:
+            self._close_quietly(connection)
+
+    def _take_expired(self):
+        """Remove every idle connection older than max_idle; call with the lock held
+
+        The idle list is in release order, so the expired connections are the
+        ones at its start, however deep the pool is.
+
+        Returns:
+            list: Removed connections, for the caller to close outside the lock
+        """
+        cutoff = time.monotonic() - self.max_idle
+        count = 0
+        while count < len(self._idle) and self._idle[count][1] < cutoff:
+            count += 1
+
+        expired = [connection for connection, _ in self._idle[:count]]
+        del self._idle[:count]
+        return expired
+
+    def _forget_lease(self):
+        """Give back a lease slot that never produced a connection"""
+        with self._condition:
+            self._leased -= 1
+            self._condition.notify()
+
+    @staticmethod
+    def _close_quietly(connection):
+        """Close a connection, ignoring errors from an already broken socket"""
+        try:
+            connection.close()
+        except Error:
+            pass
+
 
 class DBManager:
     """Manager for handling database connections with improved error handling"""
-    
+
     # Default database configuration
     DEFAULT_CONFIG = {
         "host": "localhost",
@@ -14,41 +157,106 @@ class DBManager:
         "password": "MySQL_",
         "database": "testdb",
     }
-    
+
+    # Pool settings, overridable from the same config file
+    DEFAULT_POOL_CONFIG = {
+        "pool_size": 5,
+        "pool_timeout": 10,
+        "pool_max_idle": 300,
+    }
+
+    # Query statistics settings, overridable from the same config file
+    DEFAULT_STATS_CONFIG = {
+        "slow_query_ms": 500,
+    }
+
     # Singleton connection instance
     _connection = None
-    
+
+    # Shared connection pool for leased connections
+    _pool = None
+    _pool_lock = threading.Lock()
+
+    # Environment variable naming a database to use instead of the configured one
+    DATABASE_ENV = "SALON_DB_NAME"
+
     @classmethod
     def get_config(cls):
         """
         Get database configuration from config file or use defaults
-        
+
+        The database name can be overridden with the SALON_DB_NAME environment
+        variable, e.g. to point the app at a benchmark copy of the schema.
+
         Returns:
             dict: Database configuration
         """
+        config = cls.DEFAULT_CONFIG
         try:
             # Try to load config from a file
             config_path = Path(__file__).parent.parent.parent / "config" / "database.json"
-            
+
             if config_path.exists():
                 with open(config_path, "r") as config_file:
-                    return json.load(config_file)
-            
+                    config = json.load(config_file)
+
         except Exception as e:
             print(f"Warning: Could not load database config from file: {e}")
             print("Using default database configuration")
-        
-        # Return default configuration
-        return cls.DEFAULT_CONFIG
-    
+
+        database = os.environ.get(cls.DATABASE_ENV)
+        if database:
+            config = dict(config, database=database)
+        return config
+
+    @classmethod
+    def get_connection_config(cls):
+        """
+        Get only the settings understood by mysql.connector.connect
+
+        Returns:
+            dict: Connection keyword arguments
+        """
+        config = cls.get_config()
+        return {
+            key: value for key, value in config.items()
+            if key not in cls.DEFAULT_POOL_CONFIG and key not in cls.DEFAULT_STATS_CONFIG
+        }
+
+    @classmethod
+    def get_pool_config(cls):
+        """
+        Get pool settings from the config file merged over the defaults
+
+        Returns:
+            dict: Pool size, wait timeout and maximum idle age
+        """
+        config = cls.get_config()
+        pool_config = dict(cls.DEFAULT_POOL_CONFIG)
+        pool_config.update({key: config[key] for key in cls.DEFAULT_POOL_CONFIG if key in config})
+        return pool_config
+
+    @classmethod
+    def get_stats_config(cls):
+        """
+        Get query statistics settings from the config file merged over the defaults
+
+        Returns:
+            dict: Slow query threshold in milliseconds
+        """
+        config = cls.get_config()
+        stats_config = dict(cls.DEFAULT_STATS_CONFIG)
+        stats_config.update({key: config[key] for key in cls.DEFAULT_STATS_CONFIG if key in config})
+        return stats_config
+
     @classmethod
     def get_connection(cls):
         """
         Get a database connection (creates a new one or reuses existing if valid)
-        
+
         Returns:
             connection: MySQL connection object
-        
+
         Raises:
             mysql.connector.Error: If connection fails
         """
@@ -56,20 +264,77 @@ class DBManager:
             # Check if valid connection
             if cls._connection and cls._connection.is_connected():
                 return cls._connection
-            
-            # Create a new connection
-            config = cls.get_config()
-            cls._connection = mysql.connector.connect(**config)
+
+            # Create a new connection whose cursors record query timings
+            config = cls.get_connection_config()
+            QueryStats.configure(**cls.get_stats_config())
+            cls._connection = InstrumentedConnection(mysql.connector.connect(**config))
             return cls._connection
-            
+
+        except Error as err:
+            print(f"Database connection error: {err}")
+            raise
+
+    @classmethod
+    def get_pool(cls):
+        """
+        Get the shared connection pool, creating it on first use
+
+        Returns:
+            ConnectionPool: The application connection pool
+        """
+        with cls._pool_lock:
+            if cls._pool is None:
+                pool_config = cls.get_pool_config()
+                QueryStats.configure(**cls.get_stats_config())
+                cls._pool = ConnectionPool(
+                    cls.get_connection_config(),
+                    size=int(pool_config["pool_size"]),
+                    timeout=float(pool_config["pool_timeout"]),
+                    max_idle=float(pool_config["pool_max_idle"])
+                )
+            return cls._pool
+
+    @classmethod
+    @contextmanager
+    def connection(cls, timeout=None):
+        """
+        Lease a pooled connection for the duration of a with-block
+
+        Unlike get_connection(), the leased connection belongs to the caller
+        alone, so it is safe to use from a background thread. Uncommitted work
+        is rolled back when the block exits. Cursors opened on it record their
+        timings in QueryStats.
+
+        Args:
+            timeout (float, optional): Override for the pool wait timeout
+
+        Yields:
+            connection: MySQL connection leased from the pool
+
+        Raises:
+            mysql.connector.Error: If no connection can be leased
+        """
+        pool = cls.get_pool()
+        try:
+            conn = pool.acquire(timeout)
         except Error as err:
             print(f"Database connection error: {err}")
             raise
-    
+
+        try:
+            yield InstrumentedConnection(conn)
+        finally:
+            pool.release(conn)
+
     @classmethod
     def close_connection(cls):
         """Close the database connection if it exists"""
         if cls._connection and cls._connection.is_connected():
             cls._connection.close()
             cls._connection = None
-            print("Database connection closed")
\ No newline at end of file
+            print("Database connection closed")
+
+        with cls._pool_lock:
+            if cls._pool is not None:
+                cls._pool.close_all()
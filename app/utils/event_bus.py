@@ -0,0 +1,231 @@
+from PyQt5 import QtCore
+
+
+class DataEvent:
+    """Base class for data-change events published through the EventBus
+
+    An event names the rows that changed. ids is None when the writer cannot
+    tell which rows it touched; subscribers should then treat everything as
+    changed.
+    """
+
+    def __init__(self, ids=None):
+        self.ids = None if ids is None else frozenset(i for i in ids if i is not None)
+
+    def merge(self, other):
+        """Combine this event with a later one of the same type
+
+        Args:
+            other (DataEvent): Event published after this one
+
+        Returns:
+            DataEvent: Event covering the rows of both
+        """
+        if self.ids is None or other.ids is None:
+            return type(self)()
+        return type(self)(self.ids | other.ids)
+
+    def __repr__(self):
+        ids = "all" if self.ids is None else sorted(self.ids, key=str)
+        return f"{type(self).__name__}({ids})"
+
+
+class TransactionCreated(DataEvent):
+    """One or more sales transactions were saved"""
+
+    @property
+    def transaction_ids(self):
+        return self.ids
+
+
+class StockChanged(DataEvent):
+    """Product quantities or availability changed"""
+
+    @property
+    def product_ids(self):
+        return self.ids
+
+
+class SupplierReceived(DataEvent):
+    """One or more supplier deliveries were marked as received"""
+
+    @property
+    def supplier_ids(self):
+        return self.ids
+
+
+class Subscription:
+    """A callback registered for one or more event types"""
+
+    def __init__(self, event_types, callback, widget=None):
+        self.event_types = event_types
+        self.callback = callback
+        self.widget = widget
+
+        # Events held back while the widget is hidden, keyed by type
+        self.pending = {}
+
+    def matches(self, event):
+        """Check whether the subscription wants an event"""
+        return isinstance(event, self.event_types)
+
+
+class EventDispatcher(QtCore.QObject):
+    """Queues published events on the UI thread and delivers them in batches"""
+
+    published = QtCore.pyqtSignal(object)
+
+    def __init__(self, coalesce_ms):
+        super(EventDispatcher, self).__init__()
+        self.subscriptions = []
+
+        # Events waiting for the next flush, merged per type in publish order
+        self.queued = {}
+
+        self.flush_timer = QtCore.QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(coalesce_ms)
+        self.flush_timer.timeout.connect(self.flush)
+
+        # Events published on worker threads are handed to the UI thread here
+        self.published.connect(self.enqueue)
+
+    def enqueue(self, event):
+        """Merge an event into the next batch and schedule a flush"""
+        event_type = type(event)
+        if event_type in self.queued:
+            self.queued[event_type] = self.queued[event_type].merge(event)
+        else:
+            self.queued[event_type] = event
+
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self):
+        """Deliver the queued batch to every matching subscription"""
+        events = list(self.queued.values())
+        self.queued.clear()
+
+        for subscription in list(self.subscriptions):
+            matching = [event for event in events if subscription.matches(event)]
+            if not matching:
+                continue
+
+            # Hidden views catch up when they are next shown
+            if subscription.widget is not None and not subscription.widget.isVisible():
+                for event in matching:
+                    self.hold(subscription, event)
+                continue
+
+            self.deliver(subscription, matching)
+
+    def hold(self, subscription, event):
+        """Keep an event for a hidden widget until it is shown"""
+        event_type = type(event)
+        if event_type in subscription.pending:
+            subscription.pending[event_type] = subscription.pending[event_type].merge(event)
+        else:
+            subscription.pending[event_type] = event
+
+    def deliver(self, subscription, events):
+        """Run a subscription's callback for a batch of events"""
+        # A subscription to several types reloads in full, so one call is enough
+        if len(subscription.event_types) > 1:
+            events = events[:1]
+
+        for event in events:
+            try:
+                subscription.callback(event)
+            except Exception as e:
+                print(f"Error handling {event!r}: {e}")
+
+    def deliver_pending(self, widget):
+        """Deliver events held back for a widget that has just been shown"""
+        for subscription in list(self.subscriptions):
+            if subscription.widget is widget and subscription.pending:
+                events = list(subscription.pending.values())
+                subscription.pending.clear()
+                self.deliver(subscription, events)
+
+    def add(self, subscription):
+        """Register a subscription, tying it to its widget's lifetime"""
+        self.subscriptions.append(subscription)
+
+        widget = subscription.widget
+        if widget is not None and not any(
+            other.widget is widget for other in self.subscriptions[:-1]
+        ):
+            widget.installEventFilter(self)
+            widget.destroyed.connect(lambda _=None, widget=widget: self.remove_widget(widget))
+
+    def remove_widget(self, widget):
+        """Drop every subscription owned by a destroyed widget"""
+        self.subscriptions = [s for s in self.subscriptions if s.widget is not widget]
+
+    def remove_callback(self, callback):
+        """Drop every subscription using a callback"""
+        self.subscriptions = [s for s in self.subscriptions if s.callback != callback]
+
+    def eventFilter(self, watched, event):
+        """Catch up hidden subscribers once their widget is shown"""
+        if event.type() == QtCore.QEvent.Show:
+            # Deliver after the show completes so callbacks see a visible widget
+            QtCore.QTimer.singleShot(0, lambda: self.deliver_pending(watched))
+        return False
+
+
+class EventBus:
+    """Application-wide publish/subscribe channel for data-change events
+
+    Writers publish an event after their transaction commits. Views subscribe
+    to the event types they display and refresh only what the event names,
+    instead of every writer searching the widget tree for pages to reload.
+    Bursts of events are merged and delivered together on the UI thread.
+    """
+
+    # Milliseconds to wait for more events before delivering a batch
+    COALESCE_MS = 50
+
+    _dispatcher = None
+
+    @classmethod
+    def dispatcher(cls):
+        """Get the shared dispatcher, creating it on first use
+
+        Returns:
+            EventDispatcher: The dispatcher living on the UI thread
+        """
+        if cls._dispatcher is None:
+            cls._dispatcher = EventDispatcher(cls.COALESCE_MS)
+        return cls._dispatcher
+
+    @classmethod
+    def publish(cls, event):
+        """Publish an event; safe to call from any thread
+
+        Args:
+            event (DataEvent): The change that was committed
+        """
+        cls.dispatcher().published.emit(event)
+
+    @classmethod
+    def subscribe(cls, event_types, callback, widget=None):
+        """Subscribe a callback to one or more event types
+
+        Args:
+            event_types (type | tuple): DataEvent subclass, or a tuple of them.
+                A tuple subscription is called once per batch, with the first
+                matching event, and is meant for views that reload in full.
+            callback (callable): Receives each event on the UI thread
+            widget (QWidget, optional): View the callback refreshes. Events are
+                held back while it is hidden, and the subscription ends when it
+                is destroyed.
+        """
+        if not isinstance(event_types, tuple):
+            event_types = (event_types,)
+        cls.dispatcher().add(Subscription(event_types, callback, widget))
+
+    @classmethod
+    def unsubscribe(cls, callback):
+        """Remove every subscription using a callback"""
+        cls.dispatcher().remove_callback(callback)
@@ -1,17 +1,33 @@
+from typing import NamedTuple
 import mysql.connector
 from .db_manager import DBManager
-from PyQt5 import QtWidgets
-from app.utils.dashboard_updater import DashboardUpdater
-from app.utils.customer_updater import CustomerUpdater
+from .reference_cache import ReferenceCache
+from .event_bus import EventBus, StockChanged, SupplierReceived
+
+class StockShortfall(NamedTuple):
+    """A product a sale needed more of than was in stock"""
+    product_id: int
+    product_name: str
+    required: int
+    available: int
+
 
 class InventoryUpdater:
-    """Utility class for updating inventory when supplier deliveries are received"""
+    """Utility class for updating inventory when supplier deliveries are received
+    and when services use up products"""
     
     @staticmethod
-    def update_inventory_on_delivery(supplier_id, product_name, category, quantity, supplier_name):
-        """Update inventory when a supplier delivery is marked as received"""
+    def update_inventory_on_delivery(supplier_id, product_name, category, quantity, supplier_name, conn=None):
+        """Update inventory when a supplier delivery is marked as received
+        
+        Args:
+            conn (optional): Connection whose open transaction these writes should
+                join. The caller is then responsible for committing it.
+        """
+        owns_connection = conn is None
         try:
-            conn = DBManager.get_connection()
+            if owns_connection:
+                conn = DBManager.get_connection()
             cursor = conn.cursor()
             
             # Check if product already exists in inventory
@@ -62,116 +78,92 @@ class InventoryUpdater:
                 (supplier_id,)
             )
             
-            conn.commit()
+            if owns_connection:
+                conn.commit()
+                ReferenceCache.invalidate("suppliers", "products", "inventory_status")
+                EventBus.publish(SupplierReceived([supplier_id]))
+                EventBus.publish(StockChanged([product_id]))
             cursor.close()
             
             return True, f"Successfully added {quantity} units of '{product_name}' to inventory"
             
         except mysql.connector.Error as err:
             return False, f"Error updating inventory: {err}"
-    
-    @staticmethod
-    def refresh_all_inventory_displays(main_window):
-        """Refresh all inventory-related displays in the application"""
-        try:
-            print("Starting comprehensive inventory refresh...")
-            
-            app = QtWidgets.QApplication.instance()
-            inventory_page = None
-            
-            for widget in app.allWidgets():
-                if hasattr(widget, '__class__') and 'InventoryPage' in str(widget.__class__):
-                    inventory_page = widget
-                    print(f"Found InventoryPage: {widget}")
-                    break
-                    
-                if (hasattr(widget, 'overview_tab') and 
-                    hasattr(widget, 'products_tab') and 
-                    hasattr(widget, 'inventory_status_tab')):
-                    inventory_page = widget
-                    print(f"Found inventory page by tab structure: {widget}")
-                    break
-            
-            if inventory_page:
-                print("Refreshing all inventory components...")
-                
-                try:
-                    # Refresh overview tab
-                    if hasattr(inventory_page, 'overview_tab') and hasattr(inventory_page.overview_tab, 'update_dashboard'):
-                        inventory_page.overview_tab.update_dashboard()
-                        print("✓ Refreshed overview tab dashboard")
-                    
-                    # Refresh products tab
-                    if hasattr(inventory_page, 'products_tab'):
-                        if hasattr(inventory_page.products_tab, 'rebuild_table'):
-                            inventory_page.products_tab.rebuild_table()
-                            print("✓ Refreshed products tab table")
-                        elif hasattr(inventory_page.products_tab, 'load_products'):
-                            inventory_page.products_tab.load_products()
-                            print("✓ Refreshed products tab (load_products)")
-                    
-                    # Refresh inventory status tab - MOST IMPORTANT
-                    if hasattr(inventory_page, 'inventory_status_tab'):
-                        if hasattr(inventory_page.inventory_status_tab, 'load_inventory'):
-                            inventory_page.inventory_status_tab.load_inventory()
-                            print("✓ Refreshed inventory status tab data")
-                        if hasattr(inventory_page.inventory_status_tab, 'update_analytics'):
-                            inventory_page.inventory_status_tab.update_analytics()
-                            print("✓ Refreshed inventory analytics")
-                    
-                    print("Successfully refreshed all inventory displays")
-                    
-                except Exception as e:
-                    print(f"Error refreshing specific inventory tabs: {e}")
-                    
-            else:
-                print("Could not find inventory page to refresh")
-                
-        except Exception as e:
-            print(f"Error in refresh_all_inventory_displays: {e}")
-    
-    @staticmethod
-    def _find_inventory_page_recursive(widget):
-        """Recursively search for inventory page in widget hierarchy"""
-        # Check current widget
-        if (hasattr(widget, 'overview_tab') and 
-            hasattr(widget, 'products_tab') and 
-            hasattr(widget, 'inventory_status_tab')):
-            return widget
-        
-        # Check children
-        for child in widget.findChildren(QtWidgets.QWidget):
-            if (hasattr(child, 'overview_tab') and 
-                hasattr(child, 'products_tab') and 
-                hasattr(child, 'inventory_status_tab')):
-                return child
-        
-        return None
-    
+
     @staticmethod
-    def refresh_all_displays(main_window):
-        """Refresh all displays across the application"""
-        print("Starting comprehensive application refresh...")
-        app = QtWidgets.QApplication.instance()
-        
-        try:
-            # 1. Find and refresh dashboard
-            for widget in app.allWidgets():
-                if hasattr(widget, '__class__') and 'DashboardPage' in str(widget.__class__):
-                    DashboardUpdater.refresh_metrics_and_charts(widget)
-                    print("✓ Dashboard refreshed via dashboard updater")
-                    break
-            
-            # 2. Find and refresh customers tab
-            for widget in app.allWidgets():
-                if hasattr(widget, '__class__') and 'CustomersTab' in str(widget.__class__):
-                    CustomerUpdater.refresh_customers_table(widget)
-                    print("✓ Customers tab refreshed via customer updater")
-                    break
-            
-            # 3. Refresh inventory displays
-            InventoryUpdater.refresh_all_inventory_displays(main_window)
-            print("✓ Inventory displays refreshed")
-            
-        except Exception as e:
-            print(f"Error in refresh_all_displays: {e}")
\ No newline at end of file
+    def deduct_for_services(cursor, service_ids, reference):
+        """Deduct the products used by a sale's services, in the cursor's transaction
+
+        The products' rows are locked and read in one statement, then all of
+        them are decremented relative to their current value in one UPDATE and
+        logged in one insert each to inventory and inventory_transactions, so
+        the round trips do not grow with the number of products. A service
+        listed twice uses its products twice, and products shared by several
+        services are deducted once for their combined quantity. Stock never
+        goes below zero; what could not be covered is reported instead. The
+        caller commits.
+
+        Args:
+            cursor: Cursor on the connection holding the sale's transaction
+            service_ids (list): IDs of the services sold, repeated if sold more than once
+            reference (str): Transaction ID noted on the stock-out log rows
+
+        Returns:
+            tuple: (IDs of the products deducted, list of StockShortfall)
+        """
+        service_ids = [service_id for service_id in service_ids if service_id]
+        if not service_ids:
+            return [], []
+
+        # Every sold service as a row, duplicates kept, so SUM counts each sale
+        sold = " UNION ALL ".join(["SELECT %s AS service_id"] * len(service_ids))
+        cursor.execute(f"""
+            SELECT p.product_id, p.product_name, p.quantity, used.required
+            FROM products p
+            JOIN (
+                SELECT sp.product_id, SUM(sp.quantity) AS required
+                FROM service_products sp
+                JOIN ({sold}) sold ON sold.service_id = sp.service_id
+                GROUP BY sp.product_id
+            ) used ON used.product_id = p.product_id
+            FOR UPDATE
+        """, tuple(service_ids))
+        products = [(product_id, name, int(stock or 0), int(required))
+                    for product_id, name, stock, required in cursor.fetchall()]
+
+        if not products:
+            return [], []
+
+        product_ids = [product[0] for product in products]
+        placeholders = ", ".join(["%s"] * len(products))
+
+        # Assignments run left to right, so availability sees the new quantity
+        cursor.execute(f"""
+            UPDATE products
+            SET quantity = GREATEST(quantity - CASE product_id {" ".join(["WHEN %s THEN %s"] * len(products))} END, 0),
+                availability = quantity > 0
+            WHERE product_id IN ({placeholders})
+        """, tuple(value for product in products for value in (product[0], product[3])) + tuple(product_ids))
+
+        cursor.execute(f"""
+            INSERT INTO inventory (product_id, quantity, status, last_updated)
+            VALUES {", ".join(["(%s, %s, 'Used in Service', NOW())"] * len(products))}
+            ON DUPLICATE KEY UPDATE
+            quantity = VALUES(quantity),
+            status = VALUES(status),
+            last_updated = NOW()
+        """, tuple(value for product_id, _, stock, required in products
+                   for value in (product_id, max(0, stock - required))))
+
+        # Log what actually left the shelf; products already out of stock have nothing to log
+        used = [(name, min(stock, required)) for _, name, stock, required in products if min(stock, required) > 0]
+        if used:
+            cursor.execute(f"""
+                INSERT INTO inventory_transactions (product_name, transaction_type, quantity, notes, transaction_date)
+                VALUES {", ".join(["(%s, 'Stock Out', %s, %s, NOW())"] * len(used))}
+            """, tuple(value for name, quantity in used
+                       for value in (name, quantity, f"Used in service: {reference}")))
+
+        shortfalls = [StockShortfall(product_id, name, required, stock)
+                      for product_id, name, stock, required in products if required > stock]
+        return product_ids, shortfalls
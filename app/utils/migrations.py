@@ -0,0 +1,253 @@
+from app.utils.customer_profiles import CustomerProfiles
+from app.utils.data_versions import DataVersions
+from app.utils.db_manager import DBManager
+from app.utils.sales_rollup import SalesRollup
+from app.utils.sequence_allocator import SequenceAllocator
+from app.utils.transaction_lines import TransactionLines
+import mysql.connector
+
+
+class Migration:
+    """A single versioned schema change"""
+
+    def __init__(self, version, description, apply):
+        """Initialize the migration
+
+        Args:
+            version (int): Position in the migration order; never reused
+            description (str): Short summary recorded alongside the version
+            apply (callable): Function taking the migration connection and a
+                cursor on it that performs the change. It must be idempotent,
+                because DDL auto-commits in MySQL and a migration interrupted
+                halfway is re-run from the start; long data migrations may
+                commit as they go for the same reason.
+        """
+        self.version = version
+        self.description = description
+        self.apply = apply
+
+
+class MigrationRunner:
+    """Applies pending schema migrations and records them in schema_migrations"""
+
+    # Advisory lock so two terminals starting together don't migrate concurrently
+    LOCK_NAME = "salon_schema_migrations"
+    LOCK_TIMEOUT = 30
+
+    # Registered migrations, in the order they must be applied
+    MIGRATIONS = []
+
+    @classmethod
+    def register(cls, version, description):
+        """Decorator that registers a function as a migration
+
+        Args:
+            version (int): Migration version, higher than every existing one
+            description (str): Short summary of the change
+
+        Returns:
+            callable: Decorator returning the function unchanged
+        """
+        def decorator(apply):
+            if any(migration.version == version for migration in cls.MIGRATIONS):
+                raise ValueError(f"Duplicate migration version {version}")
+            cls.MIGRATIONS.append(Migration(version, description, apply))
+            cls.MIGRATIONS.sort(key=lambda migration: migration.version)
+            return apply
+        return decorator
+
+    @classmethod
+    def run(cls):
+        """Apply every migration that has not been recorded yet
+
+        Returns:
+            list: Versions applied by this call
+
+        Raises:
+            mysql.connector.Error: If a migration fails; earlier migrations stay applied
+        """
+        applied_now = []
+
+        with DBManager.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT GET_LOCK(%s, %s)", (cls.LOCK_NAME, cls.LOCK_TIMEOUT))
+                if not cursor.fetchone()[0]:
+                    raise mysql.connector.Error(msg="Timed out waiting for another terminal to finish migrating")
+
+                try:
+                    cls.ensure_migrations_table(cursor)
+                    applied = cls.applied_versions(cursor)
+
+                    for migration in cls.MIGRATIONS:
+                        if migration.version in applied:
+                            continue
+
+                        print(f"Applying migration {migration.version}: {migration.description}")
+                        migration.apply(conn, cursor)
+                        cursor.execute(
+                            "INSERT INTO schema_migrations (version, description) VALUES (%s, %s)",
+                            (migration.version, migration.description)
+                        )
+                        conn.commit()
+                        applied_now.append(migration.version)
+
+                    # Triggers go with their tables, which a restore may have recreated
+                    if DataVersions.ensure(cursor):
+                        print("✓ Recreated data version triggers")
+                finally:
+                    cursor.execute("SELECT RELEASE_LOCK(%s)", (cls.LOCK_NAME,))
+                    cursor.fetchone()
+            finally:
+                cursor.close()
+
+        if applied_now:
+            print(f"✓ Applied {len(applied_now)} schema migration(s)")
+        return applied_now
+
+    @staticmethod
+    def ensure_migrations_table(cursor):
+        """Create the table that records applied migrations"""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INT NOT NULL,
+                description VARCHAR(255) NOT NULL,
+                applied_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (version)
+            )
+        """)
+
+    @staticmethod
+    def applied_versions(cursor):
+        """Get the set of migration versions already applied"""
+        cursor.execute("SELECT version FROM schema_migrations")
+        return {row[0] for row in cursor.fetchall()}
+
+    @staticmethod
+    def index_exists(cursor, table, index_name):
+        """Check whether an index exists on a table in the current database"""
+        cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+        """, (table, index_name))
+        return cursor.fetchone()[0] > 0
+
+    @staticmethod
+    def column_exists(cursor, table, column):
+        """Check whether a column exists on a table in the current database"""
+        cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+        """, (table, column))
+        return cursor.fetchone()[0] > 0
+
+    @classmethod
+    def add_column(cls, cursor, table, column, definition):
+        """Add a column unless it already exists
+
+        Args:
+            cursor: Cursor on the migration connection
+            table (str): Table to alter
+            column (str): Name of the new column
+            definition (str): Column type and options, e.g. "INT DEFAULT NULL"
+        """
+        if cls.column_exists(cursor, table, column):
+            return
+        cursor.execute(f"ALTER TABLE `{table}` ADD COLUMN `{column}` {definition}")
+
+    @classmethod
+    def create_index(cls, cursor, table, index_name, columns):
+        """Create an index unless one with the same name already exists
+
+        Args:
+            cursor: Cursor on the migration connection
+            table (str): Table to index
+            index_name (str): Name of the new index
+            columns (list): Column names, in index order
+        """
+        if cls.index_exists(cursor, table, index_name):
+            return
+        column_list = ", ".join(f"`{column}`" for column in columns)
+        cursor.execute(f"CREATE INDEX `{index_name}` ON `{table}` ({column_list})")
+
+
+@MigrationRunner.register(1, "Index transactions by date, customer and payment method")
+def _index_transactions(conn, cursor):
+    # Dashboard metrics, sales chart and date range filters
+    MigrationRunner.create_index(cursor, "transactions", "idx_transactions_date", ["transaction_date"])
+    # Customer search by name and phone
+    MigrationRunner.create_index(cursor, "transactions", "idx_transactions_customer_name", ["customer_name"])
+    MigrationRunner.create_index(cursor, "transactions", "idx_transactions_customer_phone", ["customer_phone"])
+    # Payment method filters and their SELECT DISTINCT option lists
+    MigrationRunner.create_index(cursor, "transactions", "idx_transactions_payment_date", ["payment_method", "transaction_date"])
+
+
+@MigrationRunner.register(2, "Index inventory transactions by product and date")
+def _index_inventory_transactions(conn, cursor):
+    # Covers the per-product stock in/out sums in the missing products report
+    MigrationRunner.create_index(
+        cursor, "inventory_transactions", "idx_inventory_txn_product_type",
+        ["product_name", "transaction_type", "quantity"]
+    )
+    MigrationRunner.create_index(cursor, "inventory_transactions", "idx_inventory_txn_date", ["transaction_date"])
+
+
+@MigrationRunner.register(3, "Index products by category and name")
+def _index_products(conn, cursor):
+    # Category filters and their SELECT DISTINCT option lists, ordered by name
+    MigrationRunner.create_index(cursor, "products", "idx_products_category_name", ["category", "product_name"])
+    # Product listing order and name lookups from inventory transactions
+    MigrationRunner.create_index(cursor, "products", "idx_products_name", ["product_name"])
+
+
+@MigrationRunner.register(4, "Add customer profiles keyed by phone, backfilled from transactions")
+def _customer_profiles(conn, cursor):
+    # Filled by migration 11, once transaction lines list every service sold
+    CustomerProfiles.create_tables(cursor)
+
+
+@MigrationRunner.register(5, "Add document sequences for OR numbers and transaction IDs")
+def _document_sequences(conn, cursor):
+    cursor.execute(SequenceAllocator.CREATE_TABLE)
+
+
+@MigrationRunner.register(6, "Add transaction lines for every service sold, backfilled from transactions")
+def _transaction_lines(conn, cursor):
+    TransactionLines.create_table(cursor)
+    line_count = TransactionLines.backfill(cursor)
+    print(f"✓ Backfilled {line_count} transaction lines")
+
+
+@MigrationRunner.register(7, "Add the daily sales rollup, built from transaction lines")
+def _sales_daily_rollup(conn, cursor):
+    SalesRollup.create_table(cursor)
+    row_count = SalesRollup.rebuild(cursor)
+    print(f"✓ Built {row_count} daily sales rollup rows")
+
+
+@MigrationRunner.register(8, "Add change counters for the sales rollup and products, kept by triggers")
+def _data_versions(conn, cursor):
+    DataVersions.create(cursor)
+
+
+@MigrationRunner.register(9, "Store missing customer genders and cities as NULL")
+def _customer_blank_contacts(conn, cursor):
+    profile_count = CustomerProfiles.clear_blank_contacts(cursor)
+    print(f"✓ Cleared blank contact details on {profile_count} customer profiles")
+
+
+@MigrationRunner.register(10, "Store each transaction's phone key, so visits match their customer profile")
+def _transaction_phone_keys(conn, cursor):
+    MigrationRunner.add_column(cursor, "transactions", "phone_key", "VARCHAR(20) DEFAULT NULL")
+    # A customer's latest visits, newest first
+    MigrationRunner.create_index(
+        cursor, "transactions", "idx_transactions_phone_key_date", ["phone_key", "transaction_date"]
+    )
+    transaction_count = CustomerProfiles.backfill_phone_keys(conn)
+    print(f"✓ Stored phone keys on {transaction_count} transactions")
+
+
+@MigrationRunner.register(11, "Rebuild customer profiles from transaction lines, counting every service sold")
+def _customer_profile_services(conn, cursor):
+    transaction_count = CustomerProfiles.backfill(conn)
+    print(f"✓ Built customer profiles from {transaction_count} transactions")
@@ -0,0 +1,129 @@
+from PyQt5 import QtCore
+from app.utils.db_manager import DBManager
+from app.utils.query_stats import QueryStats
+import threading
+
+
+class QuerySignals(QtCore.QObject):
+    """Signals emitted by a background query task"""
+
+    resultReady = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(str)
+
+
+class QueryTask(QtCore.QRunnable):
+    """Runnable that executes database work on a pooled connection"""
+
+    def __init__(self, work):
+        """Initialize the task
+
+        Args:
+            work (callable): Function taking a leased connection and returning
+                the result to deliver through resultReady
+        """
+        super(QueryTask, self).__init__()
+        self.work = work
+        self.signals = QuerySignals()
+        self._cancelled = threading.Event()
+
+        # Credit the work's statements to the code that submitted it
+        self.call_site = QueryStats.current_call_site()
+
+    def cancel(self):
+        """Cancel the task; a cancelled task never emits its result"""
+        self._cancelled.set()
+
+    def is_cancelled(self):
+        """Check whether the task has been cancelled
+
+        Returns:
+            bool: True if cancel() was called
+        """
+        return self._cancelled.is_set()
+
+    def run(self):
+        """Execute the work on a worker thread"""
+        if self.is_cancelled():
+            return
+
+        try:
+            with QueryStats.attributed_to(self.call_site), DBManager.connection() as conn:
+                result = self.work(conn)
+        except Exception as err:
+            if not self.is_cancelled():
+                self.signals.failed.emit(str(err))
+            return
+
+        if not self.is_cancelled():
+            self.signals.resultReady.emit(result)
+
+
+class QueryRunner:
+    """Runs queries off the UI thread and delivers results through Qt signals"""
+
+    # Thread pool shared by all background queries
+    _thread_pool = None
+
+    @classmethod
+    def thread_pool(cls):
+        """Get the query thread pool, sized to match the connection pool
+
+        Returns:
+            QThreadPool: The shared thread pool
+        """
+        if cls._thread_pool is None:
+            cls._thread_pool = QtCore.QThreadPool()
+            cls._thread_pool.setMaxThreadCount(int(DBManager.get_pool_config()["pool_size"]))
+        return cls._thread_pool
+
+    @classmethod
+    def execute(cls, sql, params=None, on_result=None, on_error=None, dictionary=True):
+        """Run a single SELECT statement in the background
+
+        Args:
+            sql (str): SQL statement to execute
+            params (tuple, optional): Statement parameters
+            on_result (callable, optional): Receives the fetched rows on the UI thread
+            on_error (callable, optional): Receives the error message on the UI thread
+            dictionary (bool): Fetch rows as dictionaries instead of tuples
+
+        Returns:
+            QueryTask: Handle that can be used to cancel the query
+        """
+        def work(conn):
+            cursor = conn.cursor(dictionary=dictionary)
+            try:
+                cursor.execute(sql, params or ())
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+        return cls.submit(work, on_result, on_error)
+
+    @classmethod
+    def submit(cls, work, on_result=None, on_error=None):
+        """Run arbitrary database work in the background
+
+        Args:
+            work (callable): Function taking a leased connection, run on a worker thread
+            on_result (callable, optional): Receives the work's return value on the UI thread
+            on_error (callable, optional): Receives the error message on the UI thread
+
+        Returns:
+            QueryTask: Handle that can be used to cancel the work
+        """
+        task = QueryTask(work)
+
+        # Re-check cancellation on delivery: a result may already be queued
+        # for the UI thread when the caller cancels
+        if on_result:
+            task.signals.resultReady.connect(
+                lambda result: None if task.is_cancelled() else on_result(result)
+            )
+        if on_error:
+            task.signals.failed.connect(
+                lambda message: None if task.is_cancelled() else on_error(message)
+            )
+
+        cls.thread_pool().start(task)
+        return task
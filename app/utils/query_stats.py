@@ -0,0 +1,383 @@
+import re
+import sys
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+
+# Modules whose frames are plumbing rather than the code that issued a query
+_INTERNAL_MODULE_PREFIXES = (
+    "app.utils.query_stats",
+    "app.utils.db_manager",
+    "app.utils.query_runner",
+    "app.utils.repositories",
+    "mysql.",
+    "contextlib",
+    "threading",
+)
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\([^)]+\)s|%s")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql):
+    """Reduce a statement to its shape so executions with different values group together
+
+    Args:
+        sql (str): SQL statement as passed to cursor.execute
+
+    Returns:
+        str: Statement with literals and placeholders replaced by ?
+    """
+    if isinstance(sql, (bytes, bytearray)):
+        sql = sql.decode("utf-8", "replace")
+    text = _STRING_LITERAL.sub("?", sql)
+    text = _PLACEHOLDER.sub("?", text)
+    text = _NUMBER_LITERAL.sub("?", text)
+    text = _IN_LIST.sub("IN (...)", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def _row_size(row):
+    """Approximate the number of bytes a fetched row occupies on the wire"""
+    values = row.values() if isinstance(row, dict) else row
+    size = 0
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, (bytes, bytearray)):
+            size += len(value)
+        elif isinstance(value, str):
+            size += len(value.encode("utf-8"))
+        else:
+            size += 8
+    return size
+
+
+def _percentile(sorted_samples, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+class StatementStats:
+    """Cumulative timings for one statement fingerprint or call site"""
+
+    # Number of recent durations kept for percentile estimates
+    SAMPLE_SIZE = 500
+
+    def __init__(self, key):
+        self.key = key
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.samples = deque(maxlen=self.SAMPLE_SIZE)
+        self.last_sql = None
+        self.last_params = None
+        self.call_sites = {}
+
+    def add(self, elapsed_ms, rows, size, sql, params, call_site):
+        """Fold one execution into the totals"""
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.rows += rows
+        self.bytes += size
+        self.samples.append(elapsed_ms)
+        self.last_sql = sql
+        self.last_params = params
+        self.call_sites[call_site] = self.call_sites.get(call_site, 0) + 1
+
+    def to_dict(self):
+        """Summarize the totals as a plain dictionary"""
+        samples = sorted(self.samples)
+        return {
+            "key": self.key,
+            "count": self.count,
+            "total_ms": self.total_ms,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": _percentile(samples, 0.50),
+            "p95_ms": _percentile(samples, 0.95),
+            "max_ms": self.max_ms,
+            "rows": self.rows,
+            "rows_per_call": self.rows / self.count if self.count else 0.0,
+            "bytes": self.bytes,
+            "last_sql": self.last_sql,
+            "last_params": self.last_params,
+            "call_sites": dict(self.call_sites),
+        }
+
+
+class QueryStats:
+    """Process-wide registry of statement timings collected by instrumented cursors"""
+
+    # Statements slower than this many milliseconds are logged
+    slow_query_ms = 500
+
+    # Number of slow statements kept for inspection
+    SLOW_LOG_SIZE = 100
+
+    _lock = threading.Lock()
+    _by_fingerprint = {}
+    _by_call_site = {}
+    _slow_log = deque(maxlen=SLOW_LOG_SIZE)
+    _local = threading.local()
+
+    @classmethod
+    def configure(cls, slow_query_ms=None):
+        """Apply settings from the database configuration
+
+        Args:
+            slow_query_ms (float, optional): Slow query logging threshold
+        """
+        if slow_query_ms is not None:
+            cls.slow_query_ms = float(slow_query_ms)
+
+    @classmethod
+    def record(cls, sql, params, elapsed_ms, rows, size, call_site=None):
+        """Record one completed statement
+
+        Args:
+            sql (str): Statement text as executed
+            params: Parameters passed with the statement
+            elapsed_ms (float): Wall time spent executing and fetching
+            rows (int): Rows fetched, or rows affected for writes
+            size (int): Approximate bytes fetched
+            call_site (str, optional): module.function that issued the statement
+        """
+        if call_site is None:
+            call_site = cls.current_call_site()
+        key = fingerprint(sql)
+
+        with cls._lock:
+            stats = cls._by_fingerprint.get(key)
+            if stats is None:
+                stats = cls._by_fingerprint[key] = StatementStats(key)
+            stats.add(elapsed_ms, rows, size, sql, params, call_site)
+
+            site_stats = cls._by_call_site.get(call_site)
+            if site_stats is None:
+                site_stats = cls._by_call_site[call_site] = StatementStats(call_site)
+            site_stats.add(elapsed_ms, rows, size, sql, params, call_site)
+
+            is_slow = elapsed_ms >= cls.slow_query_ms
+            if is_slow:
+                cls._slow_log.append({
+                    "time": time.time(),
+                    "elapsed_ms": elapsed_ms,
+                    "rows": rows,
+                    "call_site": call_site,
+                    "sql": key,
+                })
+
+        if is_slow:
+            print(f"⚠ Slow query ({elapsed_ms:.0f} ms, {rows} rows) from {call_site}: {key[:200]}")
+
+    @classmethod
+    def statements(cls):
+        """Get cumulative stats per statement fingerprint
+
+        Returns:
+            list: Dictionaries with count, avg/p50/p95/max ms, rows and bytes,
+                sorted by total time descending
+        """
+        with cls._lock:
+            result = [stats.to_dict() for stats in cls._by_fingerprint.values()]
+        return sorted(result, key=lambda item: item["total_ms"], reverse=True)
+
+    @classmethod
+    def call_sites(cls):
+        """Get cumulative stats per calling module and function
+
+        Returns:
+            list: Dictionaries shaped like statements(), keyed by call site
+        """
+        with cls._lock:
+            result = [stats.to_dict() for stats in cls._by_call_site.values()]
+        return sorted(result, key=lambda item: item["total_ms"], reverse=True)
+
+    @classmethod
+    def slow_queries(cls):
+        """Get the most recent statements over the slow query threshold
+
+        Returns:
+            list: Slow log entries, oldest first
+        """
+        with cls._lock:
+            return list(cls._slow_log)
+
+    @classmethod
+    def reset(cls):
+        """Discard all collected stats"""
+        with cls._lock:
+            cls._by_fingerprint.clear()
+            cls._by_call_site.clear()
+            cls._slow_log.clear()
+
+    @classmethod
+    def current_call_site(cls):
+        """Find the application function that issued the current statement
+
+        Returns:
+            str: module.function of the nearest non-plumbing frame
+        """
+        attributed = getattr(cls._local, "call_site", None)
+        if attributed:
+            return attributed
+
+        frame = sys._getframe(1)
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if not module.startswith(_INTERNAL_MODULE_PREFIXES):
+                return f"{module}.{frame.f_code.co_name}"
+            frame = frame.f_back
+        return "unknown"
+
+    @classmethod
+    @contextmanager
+    def attributed_to(cls, call_site):
+        """Attribute statements run on this thread to the given call site
+
+        Background workers use this so their queries are credited to the code
+        that submitted them rather than to the worker itself.
+
+        Args:
+            call_site (str): module.function to record
+        """
+        previous = getattr(cls._local, "call_site", None)
+        cls._local.call_site = call_site
+        try:
+            yield
+        finally:
+            cls._local.call_site = previous
+
+
+class InstrumentedCursor:
+    """Cursor proxy that times each statement through to its last fetch"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._pending = None
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        """Execute a statement and start timing it"""
+        self._finish()
+        call_site = QueryStats.current_call_site()
+        start = time.perf_counter()
+        try:
+            result = self._cursor.execute(operation, params, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._pending = {
+                "sql": operation,
+                "params": params,
+                "call_site": call_site,
+                "elapsed": elapsed,
+                "rows": 0,
+                "bytes": 0,
+            }
+        return result
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        """Execute a statement for each parameter set and time the batch"""
+        self._finish()
+        call_site = QueryStats.current_call_site()
+        start = time.perf_counter()
+        try:
+            return self._cursor.executemany(operation, seq_params, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            QueryStats.record(operation, None, elapsed * 1000, max(self._cursor.rowcount, 0), 0, call_site)
+
+    def fetchone(self):
+        """Fetch one row, counting it against the current statement"""
+        return self._timed_fetch(self._cursor.fetchone, single=True)
+
+    def fetchmany(self, size=None):
+        """Fetch several rows, counting them against the current statement"""
+        if size is None:
+            return self._timed_fetch(self._cursor.fetchmany)
+        return self._timed_fetch(lambda: self._cursor.fetchmany(size))
+
+    def fetchall(self):
+        """Fetch the remaining rows and close out the current statement"""
+        rows = self._timed_fetch(self._cursor.fetchall)
+        self._finish()
+        return rows
+
+    def close(self):
+        """Close the cursor, recording any statement still being read"""
+        self._finish()
+        return self._cursor.close()
+
+    def _timed_fetch(self, fetch, single=False):
+        """Run a fetch call and add its time, rows and bytes to the pending statement"""
+        start = time.perf_counter()
+        result = fetch()
+        elapsed = time.perf_counter() - start
+
+        if self._pending is not None:
+            self._pending["elapsed"] += elapsed
+            rows = ([result] if result is not None else []) if single else (result or [])
+            self._pending["rows"] += len(rows)
+            self._pending["bytes"] += sum(_row_size(row) for row in rows)
+        return result
+
+    def _finish(self):
+        """Record the pending statement, if any"""
+        pending = self._pending
+        if pending is None:
+            return
+        self._pending = None
+
+        rows = pending["rows"]
+        if not rows and not getattr(self._cursor, "with_rows", False):
+            # Writes report affected rows instead of fetched rows
+            rows = max(self._cursor.rowcount, 0)
+
+        QueryStats.record(
+            pending["sql"], pending["params"], pending["elapsed"] * 1000,
+            rows, pending["bytes"], pending["call_site"]
+        )
+
+    def __iter__(self):
+        row = self.fetchone()
+        while row is not None:
+            yield row
+            row = self.fetchone()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class InstrumentedConnection:
+    """Connection proxy whose cursors record statement timings"""
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    @property
+    def raw_connection(self):
+        """The wrapped mysql.connector connection"""
+        return self._connection
+
+    def cursor(self, *args, **kwargs):
+        """Open an instrumented cursor on the wrapped connection"""
+        return InstrumentedCursor(self._connection.cursor(*args, **kwargs))
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
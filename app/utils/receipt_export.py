@@ -0,0 +1,332 @@
+from PyQt5 import QtCore, QtGui
+import os
+import threading
+
+
+class ReceiptRenderer:
+    """Draws receipts with QPainter straight from receipt data
+
+    Nothing here touches widgets, so receipts can be drawn on worker threads
+    onto a QPdfWriter. The layout follows the on-screen receipt: a 400 x 600
+    unit page scaled to fit the paint device.
+    """
+
+    BUSINESS_NAME = "Miere Beauty Lounge"
+    ADDRESS = "Rainbow St, Marikina City"
+    CONTACT = "0962 915 5277 | miere.beautylounge@gmail.com"
+
+    # Logical page size and margin, in receipt units
+    WIDTH = 400
+    HEIGHT = 600
+    MARGIN = 20
+
+    TEXT_COLOR = QtGui.QColor("#333333")
+    MUTED_COLOR = QtGui.QColor("#555555")
+
+    @staticmethod
+    def font(size, bold=False, italic=False):
+        """Create a font sized in receipt units"""
+        font = QtGui.QFont()
+        font.setPixelSize(size)
+        font.setBold(bold)
+        font.setItalic(italic)
+        return font
+
+    @classmethod
+    def draw(cls, painter, receipt):
+        """Draw one receipt on the painter's current page
+
+        Args:
+            painter (QPainter): Active painter on the page
+            receipt (Receipt): Receipt data from ReceiptRepository
+        """
+        viewport = painter.viewport()
+        scale = min(viewport.width() / cls.WIDTH, viewport.height() / cls.HEIGHT)
+
+        painter.save()
+        painter.scale(scale, scale)
+        painter.setPen(cls.TEXT_COLOR)
+
+        left = cls.MARGIN
+        width = cls.WIDTH - 2 * cls.MARGIN
+        y = cls.MARGIN
+
+        def line(text, size=10, bold=False, italic=False, align=QtCore.Qt.AlignLeft, color=None, height=None):
+            nonlocal y
+            height = height or size + 6
+            painter.setFont(cls.font(size, bold, italic))
+            painter.setPen(color or cls.TEXT_COLOR)
+            painter.drawText(QtCore.QRectF(left, y, width, height), align | QtCore.Qt.AlignVCenter, text)
+            y += height
+
+        def pair(label, value, label_bold=True, value_bold=False, size=10, value_align=QtCore.Qt.AlignLeft):
+            nonlocal y
+            height = size + 6
+            painter.setPen(cls.TEXT_COLOR)
+            painter.setFont(cls.font(size, bold=label_bold))
+            painter.drawText(QtCore.QRectF(left, y, 120, height), QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, label)
+            painter.setFont(cls.font(size, bold=value_bold))
+            if value_align == QtCore.Qt.AlignLeft:
+                value_rect = QtCore.QRectF(left + 120, y, width - 120, height)
+            else:
+                value_rect = QtCore.QRectF(left, y, width, height)
+            painter.drawText(value_rect, value_align | QtCore.Qt.AlignVCenter, value)
+            y += height
+
+        # Header
+        line(cls.BUSINESS_NAME, 16, bold=True, align=QtCore.Qt.AlignCenter, height=24)
+        line(cls.ADDRESS, 10, align=QtCore.Qt.AlignCenter, color=cls.MUTED_COLOR)
+        line(cls.CONTACT, 10, align=QtCore.Qt.AlignCenter, color=cls.MUTED_COLOR)
+        y += 10
+        line("TRANSACTION RECEIPT", 12, bold=True, align=QtCore.Qt.AlignCenter)
+        y += 5
+
+        # Transaction and customer details
+        date = receipt.transaction_date
+        pair("Receipt No:", str(receipt.or_number))
+        pair("Date/Time:", date.strftime('%Y-%m-%d %H:%M:%S') if date else "")
+        pair("Transaction ID:", str(receipt.transaction_id))
+        y += 5
+        pair("Customer:", receipt.customer_name or "")
+        pair("Phone:", receipt.customer_phone or "")
+        pair("Gender:", receipt.customer_gender or "")
+        pair("City:", receipt.customer_city or "")
+        y += 10
+
+        # Service
+        line("SERVICE DETAILS", 12, bold=True)
+        painter.setFont(cls.font(10, bold=True))
+        painter.drawText(QtCore.QRectF(left, y, width * 0.6, 16), QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, "Description")
+        painter.drawText(QtCore.QRectF(left + width * 0.6, y, width * 0.1, 16), QtCore.Qt.AlignCenter, "Qty")
+        painter.drawText(QtCore.QRectF(left, y, width, 16), QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter, "Amount")
+        y += 18
+        painter.setFont(cls.font(10))
+        painter.drawText(QtCore.QRectF(left, y, width * 0.6, 16), QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, receipt.service_name or "")
+        painter.drawText(QtCore.QRectF(left + width * 0.6, y, width * 0.1, 16), QtCore.Qt.AlignCenter, "1")
+        painter.drawText(QtCore.QRectF(left, y, width, 16), QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter, f"₱{float(receipt.base_amount or 0):.2f}")
+        y += 26
+
+        # Notes
+        notes = (receipt.notes or "").strip()
+        if notes:
+            line("Service Notes:", 10, bold=True)
+            painter.setFont(cls.font(9, italic=True))
+            notes_rect = painter.boundingRect(QtCore.QRectF(left, y, width, 80), QtCore.Qt.TextWordWrap, notes)
+            painter.drawText(QtCore.QRectF(left, y, width, min(notes_rect.height(), 80)), QtCore.Qt.TextWordWrap, notes)
+            y += min(notes_rect.height(), 80) + 10
+
+        # Payment summary
+        right = QtCore.Qt.AlignRight
+        pair("Subtotal:", f"₱{float(receipt.base_amount or 0):.2f}", label_bold=False, value_align=right)
+        pair("Discount:", f"-₱{float(receipt.discount_amount or 0):.2f}", label_bold=False, value_align=right)
+        pair("Total:", f"₱{float(receipt.total_amount or 0):.2f}", value_bold=True, size=12, value_align=right)
+        pair("Payment Method:", receipt.payment_method or "", label_bold=False, value_align=right)
+        pair("Coupon Code:", receipt.coupon_code or "None", label_bold=False, value_align=right)
+        y += 10
+
+        # Footer
+        pair("Served by:", receipt.staff_name or "", label_bold=False, value_bold=True)
+
+        painter.restore()
+
+    @staticmethod
+    def create_writer(path):
+        """Create an A6 PDF writer for receipts"""
+        writer = QtGui.QPdfWriter(path)
+        writer.setPageSize(QtGui.QPagedPaintDevice.A6)
+        writer.setResolution(300)
+        writer.setCreator(ReceiptRenderer.BUSINESS_NAME)
+        return writer
+
+    @classmethod
+    def write_pdf(cls, path, receipts, cancelled=None, on_page=None):
+        """Write receipts to one PDF, one page each
+
+        Args:
+            path (str): Output file
+            receipts (list): Receipt tuples
+            cancelled (callable, optional): Returns True to stop before the next page
+            on_page (callable, optional): Called after each page is drawn
+
+        Returns:
+            bool: False if cancelled before every page was written
+        """
+        writer = cls.create_writer(path)
+        painter = QtGui.QPainter(writer)
+        try:
+            for index, receipt in enumerate(receipts):
+                if cancelled and cancelled():
+                    return False
+                if index:
+                    writer.newPage()
+                cls.draw(painter, receipt)
+                if on_page:
+                    on_page()
+        finally:
+            painter.end()
+        return True
+
+
+class ReceiptExportSignals(QtCore.QObject):
+    """Signals emitted by receipt render tasks"""
+
+    # Emitted after each receipt page is drawn
+    rendered = QtCore.pyqtSignal()
+
+    # Emitted with the path of each PDF once it is complete on disk
+    written = QtCore.pyqtSignal(str)
+
+    # Emitted with the error message when a task fails
+    failed = QtCore.pyqtSignal(str)
+
+
+class ReceiptRenderTask(QtCore.QRunnable):
+    """Runnable that writes receipts to a PDF on a worker thread"""
+
+    def __init__(self, path, receipts, signals, cancelled):
+        """Initialize the task
+
+        Args:
+            path (str): Output PDF
+            receipts (list): Receipts to write, one page each
+            signals (ReceiptExportSignals): Where progress is reported
+            cancelled (threading.Event): Set when the export is cancelled
+        """
+        super(ReceiptRenderTask, self).__init__()
+        self.path = path
+        self.receipts = receipts
+        self.signals = signals
+        self.cancelled = cancelled
+
+    def run(self):
+        """Write the PDF; a partial file is removed if the export is cancelled"""
+        if self.cancelled.is_set():
+            return
+
+        try:
+            complete = ReceiptRenderer.write_pdf(
+                self.path, self.receipts,
+                cancelled=self.cancelled.is_set,
+                on_page=self.signals.rendered.emit
+            )
+            if complete:
+                self.signals.written.emit(self.path)
+            elif os.path.exists(self.path):
+                os.remove(self.path)
+        except Exception as err:
+            self.signals.failed.emit(str(err))
+
+
+class ReceiptExport(QtCore.QObject):
+    """Exports receipts to PDF in background workers
+
+    Receipts are written either one file each, spread over a pool of render
+    threads, or as pages of a single combined file. Progress is reported on
+    the UI thread and the export can be cancelled at any time; receipts
+    already written as separate files are kept.
+    """
+
+    # Emitted with (receipts written, total receipts)
+    progress = QtCore.pyqtSignal(int, int)
+
+    # Emitted once every receipt is written, with the files written
+    finished = QtCore.pyqtSignal(list)
+
+    # Emitted with the error message when a receipt cannot be written
+    failed = QtCore.pyqtSignal(str)
+
+    _thread_pool = None
+
+    @classmethod
+    def thread_pool(cls):
+        """Get the pool receipts are rendered on, separate from the database workers
+
+        Returns:
+            QThreadPool: The render thread pool
+        """
+        if cls._thread_pool is None:
+            cls._thread_pool = QtCore.QThreadPool()
+            cls._thread_pool.setMaxThreadCount(max(1, QtCore.QThread.idealThreadCount() - 1))
+        return cls._thread_pool
+
+    @staticmethod
+    def file_name(receipt):
+        """Get the file name a receipt is exported under"""
+        return f"Receipt_{receipt.transaction_id}.pdf"
+
+    def __init__(self, receipts, output_path, combined=False, parent=None):
+        """Initialize the export
+
+        Args:
+            receipts (list): Receipt tuples to export
+            output_path (str): Folder for one file per receipt, or the
+                combined PDF's file name
+            combined (bool): Write every receipt into a single PDF
+            parent (QObject, optional): Owner of the export
+        """
+        super(ReceiptExport, self).__init__(parent)
+        self.receipts = receipts
+        self.output_path = output_path
+        self.combined = combined
+        self.done = 0
+        self.paths = []
+        self.written = []
+        self.cancelled = threading.Event()
+
+        self.signals = ReceiptExportSignals()
+        self.signals.rendered.connect(self.on_rendered)
+        self.signals.written.connect(self.on_written)
+        self.signals.failed.connect(self.on_failed)
+
+    def start(self):
+        """Queue the render tasks"""
+        if not self.receipts:
+            self.finished.emit([])
+            return
+
+        if self.combined:
+            self.paths = [self.output_path]
+            tasks = [ReceiptRenderTask(self.output_path, self.receipts, self.signals, self.cancelled)]
+        else:
+            self.paths = [os.path.join(self.output_path, self.file_name(receipt)) for receipt in self.receipts]
+            tasks = [
+                ReceiptRenderTask(path, [receipt], self.signals, self.cancelled)
+                for path, receipt in zip(self.paths, self.receipts)
+            ]
+
+        pool = self.thread_pool()
+        for task in tasks:
+            pool.start(task)
+
+    def cancel(self):
+        """Stop the export; queued receipts are skipped"""
+        self.cancelled.set()
+
+    def is_cancelled(self):
+        """Check whether the export has been cancelled"""
+        return self.cancelled.is_set()
+
+    def on_rendered(self):
+        """Count drawn receipts and report progress"""
+        if self.is_cancelled():
+            return
+
+        self.done += 1
+        self.progress.emit(self.done, len(self.receipts))
+
+    def on_written(self, path):
+        """Finish once every PDF is complete on disk"""
+        if self.is_cancelled():
+            return
+
+        self.written.append(path)
+        if len(self.written) == len(self.paths):
+            self.finished.emit(self.written)
+
+    def on_failed(self, message):
+        """Stop the export after a receipt fails to render"""
+        if self.is_cancelled():
+            return
+
+        self.cancel()
+        self.failed.emit(message)
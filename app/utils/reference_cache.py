@@ -0,0 +1,130 @@
+from app.utils.db_manager import DBManager
+import threading
+import time
+
+
+class ReferenceCache:
+    """In-process cache of the small value lists that fill filter dialog combo boxes
+
+    Each list is loaded once and served from memory until it expires or one of
+    the tables it is read from is written. Writers call invalidate() with the
+    tables they touched. Lists read from transactions are not invalidated on
+    every checkout; they rely on the TTL instead, because a new payment method
+    or staff name appearing a few minutes late in a filter is harmless.
+    """
+
+    # Seconds a loaded list stays valid without an invalidation
+    TTL = 300
+
+    # List name -> (query returning one column, tables the list depends on)
+    LISTS = {
+        "payment_methods": (
+            "SELECT DISTINCT payment_method FROM transactions WHERE payment_method IS NOT NULL AND payment_method != ''",
+            ("transactions",)
+        ),
+        "customer_genders": (
+            "SELECT DISTINCT customer_gender FROM transactions WHERE customer_gender IS NOT NULL AND customer_gender != ''",
+            ("transactions",)
+        ),
+        "transaction_staff": (
+            "SELECT DISTINCT u.username FROM users u INNER JOIN transactions t ON u.user_id = t.created_by WHERE u.username IS NOT NULL",
+            ("users", "transactions")
+        ),
+        "sold_service_names": (
+            """
+            SELECT DISTINCT s.service_name
+            FROM services s
+            INNER JOIN transaction_lines l ON s.service_id = l.service_id
+            WHERE s.service_name IS NOT NULL AND s.service_name != ''
+            """,
+            ("services", "transactions")
+        ),
+        "product_categories": (
+            "SELECT DISTINCT category FROM products WHERE category IS NOT NULL AND category != ''",
+            ("products",)
+        ),
+        "service_categories": (
+            "SELECT DISTINCT category FROM services WHERE category IS NOT NULL AND category != ''",
+            ("services",)
+        ),
+        "available_service_categories": (
+            "SELECT DISTINCT category FROM services WHERE category IS NOT NULL AND category != '' AND availability = 1",
+            ("services",)
+        ),
+        "supplier_names": (
+            "SELECT DISTINCT supplier_name FROM suppliers WHERE supplier_name IS NOT NULL AND supplier_name != ''",
+            ("suppliers",)
+        ),
+        "supplier_categories": (
+            "SELECT DISTINCT category FROM suppliers WHERE category IS NOT NULL AND category != ''",
+            ("suppliers",)
+        ),
+        "delivered_supplier_names": (
+            """
+            SELECT DISTINCT supplier_name
+            FROM inventory_status
+            WHERE supplier_name IS NOT NULL AND supplier_name != '' AND status = 'Received'
+            """,
+            ("inventory_status", "suppliers")
+        ),
+    }
+
+    # List name -> (values, loaded_at)
+    _entries = {}
+    _lock = threading.Lock()
+
+    # Bumped on every invalidation so a load racing a write is not cached
+    _generation = 0
+
+    @classmethod
+    def get(cls, name):
+        """Get a reference list, loading it from the database if needed
+
+        Args:
+            name (str): Key of the list in LISTS
+
+        Returns:
+            list: The distinct values, as strings
+
+        Raises:
+            mysql.connector.Error: If the list has to be loaded and the query fails
+        """
+        with cls._lock:
+            entry = cls._entries.get(name)
+            if entry and time.monotonic() - entry[1] < cls.TTL:
+                return list(entry[0])
+            generation = cls._generation
+
+        query, _ = cls.LISTS[name]
+        conn = DBManager.get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query)
+            values = [row[0] for row in cursor.fetchall() if row[0]]
+        finally:
+            cursor.close()
+
+        with cls._lock:
+            if generation == cls._generation:
+                cls._entries[name] = (values, time.monotonic())
+        return list(values)
+
+    @classmethod
+    def invalidate(cls, *tables):
+        """Drop every cached list that depends on any of the given tables
+
+        Args:
+            *tables (str): Names of the tables that were written
+        """
+        with cls._lock:
+            cls._generation += 1
+            for name, (_, depends_on) in cls.LISTS.items():
+                if any(table in depends_on for table in tables):
+                    cls._entries.pop(name, None)
+
+    @classmethod
+    def clear(cls):
+        """Drop every cached list"""
+        with cls._lock:
+            cls._generation += 1
+            cls._entries.clear()
@@ -0,0 +1,815 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import NamedTuple, Optional
+from app.utils.customer_profiles import CustomerProfiles
+from app.utils.transaction_filters import TransactionFilter
+
+
+class Transaction(NamedTuple):
+    """A sale as listed in the customers and reports tables"""
+    transaction_id: str
+    or_number: str
+    customer_name: str
+    customer_phone: str
+    customer_gender: Optional[str]
+    customer_city: Optional[str]
+    service_name: Optional[str]
+    total_amount: Decimal
+    discount_amount: Optional[Decimal]
+    discount_percentage: Optional[Decimal]
+    payment_method: str
+    transaction_date: datetime
+    staff_name: Optional[str]
+    notes: Optional[str]
+
+
+class Receipt(NamedTuple):
+    """Everything printed on a sale's receipt"""
+    transaction_id: str
+    or_number: str
+    customer_name: str
+    customer_phone: str
+    customer_gender: Optional[str]
+    customer_city: Optional[str]
+    service_name: Optional[str]
+    base_amount: Decimal
+    discount_amount: Optional[Decimal]
+    total_amount: Decimal
+    payment_method: str
+    coupon_code: Optional[str]
+    notes: Optional[str]
+    transaction_date: datetime
+    staff_name: Optional[str]
+
+
+class Customer(NamedTuple):
+    """A returning customer's profile with lifetime aggregates"""
+    phone_key: str
+    customer_name: str
+    customer_phone: str
+    customer_gender: Optional[str]
+    customer_city: Optional[str]
+    visit_count: int
+    lifetime_spend: Decimal
+    first_visit: datetime
+    last_visit: datetime
+    favorite_service: Optional[str]
+
+
+class ServiceRevenue(NamedTuple):
+    """A service's sales, summed over the transaction lines it appears on"""
+    service_id: int
+    service_name: Optional[str]
+    times_sold: int
+    revenue: Decimal
+
+
+class DailySales(NamedTuple):
+    """One day's sales totals"""
+    sale_date: date
+    transaction_count: int
+    revenue: Decimal
+
+
+class DashboardMetrics(NamedTuple):
+    """The dashboard's sales figures: all-time revenue plus today's totals"""
+    total_revenue: Decimal
+    daily_revenue: Decimal
+    transactions_count: int
+    services_count: int
+    service_revenue: list
+
+
+class Product(NamedTuple):
+    """A product as listed in the inventory products table"""
+    product_id: int
+    product_name: str
+    category: Optional[str]
+    price: Decimal
+    quantity: Optional[int]
+    threshold_value: Optional[int]
+    expiry_date: Optional[date]
+    availability: Optional[int]
+    description: Optional[str]
+
+
+class Service(NamedTuple):
+    """A service as listed in the inventory services table"""
+    service_id: int
+    service_name: str
+    category: Optional[str]
+    price: Decimal
+    availability: Optional[int]
+    description: Optional[str]
+
+
+class Supplier(NamedTuple):
+    """A supplier order as listed in the suppliers table"""
+    supplier_id: int
+    supplier_name: str
+    product_name: str
+    category: Optional[str]
+    contact_number: Optional[str]
+    email: Optional[str]
+    accepts_returns: Optional[int]
+    products_on_the_way: Optional[int]
+    status: str
+
+
+class InventoryBatch(NamedTuple):
+    """A received batch of a product, tracked for expiry"""
+    batch_id: int
+    product_id: int
+    product_name: str
+    expiry_date: Optional[date]
+    quantity: int
+    original_quantity: int
+    supplier_name: Optional[str]
+    received_date: Optional[datetime]
+    status: Optional[str]
+
+
+class User(NamedTuple):
+    """An account as listed in the user management table"""
+    user_id: int
+    username: str
+    full_name: str
+    role: str
+    login_time: Optional[datetime]
+    logout_time: Optional[datetime]
+    created_at: Optional[datetime]
+
+
+class Repository:
+    """Base class that loads rows of one entity as named tuples
+
+    Rows are read through a plain tuple cursor and mapped positionally onto
+    the entity, so each row costs one tuple instead of a dictionary. Only the
+    entity's fields are selected, never SELECT *.
+    """
+
+    # NamedTuple class rows are mapped onto
+    ENTITY = None
+
+    # FROM clause, including any joins
+    FROM = ""
+
+    # Alias of the main table, used for fields without an entry in COLUMNS
+    ALIAS = ""
+
+    # Field name -> SQL expression, for fields not read from the main table
+    COLUMNS = {}
+
+    @classmethod
+    def column(cls, field):
+        """Get the SQL expression that selects a field"""
+        if field in cls.COLUMNS:
+            return cls.COLUMNS[field]
+        return f"{cls.ALIAS}.{field}" if cls.ALIAS else field
+
+    @classmethod
+    def select_column(cls, field, omit=()):
+        """Get the select-list entry for a field"""
+        if field in omit:
+            return f"NULL AS {field}"
+        column = cls.column(field)
+        return column if column == field else f"{column} AS {field}"
+
+    @classmethod
+    def select_sql(cls, where="", order_by="", limit=None, fields=None, omit=()):
+        """Build the SELECT statement for the entity
+
+        Args:
+            where (str, optional): Condition, without the WHERE keyword
+            order_by (str, optional): Ordering, without the ORDER BY keywords
+            limit (int, optional): Maximum number of rows
+            fields (tuple, optional): Subset of fields to select, in order.
+                Defaults to every field of the entity.
+            omit (tuple, optional): Fields to select as NULL, keeping the row
+                shape while skipping columns the caller will not show
+
+        Returns:
+            str: SQL statement
+        """
+        fields = fields or cls.ENTITY._fields
+        columns = ", ".join(cls.select_column(field, omit) for field in fields)
+
+        sql = f"SELECT {columns} FROM {cls.FROM}"
+        if where:
+            sql += f" WHERE {where}"
+        if order_by:
+            sql += f" ORDER BY {order_by}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return sql
+
+    @classmethod
+    def fetch(cls, conn, where="", params=(), order_by="", limit=None, omit=()):
+        """Load entities
+
+        Args:
+            conn: Open database connection
+            where, order_by, limit, omit: See select_sql()
+            params (tuple, optional): Parameters for the WHERE clause
+
+        Returns:
+            list: ENTITY instances
+        """
+        make = cls.ENTITY._make
+        return [make(row) for row in cls.fetch_rows(conn, where, params, order_by, limit, omit=omit)]
+
+    @classmethod
+    def fetch_rows(cls, conn, where="", params=(), order_by="", limit=None, fields=None, omit=()):
+        """Load plain tuples, skipping entity construction
+
+        Fast path for callers that only aggregate or index a few columns; use
+        index() to find a field's position.
+
+        Returns:
+            list: Tuples in the order of fields, or of the entity's fields
+        """
+        cursor = conn.cursor()
+        try:
+            cursor.execute(cls.select_sql(where, order_by, limit, fields, omit), params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    @classmethod
+    def index(cls, field, fields=None):
+        """Get the position of a field in rows from fetch_rows()"""
+        return (fields or cls.ENTITY._fields).index(field)
+
+    @staticmethod
+    def prefix_pattern(text):
+        """Build a LIKE pattern matching values that start with text
+
+        Wildcards in the text are escaped, so an index on the column can
+        answer the match as a range scan.
+        """
+        escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return escaped + "%"
+
+    @staticmethod
+    def in_clause(column, values):
+        """Build an IN condition with one placeholder per value
+
+        Returns:
+            tuple: (condition, params)
+        """
+        values = tuple(values)
+        return f"{column} IN ({', '.join(['%s'] * len(values))})", values
+
+
+class TransactionRepository(Repository):
+    """Loads sales transactions with their service and staff names"""
+
+    ENTITY = Transaction
+    ALIAS = "t"
+    FROM = """transactions t
+        LEFT JOIN users u ON t.created_by = u.user_id"""
+
+    # Every service sold in the transaction, from its lines in line order
+    SERVICE_NAMES = """(SELECT GROUP_CONCAT(ls.service_name ORDER BY l.line_no SEPARATOR ', ')
+        FROM transaction_lines l
+        JOIN services ls ON l.service_id = ls.service_id
+        WHERE l.transaction_id = t.transaction_id)"""
+
+    COLUMNS = {
+        "service_name": SERVICE_NAMES,
+        "staff_name": "u.username",
+    }
+
+    @classmethod
+    def history(cls, conn, limit=None, with_notes=False):
+        """Load transactions, newest first
+
+        Args:
+            conn: Open database connection
+            limit (int, optional): Maximum number of transactions
+            with_notes (bool): Also load the free-text notes column
+
+        Returns:
+            list: Transaction tuples
+        """
+        omit = () if with_notes else ("notes",)
+        return cls.fetch(conn, order_by="t.transaction_date DESC", limit=limit, omit=omit)
+
+    # Sortable field -> (SQL expression, value standing in for NULL). Nullable
+    # columns are wrapped so every row has a comparable sort value. The
+    # service list is built per row by a subquery, which no index can order,
+    # so it is not sortable.
+    SORT_KEYS = {
+        "transaction_id": ("t.transaction_id", None),
+        "or_number": ("t.or_number", None),
+        "customer_name": ("t.customer_name", None),
+        "customer_phone": ("t.customer_phone", None),
+        "customer_gender": ("COALESCE(t.customer_gender, '')", ""),
+        "customer_city": ("COALESCE(t.customer_city, '')", ""),
+        "total_amount": ("t.total_amount", None),
+        "payment_method": ("t.payment_method", None),
+        "discount_percentage": ("COALESCE(t.discount_percentage, 0)", 0),
+        "transaction_date": ("t.transaction_date", None),
+        "staff_name": ("COALESCE(u.username, '')", ""),
+    }
+
+    # Indexed columns customer search matches by prefix
+    SEARCH_COLUMNS = ("t.customer_name", "t.customer_phone", "t.or_number", "t.transaction_id")
+
+    @classmethod
+    def search_condition(cls, search):
+        """Build a condition matching transactions whose searchable columns start with a term
+
+        Returns:
+            tuple: (condition, params); ("", ()) for a blank term
+        """
+        search = (search or "").strip()
+        if not search:
+            return "", ()
+        pattern = cls.prefix_pattern(search)
+        condition = " OR ".join(f"{column} LIKE %s" for column in cls.SEARCH_COLUMNS)
+        return f"({condition})", (pattern,) * len(cls.SEARCH_COLUMNS)
+
+    @classmethod
+    def page(cls, conn, sort_field="transaction_date", descending=True, after=None, limit=200, search=None, filters=None):
+        """Load one page of transactions in a stable order, for scrolling views
+
+        Pages are read by keyset rather than OFFSET: each page starts after the
+        sort value and transaction ID of the previous page's last row, so the
+        thousandth page costs the same as the first. Transaction ID breaks ties.
+
+        Args:
+            conn: Open database connection
+            sort_field (str): Field to order by; a key of SORT_KEYS
+            descending (bool): Largest or newest first
+            after (tuple, optional): (sort value, transaction_id) of the last
+                row already loaded; None for the first page
+            limit (int): Maximum number of transactions
+            search (str, optional): Only transactions whose customer name,
+                phone, OR number or transaction ID starts with this term
+            filters (dict, optional): Filter dialog state; see TransactionFilter
+
+        Returns:
+            list: Transaction tuples, without notes
+        """
+        expression = cls.SORT_KEYS[sort_field][0]
+        direction = "DESC" if descending else "ASC"
+
+        where, params = TransactionFilter.combine(
+            cls.search_condition(search),
+            TransactionFilter.compile(filters),
+            cls.keyset_condition(sort_field, descending, after)
+        )
+
+        order_by = f"{expression} {direction}, t.transaction_id {direction}"
+        return cls.fetch(conn, where, params, order_by=order_by, limit=limit, omit=("notes",))
+
+    @classmethod
+    def keyset_condition(cls, sort_field, descending, after):
+        """Build a condition matching the rows that come after a keyset in a sort order
+
+        The keyset is compared as a row constructor, which MySQL can answer
+        with a range scan on an index over the sort column.
+
+        Returns:
+            tuple: (condition, params); ("", ()) when after is None
+        """
+        if after is None:
+            return "", ()
+
+        expression, null_value = cls.SORT_KEYS[sort_field]
+        operator = "<" if descending else ">"
+        value, transaction_id = after
+        if value is None:
+            value = null_value
+        return f"({expression}, t.transaction_id) {operator} (%s, %s)", (value, transaction_id)
+
+    @classmethod
+    def newer(cls, conn, since, transaction_ids=None, search=None, filters=None, limit=200):
+        """Load the transactions newer than the newest one a view already has
+
+        Given the IDs of the new transactions, every one of them is loaded
+        whatever its keyset: a sale stamped by a terminal with a slow clock,
+        or numbered from another terminal's ID block, can sort below rows
+        that are already loaded, and the caller decides where it goes.
+
+        Args:
+            conn: Open database connection
+            since (tuple): (transaction_date, transaction_id) of the newest
+                loaded transaction; ignored when transaction_ids is given
+            transaction_ids (iterable, optional): Only load these
+                transactions, e.g. the ones a checkout just saved
+            search (str, optional): See page()
+            filters (dict, optional): Filter dialog state; see TransactionFilter
+            limit (int): Maximum number of transactions
+
+        Returns:
+            list: Transaction tuples without notes, oldest first
+        """
+        if transaction_ids is not None:
+            range_condition = cls.in_clause("t.transaction_id", transaction_ids)
+        else:
+            range_condition = cls.keyset_condition("transaction_date", False, since)
+
+        where, params = TransactionFilter.combine(
+            cls.search_condition(search),
+            TransactionFilter.compile(filters),
+            range_condition
+        )
+
+        order_by = "t.transaction_date ASC, t.transaction_id ASC"
+        return cls.fetch(conn, where, params, order_by=order_by, limit=limit, omit=("notes",))
+
+    @classmethod
+    def filtered(cls, conn, filters, limit=None):
+        """Load the transactions matching a filter dialog state, newest first
+
+        Args:
+            conn: Open database connection
+            filters (dict): Filter dialog state; see TransactionFilter
+            limit (int, optional): Maximum number of transactions
+
+        Returns:
+            list: Transaction tuples, without notes
+        """
+        where, params = TransactionFilter.compile(filters)
+        return cls.fetch(conn, where, params, order_by="t.transaction_date DESC", limit=limit, omit=("notes",))
+
+    @classmethod
+    def totals(cls, conn, search=None, filters=None):
+        """Count and sum the transactions matching a search and filters
+
+        Args:
+            conn: Open database connection
+            search (str, optional): See page()
+            filters (dict, optional): Filter dialog state; see TransactionFilter
+
+        Returns:
+            tuple: (number of transactions, total amount as Decimal)
+        """
+        where, params = TransactionFilter.combine(cls.search_condition(search), TransactionFilter.compile(filters))
+
+        # The users join never filters, so it is left out of the aggregate
+        sql = "SELECT COUNT(*), COALESCE(SUM(t.total_amount), 0) FROM transactions t"
+        if where:
+            sql += f" WHERE {where}"
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql, params)
+            count, total = cursor.fetchone()
+            return count, Decimal(total)
+        finally:
+            cursor.close()
+
+
+class TransactionLineRepository:
+    """Aggregates the services sold, from transaction_lines"""
+
+    @staticmethod
+    def service_revenue(conn, filters=None, limit=None):
+        """Sum the sales of each service over the transactions matching a filter state
+
+        Lines are grouped in one query, so a transaction with several
+        services counts towards each of them with its share of the amount.
+
+        Args:
+            conn: Open database connection
+            filters (dict, optional): Filter dialog state; see TransactionFilter
+            limit (int, optional): Maximum number of services
+
+        Returns:
+            list: ServiceRevenue tuples, highest revenue first
+        """
+        where, params = TransactionFilter.compile(filters)
+
+        sql = """
+            SELECT l.service_id, s.service_name, COUNT(*), COALESCE(SUM(l.line_total), 0)
+            FROM transaction_lines l
+            JOIN transactions t ON l.transaction_id = t.transaction_id
+            LEFT JOIN services s ON l.service_id = s.service_id
+        """
+        if where:
+            sql += f" WHERE {where}"
+        sql += " GROUP BY l.service_id, s.service_name ORDER BY SUM(l.line_total) DESC, s.service_name"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql, params)
+            return [
+                ServiceRevenue(service_id, service_name, times_sold, Decimal(revenue))
+                for service_id, service_name, times_sold, revenue in cursor.fetchall()
+            ]
+        finally:
+            cursor.close()
+
+
+class SalesRollupRepository:
+    """Reads sales totals from sales_daily_rollup instead of scanning transactions
+
+    Date bounds are (start, end) pairs of midnights, as from DateRange.
+    """
+
+    @staticmethod
+    def date_condition(bounds):
+        """Build a condition on sale_date for half-open date bounds
+
+        Returns:
+            tuple: (condition, params); ("", ()) for no bounds
+        """
+        if not bounds:
+            return "", ()
+        return "r.sale_date >= %s AND r.sale_date < %s", tuple(bounds)
+
+    @classmethod
+    def query(cls, conn, select, bounds=None, suffix=""):
+        """Run a query over the rollup, limited to some days
+
+        Returns:
+            list: Result tuples
+        """
+        where, params = cls.date_condition(bounds)
+        sql = f"SELECT {select} FROM sales_daily_rollup r"
+        if where:
+            sql += f" WHERE {where}"
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql + suffix, params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    @classmethod
+    def totals(cls, conn, bounds=None):
+        """Count and sum the sales made between date bounds, or ever
+
+        Returns:
+            tuple: (number of transactions, net revenue as Decimal)
+        """
+        count, revenue = cls.query(conn, "COALESCE(SUM(r.transaction_count), 0), COALESCE(SUM(r.net_amount), 0)", bounds)[0]
+        return int(count), Decimal(revenue)
+
+    @classmethod
+    def daily(cls, conn, bounds):
+        """Load the totals of each day with sales between date bounds
+
+        Returns:
+            list: DailySales tuples, oldest day first
+        """
+        rows = cls.query(
+            conn, "r.sale_date, SUM(r.transaction_count), SUM(r.net_amount)", bounds,
+            " GROUP BY r.sale_date ORDER BY r.sale_date"
+        )
+        return [DailySales(sale_date, int(count), Decimal(revenue)) for sale_date, count, revenue in rows]
+
+    @classmethod
+    def dashboard_metrics(cls, conn, bounds):
+        """Compute every dashboard sales figure in one statement
+
+        All-time revenue and the totals between date bounds are conditional
+        sums over the same scan, grouped by service with a rollup row for
+        the grand totals.
+
+        Args:
+            conn: Open database connection
+            bounds (tuple): (start, end) of the period counted as today
+
+        Returns:
+            DashboardMetrics: The figures; service_revenue lists the services
+                sold in the period, highest revenue first
+        """
+        in_period = "r.sale_date >= %s AND r.sale_date < %s"
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"""
+                SELECT r.service_id, ANY_VALUE(s.service_name), GROUPING(r.service_id),
+                       SUM(r.net_amount),
+                       SUM(CASE WHEN {in_period} THEN r.net_amount ELSE 0 END),
+                       SUM(CASE WHEN {in_period} THEN r.transaction_count ELSE 0 END),
+                       SUM(CASE WHEN {in_period} THEN r.service_count ELSE 0 END)
+                FROM sales_daily_rollup r
+                LEFT JOIN services s ON r.service_id = s.service_id
+                GROUP BY r.service_id WITH ROLLUP
+            """, tuple(bounds) * 3)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        metrics = DashboardMetrics(Decimal(0), Decimal(0), 0, 0, [])
+        service_revenue = []
+        for service_id, service_name, is_total, total, revenue, transactions, services in rows:
+            if is_total:
+                metrics = DashboardMetrics(Decimal(total), Decimal(revenue), int(transactions), int(services), [])
+            elif services:
+                service_revenue.append(ServiceRevenue(service_id, service_name, int(services), Decimal(revenue)))
+
+        service_revenue.sort(key=lambda service: (-service.revenue, service.service_name or ""))
+        return metrics._replace(service_revenue=service_revenue)
+
+    @classmethod
+    def by_service(cls, conn, bounds=None):
+        """Sum each service's sales between date bounds
+
+        Returns:
+            list: ServiceRevenue tuples, highest revenue first
+        """
+        where, params = cls.date_condition(bounds)
+        sql = """
+            SELECT r.service_id, s.service_name, SUM(r.service_count), SUM(r.net_amount)
+            FROM sales_daily_rollup r
+            LEFT JOIN services s ON r.service_id = s.service_id
+        """
+        if where:
+            sql += f" WHERE {where}"
+        sql += " GROUP BY r.service_id, s.service_name ORDER BY SUM(r.net_amount) DESC, s.service_name"
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql, params)
+            return [
+                ServiceRevenue(service_id, service_name, int(times_sold), Decimal(revenue))
+                for service_id, service_name, times_sold, revenue in cursor.fetchall()
+            ]
+        finally:
+            cursor.close()
+
+
+class ProductRepository(Repository):
+    """Loads products for the inventory views"""
+
+    ENTITY = Product
+    FROM = "products"
+
+    @classmethod
+    def all(cls, conn):
+        """Load every product, alphabetically"""
+        return cls.fetch(conn, order_by="product_name")
+
+    @classmethod
+    def by_ids(cls, conn, product_ids):
+        """Load specific products
+
+        Args:
+            conn: Open database connection
+            product_ids (iterable): Product IDs; must not be empty
+
+        Returns:
+            list: Product tuples for the IDs that still exist
+        """
+        where, params = cls.in_clause("product_id", product_ids)
+        return cls.fetch(conn, where, params)
+
+
+class ServiceRepository(Repository):
+    """Loads salon services"""
+
+    ENTITY = Service
+    FROM = "services"
+
+    @classmethod
+    def all(cls, conn):
+        """Load every service, alphabetically"""
+        return cls.fetch(conn, order_by="service_name")
+
+
+class SupplierRepository(Repository):
+    """Loads supplier orders"""
+
+    ENTITY = Supplier
+    FROM = "suppliers"
+
+    @classmethod
+    def all(cls, conn):
+        """Load every supplier order, by supplier name"""
+        return cls.fetch(conn, order_by="supplier_name")
+
+
+class InventoryBatchRepository(Repository):
+    """Loads received product batches"""
+
+    ENTITY = InventoryBatch
+    FROM = "inventory_batches"
+
+    @classmethod
+    def active(cls, conn, product_id=None):
+        """Load batches that still hold stock, soonest expiry first
+
+        Args:
+            conn: Open database connection
+            product_id (int, optional): Only load batches of this product
+
+        Returns:
+            list: InventoryBatch tuples
+        """
+        where, params = "status = 'active'", ()
+        if product_id is not None:
+            where, params = where + " AND product_id = %s", (product_id,)
+        return cls.fetch(conn, where, params, order_by="expiry_date IS NULL, expiry_date, received_date")
+
+
+class UserRepository(Repository):
+    """Loads user accounts, without credentials"""
+
+    ENTITY = User
+    FROM = "users"
+
+    @classmethod
+    def all(cls, conn):
+        """Load every user, newest account first"""
+        return cls.fetch(conn, order_by="created_at DESC")
+
+
+class ReceiptRepository(Repository):
+    """Loads the data receipts are rendered from"""
+
+    ENTITY = Receipt
+    ALIAS = TransactionRepository.ALIAS
+    FROM = TransactionRepository.FROM
+    COLUMNS = TransactionRepository.COLUMNS
+
+    @classmethod
+    def by_ids(cls, conn, transaction_ids):
+        """Load the receipts of some transactions, oldest first
+
+        Returns:
+            list: Receipt tuples for the IDs that exist
+        """
+        transaction_ids = tuple(transaction_ids)
+        if not transaction_ids:
+            return []
+        where, params = cls.in_clause("t.transaction_id", transaction_ids)
+        return cls.fetch(conn, where, params, order_by="t.transaction_date, t.transaction_id")
+
+    @classmethod
+    def between(cls, conn, start_date, end_date):
+        """Load the receipts of the sales made on some days, oldest first
+
+        Args:
+            conn: Open database connection
+            start_date (date): First day, inclusive
+            end_date (date): Last day, inclusive
+
+        Returns:
+            list: Receipt tuples
+        """
+        return cls.fetch(
+            conn,
+            "t.transaction_date >= %s AND t.transaction_date < %s + INTERVAL 1 DAY",
+            (start_date, end_date),
+            order_by="t.transaction_date, t.transaction_id"
+        )
+
+
+class CustomerRepository(Repository):
+    """Loads customer profiles maintained by CustomerProfiles"""
+
+    ENTITY = Customer
+    ALIAS = "c"
+    FROM = """customers c
+        LEFT JOIN services s ON c.favorite_service_id = s.service_id"""
+    COLUMNS = {
+        "favorite_service": "s.service_name",
+    }
+
+    @classmethod
+    def by_phone(cls, conn, phone):
+        """Load the profile of the customer with a phone number
+
+        Args:
+            conn: Open database connection
+            phone (str): Phone number in any format
+
+        Returns:
+            Customer: The profile, or None if the customer has none
+        """
+        phone_key = CustomerProfiles.normalize_phone(phone)
+        if not phone_key:
+            return None
+        customers = cls.fetch(conn, "c.phone_key = %s", (phone_key,), limit=1)
+        return customers[0] if customers else None
+
+    @classmethod
+    def matching(cls, conn, text, limit=10):
+        """Load the customers whose name or phone starts with text, most recent visit first
+
+        Both prefixes are answered from an index: the name index and the
+        phone key primary key.
+
+        Returns:
+            list: Customer tuples
+        """
+        text = (text or "").strip()
+        if not text:
+            return []
+
+        where = "c.customer_name LIKE %s"
+        params = (cls.prefix_pattern(text),)
+
+        phone_key = CustomerProfiles.normalize_phone(text)
+        if phone_key:
+            where += " OR c.phone_key LIKE %s"
+            params += (cls.prefix_pattern(phone_key),)
+
+        return cls.fetch(conn, f"({where})", params, order_by="c.last_visit DESC", limit=limit)
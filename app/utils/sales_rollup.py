@@ -0,0 +1,146 @@
+import argparse
+import sys
+from datetime import date, timedelta
+from app.utils.db_manager import DBManager
+
+
+class SalesRollup:
+    """Maintains sales_daily_rollup, sales totals per day, payment method, service and staff
+
+    Checkout adds each sale to its rows in the same database transaction as
+    the sale itself, so the dashboard and the per-day report totals read a
+    few rows per day instead of scanning every transaction. Amounts come
+    from transaction lines: a sale with several services is spread over
+    their rows, and is counted as one transaction on its first line's row.
+    rebuild() recomputes any range of days from the transactions, for the
+    initial backfill and for repairs.
+    """
+
+    CREATE_TABLE = """
+        CREATE TABLE IF NOT EXISTS sales_daily_rollup (
+            sale_date DATE NOT NULL,
+            payment_method VARCHAR(50) NOT NULL,
+            service_id INT NOT NULL,
+            staff_id INT NOT NULL DEFAULT 0,
+            transaction_count INT NOT NULL DEFAULT 0,
+            service_count INT NOT NULL DEFAULT 0,
+            gross_amount DECIMAL(14,2) NOT NULL DEFAULT 0.00,
+            discount_amount DECIMAL(14,2) NOT NULL DEFAULT 0.00,
+            net_amount DECIMAL(14,2) NOT NULL DEFAULT 0.00,
+            PRIMARY KEY (sale_date, payment_method, service_id, staff_id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci
+    """
+
+    # Lines of the selected transactions summed into rollup rows; staff_id 0
+    # stands for sales without a recorded user
+    AGGREGATE = """
+        SELECT DATE(t.transaction_date), t.payment_method, l.service_id, COALESCE(t.created_by, 0),
+               SUM(l.line_no = 1), COUNT(*), SUM(l.unit_price), SUM(l.unit_price - l.line_total), SUM(l.line_total)
+        FROM transaction_lines l
+        JOIN transactions t ON l.transaction_id = t.transaction_id
+        WHERE {where}
+        GROUP BY DATE(t.transaction_date), t.payment_method, l.service_id, COALESCE(t.created_by, 0)
+    """
+
+    INSERT = """
+        INSERT INTO sales_daily_rollup (
+            sale_date, payment_method, service_id, staff_id,
+            transaction_count, service_count, gross_amount, discount_amount, net_amount
+        )
+    """
+
+    # Qualified, because transactions also has a discount_amount column
+    ACCUMULATE = """
+        ON DUPLICATE KEY UPDATE
+            transaction_count = sales_daily_rollup.transaction_count + VALUES(transaction_count),
+            service_count = sales_daily_rollup.service_count + VALUES(service_count),
+            gross_amount = sales_daily_rollup.gross_amount + VALUES(gross_amount),
+            discount_amount = sales_daily_rollup.discount_amount + VALUES(discount_amount),
+            net_amount = sales_daily_rollup.net_amount + VALUES(net_amount)
+    """
+
+    @classmethod
+    def create_table(cls, cursor):
+        """Create the sales_daily_rollup table"""
+        cursor.execute(cls.CREATE_TABLE)
+
+    @classmethod
+    def record(cls, cursor, transaction_ids):
+        """Add new sales to the rollup, in the cursor's transaction
+
+        Must run after the sales' transaction lines are written. The caller
+        commits, so the rollup changes exactly when the sales do.
+
+        Args:
+            cursor: Cursor on the connection that inserted the sales
+            transaction_ids (list): IDs of the sales to add
+        """
+        transaction_ids = tuple(transaction_ids)
+        if not transaction_ids:
+            return
+
+        where = f"t.transaction_id IN ({', '.join(['%s'] * len(transaction_ids))})"
+        cursor.execute(cls.INSERT + cls.AGGREGATE.format(where=where) + cls.ACCUMULATE, transaction_ids)
+
+    @classmethod
+    def rebuild(cls, cursor, start_date=None, end_date=None):
+        """Recompute the rollup rows of a range of days from the transactions
+
+        The old rows are deleted and the new ones inserted in the cursor's
+        transaction; the caller commits, so readers see either the old rows
+        or the new ones. Checkouts on those days wait until the commit.
+
+        Args:
+            cursor: Cursor on the connection to rebuild with
+            start_date (date, optional): First day, inclusive; defaults to the first sale
+            end_date (date, optional): Last day, inclusive; defaults to the last sale
+
+        Returns:
+            int: Number of rollup rows written
+        """
+        conditions = []
+        params = ()
+        if start_date:
+            conditions.append("{column} >= %s")
+            params += (start_date,)
+        if end_date:
+            conditions.append("{column} < %s")
+            params += (end_date + timedelta(days=1),)
+
+        rollup_where = " AND ".join(conditions).format(column="sale_date") or "1 = 1"
+        sales_where = " AND ".join(conditions).format(column="t.transaction_date") or "1 = 1"
+
+        cursor.execute(f"DELETE FROM sales_daily_rollup WHERE {rollup_where}", params)
+        cursor.execute(cls.INSERT + cls.AGGREGATE.format(where=sales_where), params)
+        return cursor.rowcount
+
+
+def parse_date(text):
+    """Parse a YYYY-MM-DD command line date"""
+    return date.fromisoformat(text)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m app.utils.sales_rollup",
+        description="Rebuild the daily sales rollup from the transactions"
+    )
+    parser.add_argument("--start", type=parse_date, help="First day to rebuild, YYYY-MM-DD (default: first sale)")
+    parser.add_argument("--end", type=parse_date, help="Last day to rebuild, YYYY-MM-DD (default: last sale)")
+    args = parser.parse_args(argv)
+
+    with DBManager.connection() as conn:
+        cursor = conn.cursor()
+        try:
+            SalesRollup.create_table(cursor)
+            row_count = SalesRollup.rebuild(cursor, args.start, args.end)
+            conn.commit()
+        finally:
+            cursor.close()
+
+    print(f"✓ Rebuilt {row_count} sales rollup rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+from datetime import datetime
+from app.utils.db_manager import DBManager
+import threading
+
+
+class SequenceAllocator:
+    """Issues unique document numbers from blocks reserved in document_sequences
+
+    Each terminal reserves a block of BLOCK_SIZE numbers at a time by bumping a
+    per-sequence counter with one atomic statement, then hands numbers out of
+    that block from memory. Blocks never overlap, so terminals can issue
+    numbers concurrently without colliding, and only every BLOCK_SIZE-th
+    number costs a database round trip. Numbers left in a block when the app
+    exits are skipped; sequences are unique but not gapless.
+    """
+
+    # Numbers reserved per round trip
+    BLOCK_SIZE = 50
+
+    # Sequence name -> (format, first number). Numbers start above the range
+    # the old random suffixes were drawn from, so they never match a legacy ID.
+    SEQUENCES = {
+        "or_number": ("OR-{date}-{number:05d}", 10000),
+        "transaction_id": ("TXN-{date}-{number:06d}", 100000),
+    }
+
+    CREATE_TABLE = """
+        CREATE TABLE IF NOT EXISTS document_sequences (
+            name VARCHAR(50) NOT NULL,
+            next_block BIGINT NOT NULL,
+            PRIMARY KEY (name)
+        )
+    """
+
+    # Sequence name -> [next number, end of block]
+    _blocks = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def next_number(cls, name):
+        """Take the next number of a sequence
+
+        Args:
+            name (str): Key of the sequence in SEQUENCES
+
+        Returns:
+            int: A number no other call, on any terminal, has returned
+
+        Raises:
+            mysql.connector.Error: If a new block has to be reserved and the database fails
+        """
+        with cls._lock:
+            block = cls._blocks.get(name)
+            if block is None or block[0] >= block[1]:
+                block = cls._blocks[name] = list(cls.reserve_block(name))
+
+            number = block[0]
+            block[0] += 1
+            return number
+
+    @classmethod
+    def reserve_block(cls, name):
+        """Reserve the next block of a sequence for this terminal
+
+        The counter is read back through LAST_INSERT_ID(), which is local to
+        the connection, so no lock is held between the update and the read.
+
+        Returns:
+            tuple: (first number, end of block) of the reserved block
+        """
+        with DBManager.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("""
+                    INSERT INTO document_sequences (name, next_block) VALUES (%s, LAST_INSERT_ID(1))
+                    ON DUPLICATE KEY UPDATE next_block = LAST_INSERT_ID(next_block + 1)
+                """, (name,))
+                cursor.execute("SELECT LAST_INSERT_ID()")
+                block_index = cursor.fetchone()[0] - 1
+                conn.commit()
+            finally:
+                cursor.close()
+
+        first_number = cls.SEQUENCES[name][1] + block_index * cls.BLOCK_SIZE
+        return first_number, first_number + cls.BLOCK_SIZE
+
+    @classmethod
+    def format(cls, name, when=None):
+        """Take the next number of a sequence as a dated document number
+
+        Args:
+            name (str): Key of the sequence in SEQUENCES
+            when (datetime, optional): Date printed in the number; defaults to now
+
+        Returns:
+            str: e.g. OR-20250701-10042
+        """
+        template = cls.SEQUENCES[name][0]
+        date = (when or datetime.now()).strftime('%Y%m%d')
+        return template.format(date=date, number=cls.next_number(name))
+
+    @classmethod
+    def or_number(cls):
+        """Issue an official receipt number"""
+        return cls.format("or_number")
+
+    @classmethod
+    def transaction_id(cls):
+        """Issue a transaction ID"""
+        return cls.format("transaction_id")
@@ -0,0 +1,152 @@
+from collections import OrderedDict
+from app.utils.db_manager import DBManager
+from app.utils.query_runner import QueryRunner
+import threading
+
+
+class TransactionDetailCache:
+    """LRU cache of the transaction details shown in receipt popups
+
+    A detail is the transaction row with its service and staff names, plus the
+    products its service uses. Details are loaded in batches, so the rows
+    around the selected one can be prefetched in the background with the
+    same two queries it takes to load one. Writers that change a transaction
+    call invalidate() with its ID.
+    """
+
+    # Details kept; the least recently used are dropped first
+    CAPACITY = 128
+
+    # Transaction ID -> detail dict, least recently used first
+    _entries = OrderedDict()
+    _lock = threading.Lock()
+
+    # Bumped on every invalidation so a load racing a write is not cached
+    _generation = 0
+
+    # Prefetch still in flight, superseded by the next one
+    _prefetch_task = None
+
+    @classmethod
+    def get(cls, transaction_id):
+        """Get a transaction's details, loading them from the database if needed
+
+        Args:
+            transaction_id (str): ID of the transaction
+
+        Returns:
+            dict: Transaction columns plus service_name, staff_name and
+                products; None if the transaction does not exist
+
+        Raises:
+            mysql.connector.Error: If the details have to be loaded and the query fails
+        """
+        with cls._lock:
+            detail = cls._entries.get(transaction_id)
+            if detail is not None:
+                cls._entries.move_to_end(transaction_id)
+                return dict(detail)
+            generation = cls._generation
+
+        with DBManager.connection() as conn:
+            details = cls.load(conn, [transaction_id])
+
+        cls.store(details, generation)
+        detail = details.get(transaction_id)
+        return dict(detail) if detail is not None else None
+
+    @classmethod
+    def prefetch(cls, transaction_ids):
+        """Load the details of transactions likely to be opened next, in the background
+
+        Args:
+            transaction_ids (iterable): IDs to have ready; cached ones are skipped
+        """
+        with cls._lock:
+            missing = [transaction_id for transaction_id in dict.fromkeys(transaction_ids)
+                       if transaction_id not in cls._entries]
+            generation = cls._generation
+
+        if not missing:
+            return
+
+        if cls._prefetch_task:
+            cls._prefetch_task.cancel()
+
+        def work(conn):
+            cls.store(cls.load(conn, missing), generation)
+
+        cls._prefetch_task = QueryRunner.submit(
+            work,
+            on_error=lambda message: print(f"Transaction detail prefetch failed: {message}")
+        )
+
+    @staticmethod
+    def load(conn, transaction_ids):
+        """Load the details of several transactions
+
+        Returns:
+            dict: Transaction ID -> detail dict, for the IDs that exist
+        """
+        transaction_ids = tuple(transaction_ids)
+        if not transaction_ids:
+            return {}
+
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute(f"""
+                SELECT t.*, s.service_name, u.username as staff_name
+                FROM transactions t
+                LEFT JOIN services s ON t.service_id = s.service_id
+                LEFT JOIN users u ON t.created_by = u.user_id
+                WHERE t.transaction_id IN ({', '.join(['%s'] * len(transaction_ids))})
+            """, transaction_ids)
+            transactions = cursor.fetchall()
+
+            # Products of every service involved, in one query
+            products_by_service = {}
+            service_ids = tuple({t["service_id"] for t in transactions if t.get("service_id")})
+            if service_ids:
+                cursor.execute(f"""
+                    SELECT sp.service_id, p.product_name, sp.quantity, p.price
+                    FROM service_products sp
+                    JOIN products p ON sp.product_id = p.product_id
+                    WHERE sp.service_id IN ({', '.join(['%s'] * len(service_ids))})
+                """, service_ids)
+                for product in cursor.fetchall():
+                    service_id = product.pop("service_id")
+                    products_by_service.setdefault(service_id, []).append(product)
+        finally:
+            cursor.close()
+
+        details = {}
+        for transaction in transactions:
+            transaction["products"] = products_by_service.get(transaction.get("service_id"), [])
+            details[transaction["transaction_id"]] = transaction
+        return details
+
+    @classmethod
+    def store(cls, details, generation):
+        """Cache loaded details unless an invalidation happened since the load began"""
+        with cls._lock:
+            if generation != cls._generation:
+                return
+            for transaction_id, detail in details.items():
+                cls._entries[transaction_id] = detail
+                cls._entries.move_to_end(transaction_id)
+            while len(cls._entries) > cls.CAPACITY:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, *transaction_ids):
+        """Drop cached details of some transactions, or of all of them if none are given
+
+        Args:
+            *transaction_ids (str): IDs of the transactions that were written
+        """
+        with cls._lock:
+            cls._generation += 1
+            if not transaction_ids:
+                cls._entries.clear()
+            for transaction_id in transaction_ids:
+                cls._entries.pop(transaction_id, None)
@@ -0,0 +1,86 @@
+from app.utils.date_ranges import DateRange
+
+
+class TransactionFilter:
+    """Compiles the transaction filter dialogs' filter_state dicts into SQL
+
+    Each option becomes a parameterized condition on a raw column, so MySQL
+    can answer it from the transaction indexes and only matching rows are
+    fetched. Keys a dialog does not have, and "All ..." options, add nothing.
+    """
+
+    # Amount range option -> (condition on the amount, params). Bounds match
+    # the ranges the sales report used to apply to displayed amounts.
+    AMOUNT_RANGES = {
+        "Under ₱500": ("t.total_amount < %s", (500,)),
+        "₱500 - ₱1,000": ("t.total_amount BETWEEN %s AND %s", (500, 1000)),
+        "₱1,000 - ₱2,500": ("t.total_amount BETWEEN %s AND %s", (1000, 2500)),
+        "₱2,500 - ₱5,000": ("t.total_amount BETWEEN %s AND %s", (2500, 5000)),
+        "Over ₱5,000": ("t.total_amount > %s", (5000,)),
+    }
+
+    # filter_state key -> (option meaning no filter, column compared for equality)
+    EQUALITY_FILTERS = {
+        "payment_method": ("All Methods", "t.payment_method"),
+        "gender": ("All", "t.customer_gender"),
+    }
+
+    # Matches transactions with a line for the named service, not just those
+    # whose primary service it is
+    SERVICE_CONDITION = """EXISTS (
+        SELECT 1 FROM transaction_lines fl
+        JOIN services fs ON fl.service_id = fs.service_id
+        WHERE fl.transaction_id = t.transaction_id AND fs.service_name = %s
+    )"""
+
+    @classmethod
+    def compile(cls, filter_state):
+        """Build the WHERE condition for a filter state
+
+        Args:
+            filter_state (dict): State from a transaction filter dialog, with
+                "is_active" and any of date_range, payment_method, gender,
+                amount_range and service. The transactions table alias is t.
+
+        Returns:
+            tuple: (condition, params); ("", ()) when nothing is filtered
+        """
+        if not filter_state or not filter_state.get("is_active"):
+            return "", ()
+
+        conditions = []
+        params = []
+
+        date_condition, date_params = DateRange.sql("t.transaction_date", filter_state.get("date_range", DateRange.ALL_TIME))
+        if date_condition:
+            conditions.append(date_condition)
+            params.extend(date_params)
+
+        for key, (all_option, column) in cls.EQUALITY_FILTERS.items():
+            value = filter_state.get(key, all_option)
+            if value != all_option:
+                conditions.append(f"{column} = %s")
+                params.append(value)
+
+        service = filter_state.get("service", "All Services")
+        if service != "All Services":
+            conditions.append(cls.SERVICE_CONDITION)
+            params.append(service)
+
+        amount_range = cls.AMOUNT_RANGES.get(filter_state.get("amount_range"))
+        if amount_range:
+            conditions.append(amount_range[0])
+            params.extend(amount_range[1])
+
+        return " AND ".join(conditions), tuple(params)
+
+    @staticmethod
+    def combine(*parts):
+        """AND together (condition, params) pairs, skipping empty conditions
+
+        Returns:
+            tuple: (condition, params)
+        """
+        conditions = [condition for condition, _ in parts if condition]
+        params = tuple(param for condition, part_params in parts if condition for param in part_params)
+        return " AND ".join(conditions), params
@@ -0,0 +1,109 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+
+class TransactionLines:
+    """Maintains transaction_lines, one row per service sold in a transaction
+
+    The transactions table only has room for one service, so an invoice with
+    several services used to be counted under its first one. Lines record
+    every service with its share of the amount paid, so service-level reports
+    can group lines instead of transactions. A transaction's line totals
+    always add up to its total amount.
+    """
+
+    CREATE_TABLE = """
+        CREATE TABLE IF NOT EXISTS transaction_lines (
+            transaction_id VARCHAR(50) NOT NULL,
+            line_no INT NOT NULL,
+            service_id INT NOT NULL,
+            unit_price DECIMAL(10,2) NOT NULL,
+            line_total DECIMAL(10,2) NOT NULL,
+            PRIMARY KEY (transaction_id, line_no),
+            KEY idx_transaction_lines_service (service_id, transaction_id, line_total)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci
+    """
+
+    # Transactions from before lines existed sold a single service, recorded
+    # on the transaction itself. IGNORE skips any already backfilled.
+    BACKFILL = """
+        INSERT IGNORE INTO transaction_lines (transaction_id, line_no, service_id, unit_price, line_total)
+        SELECT transaction_id, 1, service_id, base_amount, total_amount
+        FROM transactions
+        WHERE service_id IS NOT NULL
+    """
+
+    CENT = Decimal("0.01")
+
+    @classmethod
+    def create_table(cls, cursor):
+        """Create the transaction_lines table"""
+        cursor.execute(cls.CREATE_TABLE)
+
+    @classmethod
+    def allocate(cls, total_amount, prices):
+        """Split what was paid across services in proportion to their prices
+
+        Each share is rounded to the centavo and the last line takes the
+        rounding remainder, so the shares add up to the total exactly.
+
+        Args:
+            total_amount: Amount paid for the whole transaction
+            prices (list): List price of each service, in line order
+
+        Returns:
+            list: Decimal line totals
+        """
+        total_amount = Decimal(str(total_amount)).quantize(cls.CENT, ROUND_HALF_UP)
+        prices = [Decimal(str(price or 0)) for price in prices]
+        if not prices:
+            return []
+
+        list_total = sum(prices)
+        shares = []
+        for price in prices[:-1]:
+            share = total_amount * price / list_total if list_total else total_amount / len(prices)
+            shares.append(share.quantize(cls.CENT, ROUND_HALF_UP))
+        shares.append(total_amount - sum(shares))
+        return shares
+
+    @classmethod
+    def record(cls, cursor, transaction_id, services, total_amount):
+        """Write the lines of a new transaction, in the cursor's transaction
+
+        All lines go in with one multi-row insert. The caller commits.
+
+        Args:
+            cursor: Cursor on the connection that inserted the transaction
+            transaction_id (str): ID of the transaction
+            services (list): Selected service dicts with service_id and price
+            total_amount: Amount paid, after discounts
+
+        Returns:
+            int: Number of lines written
+        """
+        services = [service for service in services if service.get("service_id")]
+        if not services:
+            return 0
+
+        line_totals = cls.allocate(total_amount, [service.get("price") for service in services])
+        rows = [
+            (transaction_id, line_no, service["service_id"], Decimal(str(service.get("price") or 0)), line_total)
+            for line_no, (service, line_total) in enumerate(zip(services, line_totals), start=1)
+        ]
+
+        cursor.execute(
+            "INSERT INTO transaction_lines (transaction_id, line_no, service_id, unit_price, line_total) VALUES "
+            + ", ".join(["(%s, %s, %s, %s, %s)"] * len(rows)),
+            tuple(value for row in rows for value in row)
+        )
+        return len(rows)
+
+    @classmethod
+    def backfill(cls, cursor):
+        """Give every transaction without lines a line for its recorded service
+
+        Returns:
+            int: Number of lines added
+        """
+        cursor.execute(cls.BACKFILL)
+        return cursor.rowcount
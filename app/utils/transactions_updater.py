@@ -1,4 +1,5 @@
 from app.utils.db_manager import DBManager
+from app.utils.transaction_detail_cache import TransactionDetailCache
 import mysql.connector
 
 class TransactionsUpdater:
@@ -19,6 +20,9 @@ class TransactionsUpdater:
             conn.commit()
             cursor.close()
             
+            # Receipt popups must show the new notes
+            TransactionDetailCache.invalidate(transaction_id)
+            
             return True, "Transaction notes updated successfully"
             
         except mysql.connector.Error as err:
@@ -28,36 +32,8 @@ class TransactionsUpdater:
     def get_transaction_with_products(transaction_id):
         """Get transaction details along with associated products"""
         try:
-            conn = DBManager.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            
-            # Get transaction details
-            cursor.execute("""
-                SELECT t.*, s.service_name, u.username as staff_name
-                FROM transactions t
-                LEFT JOIN services s ON t.service_id = s.service_id
-                LEFT JOIN users u ON t.created_by = u.user_id
-                WHERE t.transaction_id = %s
-            """, (transaction_id,))
-            
-            transaction = cursor.fetchone()
-            
-            if transaction and transaction.get('service_id'):
-                # Get products used in the service
-                cursor.execute("""
-                    SELECT p.product_name, sp.quantity, p.price
-                    FROM service_products sp
-                    JOIN products p ON sp.product_id = p.product_id
-                    WHERE sp.service_id = %s
-                """, (transaction['service_id'],))
-                
-                products = cursor.fetchall()
-                transaction['products'] = products
-            else:
-                transaction['products'] = []
-            
-            cursor.close()
-            return transaction
+            # Served from the detail cache when the row was opened or prefetched recently
+            return TransactionDetailCache.get(transaction_id)
             
         except mysql.connector.Error as err:
             print(f"Error fetching transaction with products: {err}")
@@ -0,0 +1,15 @@
+"""End-to-end load benchmarks for the salon POS
+
+The suite runs against a separate MySQL database, never the one the app is
+configured to use. It uses the host and credentials from config/database.json,
+or the DBManager defaults.
+
+    # Create the schema in salon_bench and fill it with synthetic data
+    python -m benchmarks generate --database salon_bench
+
+    # Time the key data paths headlessly and write the results as JSON
+    python -m benchmarks run --database salon_bench --output bench.json
+
+Use --scale to generate a fraction of the default volumes for a quick run,
+e.g. --scale 0.01 for 10k transactions.
+"""
@@ -0,0 +1,135 @@
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime
+
+# Qt must not look for a display; set before anything imports PyQt5 widgets
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtCore, QtWidgets
+from app.utils.db_manager import DBManager
+import mysql.connector
+
+
+# Tables whose sizes are recorded alongside the results
+COUNTED_TABLES = [
+    "transactions", "inventory_transactions", "products", "services",
+    "service_products", "suppliers", "inventory_status", "users", "customers",
+    "transaction_lines", "sales_daily_rollup",
+]
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Salon POS load benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="Recreate the benchmark database with synthetic data")
+    generate.add_argument("--database", required=True, help="Benchmark database; all of its tables are dropped")
+    generate.add_argument("--scale", type=float, default=1.0, help="Fraction of the default volumes (1M transactions)")
+    generate.add_argument("--seed", type=int, default=42, help="Random seed")
+
+    run = commands.add_parser("run", help="Time the key data paths and write JSON results")
+    run.add_argument("--database", required=True, help="Benchmark database created by generate")
+    run.add_argument("--repeat", type=int, default=5, help="Timed runs per scenario, after one warm-up")
+    run.add_argument("--only", default="", help="Comma-separated scenarios to run (default: all)")
+    run.add_argument("--output", default="benchmark_results.json", help="File to write the JSON results to")
+
+    return parser.parse_args(argv)
+
+
+def use_database(database):
+    """Point DBManager at the benchmark database, refusing the app's own"""
+    os.environ.pop(DBManager.DATABASE_ENV, None)
+    configured = DBManager.get_config().get("database")
+    if database == configured:
+        sys.exit(f"Refusing to benchmark against the configured app database '{configured}'")
+    os.environ[DBManager.DATABASE_ENV] = database
+
+
+def table_counts():
+    """Count rows in the benchmarked tables"""
+    counts = {}
+    with DBManager.connection() as conn:
+        cursor = conn.cursor()
+        try:
+            for table in COUNTED_TABLES:
+                cursor.execute(f"SELECT COUNT(*) FROM `{table}`")
+                counts[table] = cursor.fetchone()[0]
+            cursor.execute("SELECT VERSION()")
+            server_version = cursor.fetchone()[0]
+        finally:
+            cursor.close()
+    return counts, server_version
+
+
+def generate(args):
+    from benchmarks.data_generator import DataGenerator
+
+    counts = DataGenerator(args.database, scale=args.scale, seed=args.seed).run()
+    print(f"✓ Generated {sum(counts.values()):,} rows in {args.database}")
+
+
+def run(args):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    app.setQuitOnLastWindowClosed(False)
+
+    # Widget modules are imported only once a QApplication exists
+    from app.utils.migrations import MigrationRunner
+    from benchmarks.harness import Benchmark, BenchmarkHost, DialogRecorder
+    from benchmarks.scenarios import SCENARIOS
+
+    only = [name.strip() for name in args.only.split(",") if name.strip()]
+    unknown = [name for name in only if name not in SCENARIOS]
+    if unknown:
+        sys.exit(f"Unknown scenario(s): {', '.join(unknown)}. Choose from: {', '.join(SCENARIOS)}")
+
+    MigrationRunner.run()
+    counts, server_version = table_counts()
+
+    started_at = datetime.now()
+    with DialogRecorder() as dialogs:
+        bench = Benchmark(repeat=args.repeat, dialogs=dialogs)
+        host = BenchmarkHost()
+        for name, scenario in SCENARIOS.items():
+            if not only or name in only:
+                scenario(bench, host)
+
+    results = {
+        "started_at": started_at.isoformat(timespec="seconds"),
+        "duration_s": (datetime.now() - started_at).total_seconds(),
+        "database": args.database,
+        "repeat": args.repeat,
+        "environment": {
+            "python": platform.python_version(),
+            "qt": QtCore.QT_VERSION_STR,
+            "mysql": server_version,
+            "platform": platform.platform(),
+        },
+        "table_rows": counts,
+        "scenarios": bench.results,
+    }
+
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(results, output_file, indent=2, default=str)
+    print(f"✓ Results written to {args.output}")
+
+    return 1 if any(result["errors"] for result in bench.results) else 0
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    use_database(args.database)
+
+    try:
+        if args.command == "generate":
+            return generate(args)
+        return run(args)
+    except mysql.connector.Error as err:
+        print(f"Database error: {err}")
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,341 @@
+from app.utils.db_manager import DBManager
+from app.utils.migrations import MigrationRunner
+from datetime import date, datetime, timedelta
+from pathlib import Path
+import hashlib
+import random
+import re
+import time
+import mysql.connector
+
+
+class DataGenerator:
+    """Fills a benchmark database with synthetic salon data
+
+    The schema is taken from the CREATE TABLE statements in the bundled dump,
+    so it matches what a real install starts from, and the app's migrations
+    are applied after the data is loaded. Output is deterministic for a given
+    seed and scale.
+    """
+
+    # Schema source, relative to the repository root
+    DUMP_FILE = "Dump20250703.sql"
+
+    # Row counts at scale 1.0
+    VOLUMES = {
+        "users": 20,
+        "services": 500,
+        "products": 5000,
+        "suppliers": 2000,
+        "inventory_transactions": 50000,
+        "transactions": 1000000,
+    }
+
+    # Products linked to each service, as (minimum, maximum)
+    PRODUCTS_PER_SERVICE = (1, 4)
+
+    # Days of history the transactions are spread over
+    HISTORY_DAYS = 3 * 365
+
+    # Rows sent per INSERT statement
+    BATCH_SIZE = 5000
+
+    FIRST_NAMES = [
+        "Maria", "Ana", "Jose", "Juan", "Angela", "Mark", "Kristine", "Paolo", "Camille", "John",
+        "Patricia", "Miguel", "Andrea", "Carlo", "Nicole", "Rafael", "Bea", "Luis", "Joanna", "Enzo",
+    ]
+    LAST_NAMES = [
+        "Santos", "Reyes", "Cruz", "Bautista", "Ocampo", "Garcia", "Mendoza", "Torres", "Flores", "Ramos",
+        "Villanueva", "Castillo", "Aquino", "Navarro", "Dela Cruz", "Gonzales", "Lopez", "Rivera", "Tan", "Lim",
+    ]
+    CITIES = [
+        "Manila", "Quezon City", "Makati", "Pasig", "Taguig", "Cebu City", "Davao City", "Caloocan",
+        "Antipolo", "Baguio", "Iloilo City", "Bacolod",
+    ]
+    GENDERS = ["Female", "Male", "Other"]
+    GENDER_WEIGHTS = [70, 28, 2]
+    PAYMENT_METHODS = ["Cash", "GCash", "Card"]
+    PAYMENT_WEIGHTS = [85, 10, 5]
+
+    PRODUCT_CATEGORIES = ["Skincare", "Soap", "Lotion", "Serum", "Nail Care", "Lashes", "Waxing", "IV Solution"]
+    SERVICE_CATEGORIES = ["Facial", "Nails", "Lashes", "Waxing", "Body", "IV Therapy", "Hair", "Makeup"]
+    SUPPLIER_NAMES = [
+        "Luzon Dermacare", "Visayas Beauty Supply", "Mindanao Lash Co.", "Metro Manila Skincare",
+        "Pinoy Wax Solutions", "Cebu Makeup Supplies", "Davao Wellness Corp.",
+    ]
+
+    def __init__(self, database, scale=1.0, seed=42):
+        """Initialize the generator
+
+        Args:
+            database (str): Database to (re)create; every table in it is dropped
+            scale (float): Fraction of the default VOLUMES to generate
+            seed (int): Random seed, so runs are repeatable
+        """
+        self.database = database
+        self.scale = scale
+        self.random = random.Random(seed)
+        self.volumes = {
+            table: max(1, int(count * scale)) for table, count in self.VOLUMES.items()
+        }
+        # Small tables keep their full size so lookups stay realistic
+        self.volumes["users"] = self.VOLUMES["users"]
+
+        # Values reused by later tables, filled in as tables are generated
+        self.product_names = []
+        self.service_prices = []
+        self.now = datetime.now().replace(microsecond=0)
+
+    def run(self):
+        """Create the schema, load every table and apply migrations
+
+        Returns:
+            dict: Table name -> rows inserted
+
+        Raises:
+            mysql.connector.Error: If the database cannot be created or loaded
+        """
+        config = DBManager.get_connection_config()
+        config.pop("database", None)
+
+        counts = {}
+        conn = mysql.connector.connect(**config)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{self.database}`")
+            cursor.execute(f"USE `{self.database}`")
+
+            # Bulk load without per-row constraint checks; the data is consistent by construction
+            cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+            cursor.execute("SET UNIQUE_CHECKS = 0")
+
+            self.create_schema(cursor)
+
+            for table, rows in self.tables():
+                start = time.perf_counter()
+                counts[table] = self.insert(conn, cursor, table, rows)
+                print(f"✓ {table}: {counts[table]:,} rows in {time.perf_counter() - start:.1f}s")
+
+            cursor.execute("SET UNIQUE_CHECKS = 1")
+            cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+            cursor.close()
+        finally:
+            conn.close()
+
+        # Indexes are cheaper to build once over the loaded data
+        MigrationRunner.run()
+        return counts
+
+    def create_schema(self, cursor):
+        """Drop and recreate every table defined in the dump"""
+        dump = (Path(__file__).parent.parent / self.DUMP_FILE).read_text(encoding="utf-8")
+
+        # Migrations are re-applied from scratch on the fresh tables
+        cursor.execute("DROP TABLE IF EXISTS schema_migrations")
+        # Lines are backfilled only for transactions without any, so stale ones must go too
+        cursor.execute("DROP TABLE IF EXISTS transaction_lines")
+        for match in re.finditer(r"CREATE TABLE `(\w+)` \(.*?\) ENGINE=[^;]*", dump, re.S):
+            cursor.execute(f"DROP TABLE IF EXISTS `{match.group(1)}`")
+            cursor.execute(re.sub(r" AUTO_INCREMENT=\d+", "", match.group(0)))
+
+    def insert(self, conn, cursor, table, rows):
+        """Insert generated rows in batches
+
+        Args:
+            conn: Open connection to the benchmark database
+            cursor: Cursor on that connection
+            table (str): Table to load
+            rows (iterable): Dictionaries with the same keys, one per row
+
+        Returns:
+            int: Number of rows inserted
+        """
+        count = 0
+        sql = None
+        batch = []
+
+        for row in rows:
+            if sql is None:
+                columns = ", ".join(f"`{column}`" for column in row)
+                placeholders = ", ".join(["%s"] * len(row))
+                sql = f"INSERT INTO `{table}` ({columns}) VALUES ({placeholders})"
+            batch.append(tuple(row.values()))
+
+            if len(batch) >= self.BATCH_SIZE:
+                cursor.executemany(sql, batch)
+                conn.commit()
+                count += len(batch)
+                batch = []
+
+        if batch:
+            cursor.executemany(sql, batch)
+            conn.commit()
+            count += len(batch)
+        return count
+
+    def tables(self):
+        """Get (table, rows) pairs in load order; rows are generated lazily"""
+        return [
+            ("users", self.users()),
+            ("services", self.services()),
+            ("products", self.products()),
+            ("service_products", self.service_products()),
+            ("inventory_status", self.inventory_status()),
+            ("inventory_batches", self.inventory_batches()),
+            ("suppliers", self.suppliers()),
+            ("inventory_transactions", self.inventory_transactions()),
+            ("transactions", self.transactions()),
+        ]
+
+    def past_datetime(self, days):
+        """Get a random timestamp within the given number of days before now"""
+        return self.now - timedelta(seconds=self.random.randrange(days * 86400))
+
+    def customer_name(self):
+        """Get a random customer name"""
+        return f"{self.random.choice(self.FIRST_NAMES)} {self.random.choice(self.LAST_NAMES)}"
+
+    def users(self):
+        """Admin first, then staff accounts"""
+        password = hashlib.sha256(b"benchmark").hexdigest()
+        for user_id in range(1, self.volumes["users"] + 1):
+            yield {
+                "user_id": user_id,
+                "username": f"staff{user_id:02d}" if user_id > 1 else "admin",
+                "password": password,
+                "full_name": self.customer_name(),
+                "role": "admin" if user_id == 1 else "staff",
+                "created_at": self.past_datetime(self.HISTORY_DAYS),
+            }
+
+    def services(self):
+        """Services with random prices, remembered for the transactions"""
+        for service_id in range(1, self.volumes["services"] + 1):
+            category = self.random.choice(self.SERVICE_CATEGORIES)
+            price = round(self.random.uniform(150, 5000), 2)
+            self.service_prices.append(price)
+            yield {
+                "service_id": service_id,
+                "service_name": f"{category} Service {service_id}",
+                "category": category,
+                "price": price,
+                "availability": 1 if self.random.random() < 0.95 else 0,
+                "description": f"Synthetic {category.lower()} service",
+            }
+
+    def products(self):
+        """Products with a spread of stock levels, some out of stock"""
+        for product_id in range(1, self.volumes["products"] + 1):
+            category = self.random.choice(self.PRODUCT_CATEGORIES)
+            name = f"{category} Product {product_id}"
+            quantity = self.random.choice([0, 5, 20, 50, 100, 200]) + self.random.randrange(20)
+            self.product_names.append(name)
+            yield {
+                "product_id": product_id,
+                "product_name": name,
+                "description": f"Synthetic {category.lower()} product",
+                "category": category,
+                "price": round(self.random.uniform(50, 3000), 2),
+                "quantity": quantity,
+                "threshold_value": 10,
+                "expiry_date": date.today() + timedelta(days=self.random.randrange(-60, 720)),
+                "availability": 1 if quantity > 0 else 0,
+            }
+
+    def service_products(self):
+        """Links each service to a few random products"""
+        low, high = self.PRODUCTS_PER_SERVICE
+        product_count = self.volumes["products"]
+        for service_id in range(1, self.volumes["services"] + 1):
+            count = min(product_count, self.random.randint(low, high))
+            for product_id in self.random.sample(range(1, product_count + 1), count):
+                yield {
+                    "service_id": service_id,
+                    "product_id": product_id,
+                    "quantity": self.random.randint(1, 3),
+                }
+
+    def inventory_status(self):
+        """One status row per product"""
+        for product_id, name in enumerate(self.product_names, start=1):
+            quantity = self.random.randrange(0, 220)
+            status = "Out of Stock" if quantity == 0 else "Low Stock" if quantity <= 10 else "In Stock"
+            yield {
+                "product_id": product_id,
+                "product_name": name,
+                "quantity": quantity,
+                "status": status,
+                "supplier_name": self.random.choice(self.SUPPLIER_NAMES + [None]),
+            }
+
+    def inventory_batches(self):
+        """One active batch per product"""
+        for product_id, name in enumerate(self.product_names, start=1):
+            quantity = self.random.randrange(1, 100)
+            yield {
+                "product_id": product_id,
+                "product_name": name,
+                "expiry_date": date.today() + timedelta(days=self.random.randrange(-30, 720)),
+                "quantity": quantity,
+                "original_quantity": quantity + self.random.randrange(50),
+                "supplier_name": self.random.choice(self.SUPPLIER_NAMES),
+                "received_date": self.past_datetime(365),
+                "status": "active",
+            }
+
+    def suppliers(self):
+        """Supplier orders, mostly received"""
+        for _ in range(self.volumes["suppliers"]):
+            product_id = self.random.randrange(len(self.product_names))
+            status = self.random.choices(["pending", "received", "cancelled"], [30, 65, 5])[0]
+            supplier = self.random.choice(self.SUPPLIER_NAMES)
+            yield {
+                "supplier_name": supplier,
+                "product_name": self.product_names[product_id],
+                "category": self.random.choice(self.PRODUCT_CATEGORIES),
+                "contact_number": f"09{self.random.randrange(10 ** 9):09d}",
+                "email": f"orders@{supplier.split()[0].lower()}.ph",
+                "accepts_returns": self.random.randint(0, 1),
+                "products_on_the_way": self.random.randrange(10, 500),
+                "status": status,
+                "expiry_date": date.today() + timedelta(days=self.random.randrange(30, 720)),
+            }
+
+    def inventory_transactions(self):
+        """Stock movements spread over the history window"""
+        for _ in range(self.volumes["inventory_transactions"]):
+            transaction_type = self.random.choices(["Stock In", "Stock Out", "Adjustment"], [45, 50, 5])[0]
+            yield {
+                "product_name": self.random.choice(self.product_names),
+                "transaction_type": transaction_type,
+                "quantity": self.random.randint(1, 100),
+                "notes": f"Received from supplier: {self.random.choice(self.SUPPLIER_NAMES)}"
+                    if transaction_type == "Stock In" else "Used in Service",
+                "transaction_date": self.past_datetime(self.HISTORY_DAYS),
+            }
+
+    def transactions(self):
+        """Sales spread over the history window"""
+        user_count = self.volumes["users"]
+        for number in range(1, self.volumes["transactions"] + 1):
+            service_id = self.random.randint(1, len(self.service_prices))
+            base_amount = self.service_prices[service_id - 1]
+            discount_percentage = self.random.choices([0, 5, 10, 20], [80, 8, 8, 4])[0]
+            discount_amount = round(base_amount * discount_percentage / 100, 2)
+            yield {
+                "transaction_id": f"TXN-{number:08d}",
+                "or_number": f"OR-{number:08d}",
+                "service_id": service_id,
+                "customer_name": self.customer_name(),
+                "customer_phone": f"09{self.random.randrange(10 ** 9):09d}",
+                "customer_gender": self.random.choices(self.GENDERS, self.GENDER_WEIGHTS)[0],
+                "customer_city": self.random.choice(self.CITIES),
+                "payment_method": self.random.choices(self.PAYMENT_METHODS, self.PAYMENT_WEIGHTS)[0],
+                "discount_percentage": discount_percentage,
+                "discount_amount": discount_amount,
+                "base_amount": base_amount,
+                "total_amount": round(base_amount - discount_amount, 2),
+                "notes": None,
+                "transaction_date": self.past_datetime(self.HISTORY_DAYS),
+                "created_by": self.random.randint(1, user_count),
+            }
@@ -0,0 +1,166 @@
+from PyQt5 import QtCore, QtWidgets
+from app.utils.query_stats import QueryStats
+import statistics
+import time
+
+
+class DialogRecorder:
+    """Answers modal dialogs automatically while a benchmark runs
+
+    Message boxes would block a headless run, so the static QMessageBox and
+    QFileDialog helpers are replaced for the duration of a with block.
+    Warnings and critical messages are kept so a scenario that failed is
+    reported as an error instead of a fast run.
+    """
+
+    def __init__(self):
+        self.errors = []
+        self.open_file = ""
+        self._originals = {}
+
+    def __enter__(self):
+        replacements = {
+            (QtWidgets.QMessageBox, "information"): self._ignore,
+            (QtWidgets.QMessageBox, "warning"): self._record,
+            (QtWidgets.QMessageBox, "critical"): self._record,
+            (QtWidgets.QMessageBox, "question"): lambda *args, **kwargs: QtWidgets.QMessageBox.Yes,
+            (QtWidgets.QFileDialog, "getOpenFileName"): lambda *args, **kwargs: (self.open_file, ""),
+        }
+        for (owner, name), replacement in replacements.items():
+            self._originals[(owner, name)] = getattr(owner, name)
+            setattr(owner, name, staticmethod(replacement))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for (owner, name), original in self._originals.items():
+            setattr(owner, name, original)
+        self._originals.clear()
+
+    def _ignore(self, *args, **kwargs):
+        return QtWidgets.QMessageBox.Ok
+
+    def _record(self, parent, title, text, *args, **kwargs):
+        self.errors.append(f"{title}: {text}")
+        return QtWidgets.QMessageBox.Ok
+
+    def take_errors(self):
+        """Get and clear the messages recorded so far"""
+        errors, self.errors = self.errors, []
+        return errors
+
+
+class BenchmarkHost(QtWidgets.QWidget):
+    """Stand-in for the page that owns a tab, logged in as an admin"""
+
+    def __init__(self, user_info=None):
+        super(BenchmarkHost, self).__init__()
+        self.user_info = user_info or {"user_id": 1, "username": "admin", "role": "admin"}
+        self.invoice_data = {}
+
+    def show_error_message(self, message):
+        """Show error message dialog"""
+        QtWidgets.QMessageBox.critical(self, "Error", message)
+
+    def show_info_message(self, message):
+        """Show info message dialog"""
+        QtWidgets.QMessageBox.information(self, "Information", message)
+
+
+class Benchmark:
+    """Times scenarios and collects their results"""
+
+    # Seconds to wait for a background load before a run counts as failed
+    TIMEOUT = 600
+
+    def __init__(self, repeat=5, dialogs=None):
+        """Initialize the benchmark
+
+        Args:
+            repeat (int): Timed runs per scenario, after one warm-up run
+            dialogs (DialogRecorder, optional): Recorder whose errors fail a run
+        """
+        self.repeat = repeat
+        self.dialogs = dialogs or DialogRecorder()
+        self.results = []
+
+    @staticmethod
+    def wait_until(predicate, timeout):
+        """Process UI events until a condition holds
+
+        Args:
+            predicate (callable): Returns True once the work is finished
+            timeout (float): Seconds to wait
+
+        Returns:
+            bool: True if the condition held before the timeout
+        """
+        deadline = time.perf_counter() + timeout
+        app = QtWidgets.QApplication.instance()
+        while not predicate():
+            if time.perf_counter() > deadline:
+                return False
+            app.processEvents(QtCore.QEventLoop.AllEvents, 20)
+            time.sleep(0.001)
+        return True
+
+    def measure(self, name, action, done=None, repeat=None, warmup=True):
+        """Time a scenario
+
+        Args:
+            name (str): Scenario name used in the results
+            action (callable): Starts the work; receives the run number
+            done (callable, optional): Returns True once background work
+                started by action has landed in the UI. Synchronous
+                scenarios leave it out.
+            repeat (int, optional): Override for the number of timed runs
+            warmup (bool): Run once untimed first, to fill caches and pools
+
+        Returns:
+            dict: Timings in milliseconds and query counts for the scenario
+        """
+        repeat = self.repeat if repeat is None else repeat
+        runs = []
+        errors = []
+
+        for run in range(repeat + (1 if warmup else 0)):
+            QueryStats.reset()
+            self.dialogs.take_errors()
+
+            start = time.perf_counter()
+            action(run)
+            finished = done is None or self.wait_until(done, self.TIMEOUT)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            run_errors = self.dialogs.take_errors()
+            if not finished:
+                run_errors.append(f"Timed out after {self.TIMEOUT} seconds")
+            if run_errors:
+                errors.extend(run_errors)
+                break
+
+            if warmup and run == 0:
+                continue
+
+            statements = QueryStats.statements()
+            runs.append({
+                "ms": elapsed_ms,
+                "queries": sum(item["count"] for item in statements),
+                "rows": sum(item["rows"] for item in statements),
+                "db_ms": sum(item["total_ms"] for item in statements),
+            })
+
+        result = {"name": name, "runs": runs, "errors": errors}
+        if runs:
+            times = [item["ms"] for item in runs]
+            result.update({
+                "median_ms": statistics.median(times),
+                "min_ms": min(times),
+                "max_ms": max(times),
+                "queries": runs[-1]["queries"],
+                "rows": runs[-1]["rows"],
+            })
+
+        status = f"{result['median_ms']:.0f} ms median" if runs else f"FAILED: {errors[0]}"
+        print(f"{'✓' if runs else '✗'} {name}: {status}")
+        self.results.append(result)
+        return result
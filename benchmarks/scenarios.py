@@ -0,0 +1,149 @@
+from app.ui.pages.customer.tabs.customers_tab import CustomersTab
+from app.ui.pages.dashboard.dashboard_page import DashboardPage
+from app.ui.pages.inventory.tabs.products_tab import ProductsTab
+from app.ui.pages.invoice.tabs.receipt_tab import ReceiptTab
+from app.ui.pages.maintenance.tabs.database_backup_tab import DatabaseBackupTab
+from app.ui.pages.reports.tabs.alert_level_tab import AlertLevelTab
+from app.ui.pages.reports.tabs.delivered_products_tab import DeliveredProductsTab
+from app.ui.pages.reports.tabs.missing_products_tab import MissingProductsTab
+from app.ui.pages.reports.tabs.sales_report_tab import SalesReportTab
+from app.ui.pages.reports.tabs.transaction_logs_tab import TransactionLogsTab
+from app.ui.pages.reports.tabs.undelivered_products_tab import UndeliveredProductsTab
+from app.utils.dashboard_updater import DashboardUpdater
+from app.utils.db_manager import DBManager
+from pathlib import Path
+import tempfile
+import time
+
+
+# Report tabs, keyed by the scenario that times their refresh
+REPORT_TABS = {
+    "report_sales": SalesReportTab,
+    "report_transaction_logs": TransactionLogsTab,
+    "report_alert_level": AlertLevelTab,
+    "report_missing_products": MissingProductsTab,
+    "report_delivered_products": DeliveredProductsTab,
+    "report_undelivered_products": UndeliveredProductsTab,
+}
+
+
+def load_finished(widget):
+    """Check whether a tab has no background load in flight"""
+    return getattr(widget, "load_task", None) is None
+
+
+def settle(bench, widget):
+    """Wait for the load a tab starts on construction, outside the timed runs"""
+    bench.wait_until(lambda: load_finished(widget), bench.TIMEOUT)
+    bench.dialogs.take_errors()
+
+
+def customers_load(bench, host):
+    """Customers tab: load every transaction into the table"""
+    tab = CustomersTab(host)
+    settle(bench, tab)
+    bench.measure("customers_load", lambda run: tab.load_transactions(), lambda: load_finished(tab))
+
+
+def products_load(bench, host):
+    """Products tab: load every product into the table"""
+    tab = ProductsTab(host)
+    settle(bench, tab)
+    bench.measure("products_load", lambda run: tab.load_products(), lambda: load_finished(tab))
+
+
+def reports(bench, host):
+    """Each report tab: refresh its data"""
+    for name, tab_class in REPORT_TABS.items():
+        tab = tab_class(host)
+        settle(bench, tab)
+        bench.measure(name, lambda run, tab=tab: tab.refresh_data(), lambda tab=tab: load_finished(tab))
+
+
+def dashboard_refresh(bench, host):
+    """Dashboard: reload the metric cards and both charts, then poll with nothing changed"""
+    page = DashboardPage(None, host.user_info)
+    bench.wait_until(lambda: page.refresh_task is None, bench.TIMEOUT)
+    bench.measure(
+        "dashboard_refresh",
+        lambda run: DashboardUpdater.refresh_metrics_and_charts(page, force=True),
+        lambda: page.refresh_task is None
+    )
+    bench.measure(
+        "dashboard_poll",
+        lambda run: DashboardUpdater.refresh_metrics_and_charts(page),
+        lambda: page.refresh_task is None
+    )
+
+
+def checkout_sample(conn):
+    """Pick a service that uses products, so checkout also deducts stock
+
+    Returns:
+        tuple: (service_id, price)
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT s.service_id, s.price
+            FROM services s
+            JOIN service_products sp ON sp.service_id = s.service_id
+            ORDER BY s.service_id
+            LIMIT 1
+        """)
+        return cursor.fetchone()
+    finally:
+        cursor.close()
+
+
+def checkout_save(bench, host):
+    """Receipt tab: save a completed sale and deduct the products it used"""
+    with DBManager.connection() as conn:
+        service_id, price = checkout_sample(conn)
+
+    tab = ReceiptTab(host)
+    prefix = time.strftime("BENCH-%Y%m%d%H%M%S")
+
+    def save(run):
+        host.invoice_data = {
+            "transaction_id": f"{prefix}-{run}",
+            "or_number": f"{prefix}-OR-{run}",
+            "services": [{"service_id": service_id, "price": price}],
+            "customer": {"name": "Benchmark Customer", "phone": "09000000000", "gender": "Female", "city": "Manila"},
+            "payment": {"method": "Cash", "discount_percentage": 0, "total_amount": price},
+            "notes": "",
+        }
+        tab.save_transaction_to_db()
+
+    bench.measure("checkout_save", save)
+
+
+def backup_restore(bench, host):
+    """Maintenance: write a full SQL backup, then restore it
+
+    Both run once per benchmark, without a warm-up, because each reads or
+    writes every row of every table.
+    """
+    tab = DatabaseBackupTab(host)
+    backup_dir = tempfile.mkdtemp(prefix="salon_bench_")
+    tab.location_input.setText(backup_dir)
+
+    backup = bench.measure("backup", lambda run: tab.create_backup(), repeat=1, warmup=False)
+
+    backups = sorted(Path(backup_dir).glob("*.sql"))
+    if backup["errors"] or not backups:
+        return
+    bench.dialogs.open_file = str(backups[-1])
+    bench.measure("restore", lambda run: tab.restore_backup(), repeat=1, warmup=False)
+
+
+# Scenario name -> function(bench, host), in run order. Restore rewrites the
+# database, so it goes last.
+SCENARIOS = {
+    "customers": customers_load,
+    "products": products_load,
+    "reports": reports,
+    "dashboard": dashboard_refresh,
+    "checkout": checkout_save,
+    "backup": backup_restore,
+}
@@ -4,13 +4,16 @@ from PyQt5 import QtWidgets
 from PyQt5.QtWidgets import QStyleFactory
 from app.ui.pages.login.login_page import LoginPage
 from app.utils.db_manager import DBManager
+from app.utils.migrations import MigrationRunner
 
 def setup_database():
-    """Set up the database and check connection"""
+    """Set up the database, check connection and apply pending schema migrations"""
     try:
         conn = DBManager.get_connection()
         print("Connected to MySQL database successfully")
         conn.close()
+        
+        MigrationRunner.run()
         return True
         
     except mysql.connector.Error as err: